@@ -98,11 +98,26 @@ class WebScraper:
         if not urls:
             return []
 
-        # Create scraper using first URL
-        scraper = self.factory.create_scraper(urls[0], scraper_type)
+        if scraper_type == "auto" and len(urls) > 1:
+            # Detect every URL concurrently and scrape each group with its own
+            # scraper; input positions are kept so results follow the input order
+            groups: Dict[str, List[int]] = {}
+            for i, detected_type in enumerate(self.factory.detect_scraper_types(urls)):
+                groups.setdefault(detected_type, []).append(i)
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+            for detected_type, indices in groups.items():
+                group_urls = [urls[i] for i in indices]
+                scraper = self.factory.create_scraper(group_urls[0], detected_type)
+                for i, result in zip(indices, scraper.scrape_multiple(group_urls, **kwargs)):
+                    results[i] = result
 
-        # Scrape all URLs
-        results = scraper.scrape_multiple(urls, **kwargs)
+        else:
+            # Create scraper using first URL
+            scraper = self.factory.create_scraper(urls[0], scraper_type)
+
+            # Scrape all URLs
+            results = scraper.scrape_multiple(urls, **kwargs)
 
         # Export if output file specified
         if output_file:
@@ -9,6 +9,11 @@ __version__ = "1.0.0"
 __author__ = "Web Scraper Team"
 __license__ = "MIT"
 
+import logging
+
+# Library logging stays silent unless the application configures handlers
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from web_scraper.scrapers.base_scraper import BaseScraper
 from web_scraper.scrapers.static_scraper import StaticScraper
 
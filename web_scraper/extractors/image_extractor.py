@@ -10,6 +10,8 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import base64
 
+from web_scraper.utils.html_parsing import HTML_BUILDER
+
 
 class ImageExtractor:
     """
@@ -38,7 +40,7 @@ class ImageExtractor:
         Returns:
             List of dictionaries containing image data
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
         base_url = base_url or self.base_url
 
         images = []
@@ -226,7 +228,7 @@ class ImageExtractor:
         Returns:
             List of dictionaries with image data
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
         base_url = base_url or self.base_url
 
         images = []
@@ -249,7 +251,7 @@ class ImageExtractor:
         Returns:
             OG image URL or None
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         og_image = soup.find("meta", property="og:image")
         if og_image and og_image.get("content"):
@@ -273,7 +275,7 @@ class ImageExtractor:
         Returns:
             Favicon URL or None
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         # Try various favicon selectors
         selectors = [
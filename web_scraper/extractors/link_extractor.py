@@ -9,6 +9,8 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, parse_qs
 import re
 
+from web_scraper.utils.html_parsing import HTML_BUILDER
+
 
 class LinkExtractor:
     """
@@ -37,7 +39,7 @@ class LinkExtractor:
         Returns:
             List of dictionaries containing link data
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
         base_url = base_url or self.base_url
 
         links = []
@@ -242,7 +244,7 @@ class LinkExtractor:
         Returns:
             List of links
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
         base_url = base_url or self.base_url
 
         links = []
@@ -265,7 +267,7 @@ class LinkExtractor:
         Returns:
             List of navigation links
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         # Common navigation selectors
         nav_selectors = [
@@ -303,7 +305,7 @@ class LinkExtractor:
         Returns:
             List of pagination links
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         # Common pagination selectors
         pagination_selectors = [
@@ -337,7 +339,7 @@ class LinkExtractor:
         Returns:
             Next page URL or None
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         # Common next page selectors
         next_selectors = [
@@ -4,10 +4,28 @@ Table extraction utilities.
 Provides methods to extract and parse HTML tables.
 """
 
-from typing import List, Dict, Optional, Any, Union
+from typing import List, Dict, Optional, Any, Union, Iterator, Tuple
 from bs4 import BeautifulSoup, Tag
+from bs4.dammit import EncodingDetector
+from io import BytesIO
+from lxml import etree
 import pandas as pd
 
+from web_scraper.utils.html_parsing import HTML_BUILDER, parse_document
+from web_scraper.utils.selector_cache import compile_selector
+
+# Descendant text nodes of an element, gathered in C. Comments are not text
+# nodes, and text under script, style, template, rt and rp is skipped, the
+# same strings BeautifulSoup's get_text() leaves out
+_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]",
+    smart_strings=False
+)
+
+# Upper bound on colspan expansion (the HTML spec clamps colspan to 1000)
+MAX_COLSPAN = 1000
+
 
 class TableExtractor:
     """
@@ -26,26 +44,77 @@ class TableExtractor:
         """
         self.clean_whitespace = clean_whitespace
 
-    def extract_tables(self, html: str) -> List[List[List[str]]]:
+    def extract_tables(self, html: Union[str, bytes]) -> List[List[List[str]]]:
         """
         Extract all tables from HTML.
 
         Args:
-            html: HTML content
+            html: HTML content (str or raw bytes)
 
         Returns:
             List of tables, where each table is a list of rows,
             and each row is a list of cell values
         """
-        soup = BeautifulSoup(html, "lxml")
-        tables = []
+        return list(self.iter_tables(html))
+
+    def iter_tables(self, html: Union[str, bytes]) -> Iterator[List[List[str]]]:
+        """
+        Stream tables from HTML without building the whole document tree.
+
+        Each top-level table is parsed incrementally and discarded once its
+        data (and that of any nested tables) has been extracted, so memory
+        stays proportional to the largest table rather than the document.
+
+        Args:
+            html: HTML content (str or raw bytes)
+
+        Yields:
+            Table data in document order, empty tables skipped
+        """
+        if isinstance(html, str):
+            html_bytes = html.encode("utf-8")
+            encoding = "utf-8"
+        else:
+            html_bytes = html
+            # Let lxml honour a declared charset, otherwise assume UTF-8
+            declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+            encoding = None if declared else "utf-8"
+
+        if not html_bytes.strip():
+            return
+
+        # Slots are reserved on "start" so nested tables keep document order;
+        # "end" events arrive innermost first, so open slots form a stack
+        pending = []
+        open_slots = []
+
+        events = etree.iterparse(
+            BytesIO(html_bytes),
+            events=("start", "end"),
+            tag="table",
+            html=True,
+            huge_tree=True,
+            encoding=encoding,
+        )
+
+        for event, elem in events:
+            if event == "start":
+                open_slots.append(len(pending))
+                pending.append(None)
+                continue
+
+            pending[open_slots.pop()] = self._extract_lxml_table_data(elem)
 
-        for table_tag in soup.find_all("table"):
-            table_data = self._extract_table_data(table_tag)
-            if table_data:
-                tables.append(table_data)
+            if not open_slots:
+                for table_data in pending:
+                    if table_data:
+                        yield table_data
+                pending = []
 
-        return tables
+                # Free the finished table and everything parsed before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
 
     def extract_table_by_index(self, html: str, index: int = 0) -> Optional[List[List[str]]]:
         """
@@ -76,8 +145,8 @@ class TableExtractor:
         Returns:
             Table data or None if not found
         """
-        soup = BeautifulSoup(html, "lxml")
-        table_tag = soup.select_one(selector)
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
+        table_tag = compile_selector(selector).select_one(soup)
 
         if table_tag and table_tag.name == "table":
             return self._extract_table_data(table_tag)
@@ -150,14 +219,86 @@ class TableExtractor:
             if self.clean_whitespace:
                 cell_value = " ".join(cell_value.split())
 
-            # Handle colspan
+            # Handle colspan (malformed values count as a single cell)
             colspan = cell.get("colspan")
-            if colspan:
-                try:
-                    colspan = int(colspan)
-                    cells.extend([cell_value] * colspan)
-                except (ValueError, TypeError):
-                    cells.append(cell_value)
+            if colspan and colspan.isdecimal():
+                span = min(max(int(colspan), 1), MAX_COLSPAN)
+                cells.extend([cell_value] * span)
+            else:
+                cells.append(cell_value)
+
+        return cells
+
+    def _extract_lxml_table_data(self, table_elem: etree._Element) -> List[List[str]]:
+        """
+        Extract data from an lxml table element.
+
+        Mirrors _extract_table_data for elements produced by lxml.
+
+        Args:
+            table_elem: lxml table element
+
+        Returns:
+            List of rows, where each row is a list of cell values
+        """
+        rows = []
+
+        # Extract header rows from thead
+        thead = next(table_elem.iter("thead"), None)
+        if thead is not None:
+            for tr in thead.iter("tr"):
+                row_data = self._extract_lxml_row_data(tr)
+                if row_data:
+                    rows.append(row_data)
+
+        # Extract body rows from tbody
+        tbody = next(table_elem.iter("tbody"), None)
+        if tbody is not None:
+            trs = tbody.iter("tr")
+        else:
+            # If no tbody, extract all tr tags not already processed in thead
+            trs = table_elem.iter("tr")
+            if thead is not None:
+                trs = (tr for tr in trs if next(tr.iterancestors("thead"), None) is None)
+
+        for tr in trs:
+            row_data = self._extract_lxml_row_data(tr)
+            if row_data:
+                rows.append(row_data)
+
+        # Extract footer rows from tfoot
+        tfoot = next(table_elem.iter("tfoot"), None)
+        if tfoot is not None:
+            for tr in tfoot.iter("tr"):
+                row_data = self._extract_lxml_row_data(tr)
+                if row_data:
+                    rows.append(row_data)
+
+        return rows
+
+    def _extract_lxml_row_data(self, tr_elem: etree._Element) -> List[str]:
+        """
+        Extract data from an lxml table row.
+
+        Args:
+            tr_elem: lxml tr element
+
+        Returns:
+            List of cell values
+        """
+        cells = []
+
+        for cell in tr_elem.iter("td", "th"):
+            cell_value = "".join(_TEXT_XPATH(cell))
+
+            if self.clean_whitespace:
+                cell_value = " ".join(cell_value.split())
+
+            # Handle colspan (malformed values count as a single cell)
+            colspan = cell.get("colspan")
+            if colspan and colspan.isdecimal():
+                span = min(max(int(colspan), 1), MAX_COLSPAN)
+                cells.extend([cell_value] * span)
             else:
                 cells.append(cell_value)
 
@@ -204,6 +345,60 @@ class TableExtractor:
 
         return result
 
+    def extract_tables_as_columns(self, html: str, has_header: bool = True) -> List[Dict[str, List[str]]]:
+        """
+        Extract tables in columnar form (one list per column).
+
+        Avoids allocating a dictionary per row, and the result can be passed
+        straight to pandas.DataFrame.
+
+        Args:
+            html: HTML content
+            has_header: Whether first row is header
+
+        Returns:
+            List of tables, where each table maps column names to cell lists.
+            Short rows are padded with empty strings.
+        """
+        tables = self.extract_tables(html)
+        result = []
+
+        for table in tables:
+            if not table:
+                continue
+
+            if has_header and len(table) > 1:
+                headers = table[0]
+                rows = table[1:]
+            else:
+                # No header, use column indices
+                headers = []
+                rows = table
+
+            num_columns = max(len(headers), max(len(row) for row in rows))
+
+            columns = {}
+            for i in range(num_columns):
+                header = headers[i] if i < len(headers) else f"Column_{i}"
+                columns[header] = [row[i] if i < len(row) else "" for row in rows]
+
+            result.append(columns)
+
+        return result
+
+    @staticmethod
+    def iter_column_rows(columns: Dict[str, List[str]]) -> Iterator[Tuple[str, ...]]:
+        """
+        Iterate over the rows of a columnar table.
+
+        Args:
+            columns: Table as returned by extract_tables_as_columns
+
+        Returns:
+            Iterator of row tuples in column order
+        """
+        return zip(*columns.values())
+
     def extract_table_to_dataframe(self, html: str, index: int = 0, has_header: bool = True) -> Optional[pd.DataFrame]:
         """
         Extract table as pandas DataFrame.
@@ -266,10 +461,10 @@ class TableExtractor:
         Returns:
             List of dictionaries containing table data and attributes
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         if selector:
-            table_tags = soup.select(selector)
+            table_tags = compile_selector(selector).select(soup)
         else:
             table_tags = soup.find_all("table")
 
@@ -308,7 +503,7 @@ class TableExtractor:
         Returns:
             Dictionary representing table hierarchy
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
         tables = soup.find_all("table")
 
         # Build hierarchy
@@ -363,22 +558,25 @@ class TableExtractor:
         Returns:
             Table data or None
         """
-        soup = BeautifulSoup(html, "lxml")
+        tree = parse_document(html)
+        if tree is None:
+            return None
+
+        needle = header_text.casefold()
 
-        for table_tag in soup.find_all("table"):
+        for table_elem in tree.iter("table"):
             # Check thead
-            thead = table_tag.find("thead")
-            if thead:
-                if header_text.lower() in thead.get_text().lower():
-                    return self._extract_table_data(table_tag)
+            thead = next(table_elem.iter("thead"), None)
+            if thead is not None:
+                if needle in "".join(_TEXT_XPATH(thead)).casefold():
+                    return self._extract_lxml_table_data(table_elem)
 
             # Check first row th tags
-            first_row = table_tag.find("tr")
-            if first_row:
-                headers = first_row.find_all("th")
-                for header in headers:
-                    if header_text.lower() in header.get_text().lower():
-                        return self._extract_table_data(table_tag)
+            first_row = next(table_elem.iter("tr"), None)
+            if first_row is not None:
+                for header in first_row.iter("th"):
+                    if needle in "".join(_TEXT_XPATH(header)).casefold():
+                        return self._extract_lxml_table_data(table_elem)
 
         return None
 
@@ -406,9 +604,10 @@ class TableExtractor:
         column_counts = [len(row) for row in table_data]
         is_rectangular = len(set(column_counts)) == 1
 
-        # Calculate empty cells
+        # Calculate empty cells (empty strings plus whitespace-only cells),
+        # counted per row with C-level list.count and str.isspace
         total_cells = sum(column_counts)
-        empty_cells = sum(1 for row in table_data for cell in row if not cell.strip())
+        empty_cells = sum(row.count("") + sum(map(str.isspace, row)) for row in table_data)
 
         return {
             "num_rows": num_rows,
@@ -8,6 +8,27 @@ import re
 from typing import List, Optional, Dict, Any
 from bs4 import BeautifulSoup, Tag, NavigableString
 import unicodedata
+from lxml import etree
+
+from web_scraper.utils.html_parsing import HTML_BUILDER, parse_document
+from web_scraper.utils.selector_cache import compile_pattern, compile_selector
+
+
+# Precompiled patterns for the text-search helpers
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_URL_RE = re.compile(
+    r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'
+)
+# Patterns for various phone formats
+_PHONE_RES = (
+    re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}'),
+    re.compile(r'\(\d{3}\)\s*\d{3}-\d{4}'),
+    re.compile(r'\d{3}-\d{3}-\d{4}'),
+)
+
+# Metadata lookups; the predicate skips meta tags without a key or content in C
+_TITLE_XPATH = etree.XPath("//title")
+_META_XPATH = etree.XPath("//meta[(@name or @property) and @content]")
 
 
 class TextExtractor:
@@ -42,10 +63,10 @@ class TextExtractor:
         Returns:
             Extracted text
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         if selector:
-            element = soup.select_one(selector)
+            element = compile_selector(selector).select_one(soup)
             if not element:
                 return ""
             text = element.get_text()
@@ -65,8 +86,8 @@ class TextExtractor:
         Returns:
             List of extracted text strings
         """
-        soup = BeautifulSoup(html, "lxml")
-        elements = soup.select(selector)
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
+        elements = compile_selector(selector).select(soup)
 
         return [self._clean_text(el.get_text()) for el in elements]
 
@@ -93,7 +114,7 @@ class TextExtractor:
         Returns:
             List of dictionaries with 'level' and 'text' keys
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         if level:
             headings = soup.find_all(f"h{level}")
@@ -117,7 +138,7 @@ class TextExtractor:
         Returns:
             List of list item texts
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
         if list_type:
             lists = soup.find_all(list_type)
@@ -141,16 +162,19 @@ class TextExtractor:
         Returns:
             Dictionary of metadata
         """
-        soup = BeautifulSoup(html, "lxml")
         metadata = {}
 
+        tree = parse_document(html)
+        if tree is None:
+            return metadata
+
         # Extract title
-        if soup.title:
-            metadata["title"] = self._clean_text(soup.title.get_text())
+        titles = _TITLE_XPATH(tree)
+        if titles:
+            metadata["title"] = self._clean_text(titles[0].text_content())
 
-        # Extract meta tags
-        meta_tags = soup.find_all("meta")
-        for meta in meta_tags:
+        # Extract meta tags (empty names or contents are still skipped)
+        for meta in _META_XPATH(tree):
             name = meta.get("name") or meta.get("property")
             content = meta.get("content")
 
@@ -171,10 +195,10 @@ class TextExtractor:
         Returns:
             Text between elements
         """
-        soup = BeautifulSoup(html, "lxml")
+        soup = BeautifulSoup(html, builder=HTML_BUILDER)
 
-        start_elem = soup.select_one(start_selector)
-        end_elem = soup.select_one(end_selector)
+        start_elem = compile_selector(start_selector).select_one(soup)
+        end_elem = compile_selector(end_selector).select_one(soup)
 
         if not start_elem or not end_elem:
             return ""
@@ -204,7 +228,7 @@ class TextExtractor:
         Returns:
             List of matches
         """
-        matches = re.finditer(pattern, text)
+        matches = compile_pattern(pattern).finditer(text)
 
         if group == 0:
             return [match.group(0) for match in matches]
@@ -219,10 +243,9 @@ class TextExtractor:
             text: Text to search
 
         Returns:
-            List of email addresses
+            List of unique email addresses in order of first appearance
         """
-        pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        return list(set(re.findall(pattern, text)))
+        return list(dict.fromkeys(_EMAIL_RE.findall(text)))
 
     def extract_phone_numbers(self, text: str) -> List[str]:
         """
@@ -232,20 +255,13 @@ class TextExtractor:
             text: Text to search
 
         Returns:
-            List of phone numbers
+            List of unique phone numbers in order of first appearance
         """
-        # Pattern for various phone formats
-        patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-            r'\(\d{3}\)\s*\d{3}-\d{4}',
-            r'\d{3}-\d{3}-\d{4}'
-        ]
-
         numbers = []
-        for pattern in patterns:
-            numbers.extend(re.findall(pattern, text))
+        for pattern in _PHONE_RES:
+            numbers.extend(pattern.findall(text))
 
-        return list(set(numbers))
+        return list(dict.fromkeys(numbers))
 
     def extract_urls(self, text: str) -> List[str]:
         """
@@ -255,10 +271,35 @@ class TextExtractor:
             text: Text to search
 
         Returns:
-            List of URLs
+            List of unique URLs in order of first appearance
+        """
+        return list(dict.fromkeys(_URL_RE.findall(text)))
+
+    def extract_emails_bulk(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract email addresses from many texts at once.
+
+        Args:
+            texts: Texts to search
+
+        Returns:
+            List of unique email lists, one per input text
+        """
+        findall = _EMAIL_RE.findall
+        return [list(dict.fromkeys(findall(text))) for text in texts]
+
+    def extract_urls_bulk(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract URLs from many texts at once.
+
+        Args:
+            texts: Texts to search
+
+        Returns:
+            List of unique URL lists, one per input text
         """
-        pattern = r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'
-        return list(set(re.findall(pattern, text)))
+        findall = _URL_RE.findall
+        return [list(dict.fromkeys(findall(text))) for text in texts]
 
     def _clean_text(self, text: str) -> str:
         """
@@ -335,4 +376,5 @@ class TextExtractor:
         if include_spaces:
             return len(text)
         else:
-            return len(text.replace(" ", ""))
+            # Count spaces instead of building a space-free copy
+            return len(text) - text.count(" ")
@@ -4,15 +4,68 @@ API scraper for REST endpoints.
 Handles JSON/XML APIs with authentication and pagination support.
 """
 
-import requests
-from typing import Any, Dict, List, Optional, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+from functools import lru_cache
+import httpx
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+from concurrent.futures import Future, ThreadPoolExecutor
 from tqdm import tqdm
 import json
+import queue
+import threading
+import time
 import xmltodict
+from lxml import etree
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 from web_scraper.scrapers.base_scraper import BaseScraper
 
+# Response formats parsed incrementally from a streamed body
+STREAMING_FORMATS = frozenset({"json_stream", "xml_lxml"})
+
+_JSON_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+# Keys checked, in order, for the item list of a paginated dict payload
+PAGE_ITEM_KEYS = ("items", "results", "data")
+
+# Cached responses kept before expired entries are pruned
+MAX_CACHE_ENTRIES = 1024
+
+# Sentinel for absent keys in nested lookups
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _compile_path(path: str, separator: str) -> Tuple[str, ...]:
+    """
+    Split a nested-value path once and reuse it across lookups.
+
+    Args:
+        path: Path to value (e.g., "pagination.next_cursor")
+        separator: Path separator
+
+    Returns:
+        Tuple of keys
+    """
+    return tuple(path.split(separator))
+
 
 class APIScraper(BaseScraper):
     """
@@ -31,18 +84,81 @@ class APIScraper(BaseScraper):
         """
         super().__init__(config)
 
-        # Session for connection pooling
-        self.session = requests.Session()
-
-        # Timeout configuration
+        # Timeout and concurrency configuration
         scraping_config = self.config.get("scraping", {})
         self.timeout = scraping_config.get("timeout", 30)
+        self.max_workers = scraping_config.get("max_workers", 5)
+
+        # HTTP/2 client for connection pooling; concurrent requests to the
+        # same host are multiplexed over a single connection
+        self.session = self._create_client()
+
+        # httpx binds proxies per client, so one client is kept per proxy
+        self._proxy_clients: Dict[str, httpx.Client] = {}
+
+        # Response cache for repeated GET requests: key -> (timestamp, result)
+        advanced_config = self.config.get("advanced", {})
+        self.cache_enabled = advanced_config.get("enable_cache", False)
+        self.cache_expiry = advanced_config.get("cache_expiry", 3600)
+        self._response_cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
 
         # Setup authentication
         self._setup_authentication()
 
         self.logger.info("APIScraper initialized")
 
+    def _create_client(
+        self,
+        proxy: Optional[str] = None,
+        client_class: Type[Union[httpx.Client, httpx.AsyncClient]] = httpx.Client
+    ) -> Union[httpx.Client, httpx.AsyncClient]:
+        """
+        Create an HTTP client.
+
+        Args:
+            proxy: Proxy URL to route requests through (optional)
+            client_class: httpx.Client or httpx.AsyncClient
+
+        Returns:
+            httpx client with HTTP/2 enabled when available
+        """
+        return client_class(
+            http2=HTTP2_AVAILABLE,
+            proxy=proxy,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.max_workers,
+                max_connections=self.max_workers * 2
+            )
+        )
+
+    def _get_client(self, proxy_url: Optional[str]) -> httpx.Client:
+        """
+        Get the client for a proxy, sharing auth and headers with the main client.
+
+        Args:
+            proxy_url: Proxy URL or None for a direct connection
+
+        Returns:
+            httpx client
+        """
+        if not proxy_url:
+            return self.session
+
+        client = self._proxy_clients.get(proxy_url)
+        if client is None:
+            client = self._create_client(proxy=proxy_url)
+            client.auth = self.session.auth
+            client.headers.update(self.session.headers)
+            shared = self._proxy_clients.setdefault(proxy_url, client)
+            if shared is not client:
+                # Another thread created the client first
+                client.close()
+            client = shared
+
+        return client
+
     def _setup_authentication(self) -> None:
         """Setup authentication for API requests."""
         auth_config = self.config.get("request", {}).get("auth", {})
@@ -70,7 +186,7 @@ class APIScraper(BaseScraper):
             header_name = auth_config.get("header_name", "X-API-Key")
             if api_key:
                 self.session.headers[header_name] = api_key
-                self.logger.info(f"API key authentication configured ({header_name})")
+                self.logger.info("API key authentication configured (%s)", header_name)
 
     def scrape(self, url: str, **kwargs) -> Dict[str, Any]:
         """
@@ -83,112 +199,589 @@ class APIScraper(BaseScraper):
                 - params: Query parameters
                 - data: Request body data
                 - json_data: JSON request body
-                - response_format: Expected response format (json, xml, text)
+                - response_format: Expected response format (json, xml, text,
+                  json_stream, xml_lxml)
+                - stream_prefix: ijson prefix of the items to stream for
+                  json_stream (default: 'items.item')
+                - xml_tag: Tag of the records to stream for xml_lxml; each
+                  record becomes a {child tag: child text} dictionary
+                - item_callback: Called with each streamed item; without it
+                  the items are collected under data['items']
+                - xml_item_depth: Stream xml responses, emitting the elements
+                  at this depth as they are parsed
+                - xml_item_callback: Called with (path, item) for each
+                  streamed element; returning False stops parsing. Without
+                  it the items are collected under data['items']
+                - return_headers: Copy the response headers into the result
+                  (default: True); when False 'headers' is None
 
         Returns:
             Dictionary containing API response data
         """
+        cached = self._get_cached(self._cache_key(url, kwargs))
+        if cached is not None:
+            return cached
+
         # Apply rate limiting
         self.rate_limiter.acquire()
 
-        # Get request parameters
-        method = kwargs.get("method", "GET").upper()
-        params = kwargs.get("params", {})
+        return self._scrape_unthrottled(url, **kwargs)
+
+    def _scrape_unthrottled(self, url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Scrape a single API endpoint without waiting on the rate limiter.
+
+        Callers are responsible for acquiring the rate limiter first.
+
+        Args:
+            url: API endpoint URL
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Dictionary containing API response data
+        """
+        request_kwargs = self._build_request(**kwargs)
+        response_format = kwargs.get("response_format", "json")
+
+        proxy = self._get_proxy()
+        proxy_url = proxy["http"] if proxy else None
+
+        self.stats["total_requests"] += 1
+
+        try:
+            client = self._get_client(proxy_url)
+
+            # Streamed formats are parsed as the body arrives
+            if response_format in STREAMING_FORMATS or (response_format == "xml" and kwargs.get("xml_item_depth")):
+                with client.stream(url=url, **request_kwargs) as response:
+                    return self._process_response(url, response, proxy_url, **kwargs)
+
+            # Make request
+            response = client.request(url=url, **request_kwargs)
+            result = self._process_response(url, response, proxy_url, **kwargs)
+            self._store_cached(self._cache_key(url, kwargs), result)
+            return result
+
+        except Exception as e:
+            return self._process_error(url, e, proxy_url)
+
+    async def _scrape_async(
+        self,
+        url: str,
+        get_client: Callable[[Optional[str]], httpx.AsyncClient],
+        semaphore: asyncio.Semaphore,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Scrape a single API endpoint on the event loop.
+
+        Args:
+            url: API endpoint URL
+            get_client: Returns the async client for a proxy URL
+            semaphore: Bounds the number of in-flight requests
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Dictionary containing API response data
+        """
+        cache_key = self._cache_key(url, kwargs)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            # The rate limiter blocks, so wait for it off the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self.rate_limiter.acquire)
+
+            request_kwargs = self._build_request(**kwargs)
+
+            proxy = self._get_proxy()
+            proxy_url = proxy["http"] if proxy else None
+
+            self.stats["total_requests"] += 1
+
+            try:
+                response = await get_client(proxy_url).request(url=url, **request_kwargs)
+                result = self._process_response(url, response, proxy_url, **kwargs)
+                self._store_cached(cache_key, result)
+                return result
+
+            except Exception as e:
+                return self._process_error(url, e, proxy_url)
+
+    async def _scrape_many_async(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Scrape multiple API endpoints concurrently with one async client.
+
+        Args:
+            urls: List of API endpoint URLs
+            **kwargs: Additional arguments passed to _scrape_async()
+
+        Returns:
+            List of dictionaries containing API responses, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        clients: Dict[Optional[str], httpx.AsyncClient] = {}
+
+        def get_client(proxy_url: Optional[str]) -> httpx.AsyncClient:
+            client = clients.get(proxy_url)
+            if client is None:
+                client = self._create_client(proxy=proxy_url, client_class=httpx.AsyncClient)
+                client.auth = self.session.auth
+                client.headers.update(self.session.headers)
+                clients[proxy_url] = client
+            return client
+
+        try:
+            tasks = [self._scrape_async(url, get_client, semaphore, **kwargs) for url in urls]
+
+            show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+            if show_progress:
+                with tqdm(total=len(urls), desc="Scraping APIs") as progress:
+                    async def tracked(task):
+                        result = await task
+                        progress.update(1)
+                        return result
+
+                    return await asyncio.gather(*(tracked(task) for task in tasks))
+
+            return await asyncio.gather(*tasks)
+
+        finally:
+            for client in clients.values():
+                await client.aclose()
+
+    def _cache_key(self, url: str, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+        """
+        Build the response cache key for a request.
+
+        Only plain GET requests are cached; streamed formats are not, since
+        their item callbacks must run for every request.
+
+        Args:
+            url: API endpoint URL
+            kwargs: Same arguments as scrape()
+
+        Returns:
+            Hashable cache key, or None if the request is not cacheable
+        """
+        if not self.cache_enabled:
+            return None
+
+        response_format = kwargs.get("response_format", "json")
+        if kwargs.get("method", "GET").upper() != "GET" or response_format in STREAMING_FORMATS or kwargs.get("xml_item_depth"):
+            return None
+
+        params = kwargs.get("params") or {}
+        try:
+            key = (url, frozenset(params.items()), response_format, kwargs.get("return_headers", True))
+            hash(key)
+        except (AttributeError, TypeError):
+            # Non-dict or unhashable parameters
+            return None
+
+        return key
+
+    def _get_cached(self, key: Optional[Tuple]) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached response that has not expired.
+
+        Args:
+            key: Cache key from _cache_key()
+
+        Returns:
+            Copy of the cached result, or None
+        """
+        if key is None:
+            return None
+
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+
+        timestamp, result = entry
+        if time.time() - timestamp >= self.cache_expiry:
+            self._response_cache.pop(key, None)
+            return None
+
+        self.logger.debug("Cache hit: %s", result['url'])
+        return dict(result)
+
+    def _store_cached(self, key: Optional[Tuple], result: Dict[str, Any]) -> None:
+        """
+        Cache a successful response.
+
+        Args:
+            key: Cache key from _cache_key()
+            result: Result returned by scrape()
+        """
+        if key is None or not result.get("success", False):
+            return
+
+        now = time.time()
+
+        if len(self._response_cache) >= MAX_CACHE_ENTRIES:
+            # Drop expired entries, then the oldest ones if still full
+            for old_key, (timestamp, _) in list(self._response_cache.items()):
+                if now - timestamp >= self.cache_expiry:
+                    self._response_cache.pop(old_key, None)
+            while len(self._response_cache) >= MAX_CACHE_ENTRIES:
+                self._response_cache.pop(next(iter(self._response_cache)), None)
+
+        self._response_cache[key] = (now, result)
+
+    def _build_request(self, **kwargs) -> Dict[str, Any]:
+        """
+        Build httpx request arguments from scrape() keyword arguments.
+
+        Args:
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Keyword arguments for client.request()
+        """
         data = kwargs.get("data")
         json_data = kwargs.get("json_data")
-        response_format = kwargs.get("response_format", "json")
 
-        # Get headers and proxy
+        # Get headers
         headers = self._get_headers()
 
         # Add content type for JSON requests
         if json_data:
             headers["Content-Type"] = "application/json"
 
-        proxy = self._get_proxy()
+        # httpx takes raw bodies as content= and form fields as data=
+        content = None
+        if isinstance(data, (str, bytes)):
+            content, data = data, None
+
+        return {
+            "method": kwargs.get("method", "GET").upper(),
+            "params": kwargs.get("params", {}),
+            "data": data,
+            "content": content,
+            "json": json_data,
+            "headers": headers
+        }
+
+    def _process_response(
+        self,
+        url: str,
+        response: httpx.Response,
+        proxy_url: Optional[str],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Parse a received response and record the outcome.
 
-        self.stats["total_requests"] += 1
+        Args:
+            url: Requested URL
+            response: Received (or streaming) response
+            proxy_url: Proxy URL that was used (optional)
+            **kwargs: Same arguments as scrape()
 
-        try:
-            # Make request
-            response = self.session.request(
-                method=method,
-                url=url,
-                params=params,
-                data=data,
-                json=json_data,
-                headers=headers,
-                proxies=proxy,
-                timeout=self.timeout,
-                allow_redirects=True
+        Returns:
+            Dictionary containing API response data
+
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status
+        """
+        response.raise_for_status()
+        response_format = kwargs.get("response_format", "json")
+
+        # Parse response based on format
+        if response_format == "json":
+            parsed_data = self._parse_json(response)
+        elif response_format == "json_stream":
+            parsed_data = self._parse_json_stream(
+                response.iter_bytes(),
+                kwargs.get("stream_prefix", "items.item"),
+                kwargs.get("item_callback")
+            )
+        elif response_format == "xml_lxml":
+            parsed_data = self._parse_xml_records(
+                response.iter_bytes(),
+                kwargs.get("xml_tag"),
+                kwargs.get("item_callback")
             )
+        elif response_format == "xml" and kwargs.get("xml_item_depth"):
+            parsed_data = self._parse_xml_stream(
+                response.iter_bytes(),
+                kwargs["xml_item_depth"],
+                kwargs.get("xml_item_callback")
+            )
+        elif response_format == "xml":
+            parsed_data = xmltodict.parse(response.content)
+        else:
+            parsed_data = response.text
 
-            response.raise_for_status()
+        # Report success
+        self._handle_request_success(url, proxy_url)
 
-            # Parse response based on format
-            if response_format == "json":
-                parsed_data = response.json()
-            elif response_format == "xml":
-                parsed_data = xmltodict.parse(response.content)
-            else:
-                parsed_data = response.text
+        result = {
+            "url": url,
+            "status_code": response.status_code,
+            # Copying the headers hashes every entry, so callers may skip it
+            "headers": dict(response.headers) if kwargs.get("return_headers", True) else None,
+            "data": parsed_data,
+            "success": True
+        }
 
-            # Report success
-            proxy_url = proxy.get("http") if proxy else None
-            self._handle_request_success(url, proxy_url)
+        self.stats["total_items_scraped"] += 1
 
-            result = {
-                "url": url,
-                "status_code": response.status_code,
-                "headers": dict(response.headers),
-                "data": parsed_data,
-                "success": True
-            }
+        return result
 
-            self.stats["total_items_scraped"] += 1
+    def _parse_json(self, response: httpx.Response) -> Any:
+        """
+        Parse a JSON response body, using orjson when it is installed.
 
-            return result
+        Args:
+            response: Received response
 
-        except requests.exceptions.HTTPError as e:
-            # Handle HTTP errors
-            status_code = e.response.status_code if e.response else None
+        Returns:
+            Parsed JSON data
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # orjson only reads UTF-8; other encodings are left to the
+                # standard parser, which also reports genuine errors
+                pass
 
-            proxy_url = proxy.get("http") if proxy else None
-            self._handle_request_failure(url, e, proxy_url)
+        return response.json()
 
-            return {
-                "url": url,
-                "status_code": status_code,
-                "error": str(e),
-                "success": False
-            }
+    def _parse_json_stream(
+        self,
+        chunks: Iterable[bytes],
+        item_prefix: str,
+        item_callback: Optional[Callable[[Any], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Incrementally parse a JSON body, streaming the items under a prefix.
 
-        except Exception as e:
-            proxy_url = proxy.get("http") if proxy else None
-            self._handle_request_failure(url, e, proxy_url)
+        Only one item is held in memory at a time when a callback is given.
+        Scalar values outside the item array (such as a pagination cursor
+        after the items) are kept in the returned dictionary.
+
+        Args:
+            chunks: Body chunks as they arrive
+            item_prefix: ijson prefix of the items (e.g. 'items.item')
+            item_callback: Called with each item (optional)
+
+        Returns:
+            Dictionary of the scalar remainder, plus 'items' when no
+            callback is given
+
+        Raises:
+            ImportError: If ijson is not installed
+        """
+        if not IJSON_AVAILABLE:
+            raise ImportError("ijson is required for json_stream responses. Install it with: pip install ijson")
+
+        remainder: Dict[str, Any] = {}
+        items: List[Any] = []
+        emit = item_callback or items.append
+
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events, use_float=True)
+
+        builder = None
+        depth = 0
+
+        def handle(prefix: str, event: str, value: Any) -> None:
+            nonlocal builder, depth
+
+            # Inside an item: feed the builder until the item closes
+            if builder is not None:
+                builder.event(event, value)
+                if event in ("start_map", "start_array"):
+                    depth += 1
+                elif event in ("end_map", "end_array"):
+                    depth -= 1
+                if depth == 0:
+                    emit(builder.value)
+                    builder = None
+                return
+
+            if prefix == item_prefix:
+                if event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    depth = 1
+                elif event not in ("end_map", "end_array"):
+                    emit(value)
+                return
+
+            # Keep scalars outside arrays, nested by their dotted prefix
+            if event in _JSON_SCALAR_EVENTS and "item" not in prefix.split("."):
+                target = remainder
+                keys = prefix.split(".")
+                for key in keys[:-1]:
+                    target = target.setdefault(key, {})
+                target[keys[-1]] = value
+
+        for chunk in chunks:
+            parser.send(chunk)
+            for event in events:
+                handle(*event)
+            del events[:]
+
+        parser.close()
+        for event in events:
+            handle(*event)
+
+        if item_callback is None:
+            remainder["items"] = items
+
+        return remainder
+
+    def _parse_xml_stream(
+        self,
+        chunks: Iterator[bytes],
+        item_depth: int,
+        item_callback: Optional[Callable[[List, Any], Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Incrementally parse an XML body, emitting elements at a given depth.
+
+        Args:
+            chunks: Body chunks as they arrive
+            item_depth: Depth of the elements to emit (1 is the root)
+            item_callback: Called with (path, item); returning False stops
+                parsing (optional)
+
+        Returns:
+            None when a callback is given, otherwise {'items': [...]}
+        """
+        items: List[Any] = []
+
+        if item_callback is None:
+            def handle(path, item):
+                items.append(item)
+                return True
+        else:
+            def handle(path, item):
+                # xmltodict stops unless the callback returns a truthy value
+                return item_callback(path, item) is not False
+
+        try:
+            xmltodict.parse(chunks, item_depth=item_depth, item_callback=handle)
+        except xmltodict.ParsingInterrupted:
+            pass
+
+        return None if item_callback else {"items": items}
+
+    def _parse_xml_records(
+        self,
+        chunks: Iterable[bytes],
+        tag: Optional[str],
+        item_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Incrementally parse flat XML records with libxml2.
+
+        Each record is flattened to its children's text and then cleared,
+        along with the records before it, so memory stays bounded. Use the
+        xml format instead when attributes or nesting must be preserved.
+
+        Args:
+            chunks: Body chunks as they arrive
+            tag: Record tag (Clark notation for namespaced tags)
+            item_callback: Called with each record dictionary (optional)
+
+        Returns:
+            None when a callback is given, otherwise {'items': [...]}
+
+        Raises:
+            ValueError: If no record tag is given
+        """
+        if not tag:
+            raise ValueError("xml_tag is required for xml_lxml responses")
+
+        items: List[Dict[str, Any]] = []
+        emit = item_callback or items.append
+
+        parser = etree.XMLPullParser(events=("end",), tag=tag, resolve_entities=False)
+
+        def drain() -> None:
+            for _, elem in parser.read_events():
+                emit({child.tag: child.text for child in elem})
+
+                # Free the record and everything parsed before it
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            drain()
+
+        parser.close()
+        drain()
+
+        return None if item_callback else {"items": items}
 
-            return {
-                "url": url,
-                "error": str(e),
-                "success": False
-            }
+    def _process_error(self, url: str, error: Exception, proxy_url: Optional[str]) -> Dict[str, Any]:
+        """
+        Record a failed request and build its result.
+
+        Args:
+            url: Requested URL
+            error: Exception that occurred
+            proxy_url: Proxy URL that was used (optional)
+
+        Returns:
+            Dictionary describing the failure
+        """
+        self._handle_request_failure(url, error, proxy_url)
+
+        result = {
+            "url": url,
+            "error": str(error),
+            "success": False
+        }
+
+        # Handle HTTP errors
+        if isinstance(error, httpx.HTTPStatusError):
+            result["status_code"] = error.response.status_code
 
-    def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        return result
+
+    def scrape_multiple(self, urls: List[str], preserve_order: bool = True, **kwargs) -> List[Dict[str, Any]]:
         """
         Scrape multiple API endpoints concurrently.
 
+        With scraping.enable_async set, requests run on an asyncio event loop
+        over a single async client instead of a thread pool. With
+        advanced.enable_cache set, duplicate URLs are fetched once and the
+        results are returned in input order.
+
         Args:
             urls: List of API endpoint URLs
+            preserve_order: Return results in input order; when False,
+                threaded results are returned as they complete
             **kwargs: Additional arguments passed to scrape()
 
         Returns:
             List of dictionaries containing API responses
         """
+        if self.cache_enabled:
+            unique_urls = list(dict.fromkeys(urls))
+            if len(unique_urls) < len(urls):
+                by_url = {result["url"]: result for result in self.scrape_multiple(unique_urls, False, **kwargs)}
+                return [by_url[url] for url in urls]
+
         results = []
 
         # Get concurrency settings
         scraping_config = self.config.get("scraping", {})
         max_workers = scraping_config.get("max_workers", 5)
+
+        # Async scraping
+        if scraping_config.get("enable_async", False) and max_workers > 1:
+            return asyncio.run(self._scrape_many_async(urls, **kwargs))
+
         show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
 
         # Sequential scraping
@@ -201,14 +794,49 @@ class APIScraper(BaseScraper):
         # Concurrent scraping
         else:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(self.scrape, url, **kwargs): url for url in urls}
+                # A single producer thread paces submissions with the rate
+                # limiter, so workers never sleep on it and only run requests
+                submitted: "queue.Queue[Future]" = queue.Queue()
+                finished: "queue.Queue[Future]" = queue.Queue()
+
+                def produce() -> None:
+                    produced = 0
+                    try:
+                        for url in urls:
+                            cached = self._get_cached(self._cache_key(url, kwargs))
+                            if cached is not None:
+                                future = Future()
+                                future.set_result(cached)
+                            else:
+                                self.rate_limiter.acquire()
+                                future = executor.submit(self._scrape_unthrottled, url, **kwargs)
+
+                            if not preserve_order:
+                                future.add_done_callback(finished.put)
+                            submitted.put(future)
+                            produced += 1
+                    except BaseException as e:
+                        # Hand the error to the consumer for every URL left,
+                        # so it raises instead of waiting forever
+                        failed = Future()
+                        failed.set_exception(e)
+                        for _ in range(len(urls) - produced):
+                            submitted.put(failed)
+                            finished.put(failed)
+
+                producer = threading.Thread(target=produce, name="api-rate-limiter", daemon=True)
+                producer.start()
+
+                if preserve_order:
+                    completed = (submitted.get().result() for _ in urls)
+                else:
+                    completed = (finished.get().result() for _ in urls)
 
                 if show_progress:
-                    for future in tqdm(as_completed(future_to_url), total=len(urls), desc="Scraping APIs"):
-                        results.append(future.result())
-                else:
-                    for future in as_completed(future_to_url):
-                        results.append(future.result())
+                    completed = tqdm(completed, total=len(urls), desc="Scraping APIs")
+
+                results.extend(completed)
+                producer.join()
 
         return results
 
@@ -224,7 +852,11 @@ class APIScraper(BaseScraper):
 
         Args:
             base_url: Base API endpoint URL
-            pagination_type: Type of pagination (page, offset, cursor)
+            pagination_type: Type of pagination (page, offset, cursor, keyset).
+                Keyset pagination sends the sort key of the last row received
+                (e.g. ?after=<last id>), so the server can seek instead of
+                scanning past an offset and per-page cost stays flat with
+                depth; the tradeoff is that pages can only be walked in order
             max_pages: Maximum number of pages to scrape
             **kwargs: Additional arguments:
                 - page_param: Parameter name for page number (default: 'page')
@@ -233,6 +865,17 @@ class APIScraper(BaseScraper):
                 - page_size: Items per page (default: 50)
                 - cursor_param: Parameter name for cursor (default: 'cursor')
                 - next_cursor_path: JSON path to next cursor in response
+                - keyset_field: Path to the sort key within each row (default: 'id')
+                - keyset_param: Parameter name for the last sort key (default: 'after')
+                - batch_endpoint: Bulk endpoint accepting several page requests
+                  in one POST (page/offset pagination only)
+                - batch_size: Pages per bulk request (default: 10)
+                - batch_wrapper: Builds the POST body from the list of page
+                  parameter dicts (default: {"requests": [...]})
+                - batch_results_path: JSON path to the list of page payloads
+                  in a bulk response (default: the response itself)
+                - prefetch: Number of page/offset pages kept in flight
+                  concurrently (default: 1, strictly sequential)
 
         Returns:
             List of dictionaries containing all paginated results
@@ -250,10 +893,10 @@ class APIScraper(BaseScraper):
         page_size = kwargs.get("page_size", 50)
         cursor_param = kwargs.get("cursor_param", "cursor")
         next_cursor_path = kwargs.get("next_cursor_path", "next_cursor")
+        keyset_field = kwargs.get("keyset_field", "id")
+        keyset_param = kwargs.get("keyset_param", "after")
 
-        self.logger.info(f"Starting API pagination ({pagination_type})")
-
-        while page <= max_pages:
+        def page_params(page: int, offset: int, cursor: Any) -> Dict[str, Any]:
             # Prepare parameters based on pagination type
             params = kwargs.get("params", {}).copy()
 
@@ -272,12 +915,40 @@ class APIScraper(BaseScraper):
                 if limit_param not in params:
                     params[limit_param] = page_size
 
+            elif pagination_type == "keyset":
+                if cursor is not None:
+                    params[keyset_param] = cursor
+                if limit_param not in params:
+                    params[limit_param] = page_size
+
+            return params
+
+        # The next cursor is only known after each response, so cursor
+        # pagination cannot be batched
+        batch_endpoint = kwargs.get("batch_endpoint")
+        if batch_endpoint and pagination_type in ("page", "offset"):
+            return self._scrape_pagination_batched(page_params, max_pages, **kwargs)
+
+        # Page/offset URLs are known in advance, so later pages can be prefetched
+        if kwargs.get("prefetch", 1) > 1 and pagination_type in ("page", "offset"):
+            return self._scrape_pagination_prefetched(base_url, page_params, max_pages, **kwargs)
+
+        self.logger.info("Starting API pagination (%s)", pagination_type)
+
+        # Sequential requests can share one parameter dict: it is built once
+        # and only the pagination key is updated per page. params is passed
+        # explicitly, so it is dropped from the forwarded arguments.
+        params = page_params(page, offset, cursor)
+        scrape_kwargs = {key: value for key, value in kwargs.items() if key != "params"}
+        items_key = None
+
+        while page <= max_pages:
             # Make request
-            result = self.scrape(base_url, params=params, **kwargs)
+            result = self.scrape(base_url, params=params, **scrape_kwargs)
 
             # Check for errors
             if not result.get("success", False):
-                self.logger.warning(f"Pagination stopped at page {page} due to error")
+                self.logger.warning("Pagination stopped at page %s due to error", page)
                 break
 
             results.append(result)
@@ -289,30 +960,246 @@ class APIScraper(BaseScraper):
                 # Get next cursor from response
                 cursor = self._get_nested_value(data, next_cursor_path)
                 if not cursor:
-                    self.logger.info(f"No more pages (cursor)")
+                    self.logger.info("No more pages (cursor)")
                     break
 
-            elif isinstance(data, list):
-                # If response is a list and it's empty or smaller than page_size
-                if len(data) == 0 or len(data) < page_size:
-                    self.logger.info(f"No more pages (empty or partial page)")
-                    break
+            else:
+                # The item key is found on the first dict page and reused
+                if items_key is None and isinstance(data, dict):
+                    items_key = self._find_items_key(data)
+                items = self._get_page_items(data, items_key)
 
-            elif isinstance(data, dict):
-                # Check common pagination indicators
-                items = data.get("items") or data.get("results") or data.get("data") or []
-                if len(items) == 0 or len(items) < page_size:
-                    self.logger.info(f"No more pages (empty or partial page)")
+                if items is not None and (not items or len(items) < page_size):
+                    self.logger.info("No more pages (empty or partial page)")
                     break
 
+                if pagination_type == "keyset":
+                    # Derive the next key from the last row received
+                    last_row = items[-1] if items else None
+                    cursor = self._get_nested_value(last_row, keyset_field) if isinstance(last_row, dict) else None
+                    if cursor is None:
+                        self.logger.info("No more pages (no keyset value in last row)")
+                        break
+
             # Increment page/offset
             page += 1
             offset += page_size
 
-        self.logger.info(f"API pagination complete. Scraped {len(results)} pages")
+            if pagination_type == "page":
+                params[page_param] = page
+            elif pagination_type == "offset":
+                params[offset_param] = offset
+            elif pagination_type == "cursor":
+                params[cursor_param] = cursor
+            elif pagination_type == "keyset":
+                params[keyset_param] = cursor
+
+        self.logger.info("API pagination complete. Scraped %s pages", len(results))
+
+        return results
+
+    def _scrape_pagination_batched(
+        self,
+        page_params: Callable[[int, int, Any], Dict[str, Any]],
+        max_pages: int,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape page/offset pagination through a bulk endpoint.
+
+        Several page requests are sent in one POST body and the returned
+        list of page payloads goes through the same termination check as
+        per-page mode.
+
+        Args:
+            page_params: Builds the query parameters for a page and offset
+            max_pages: Maximum number of pages to scrape
+            **kwargs: Pagination arguments (see scrape_with_pagination)
+
+        Returns:
+            List of dictionaries, one per page
+        """
+        results = []
+        page = 1
+        batch_endpoint = kwargs["batch_endpoint"]
+        page_size = kwargs.get("page_size", 50)
+        batch_size = max(1, kwargs.get("batch_size", 10))
+        batch_wrapper = kwargs.get("batch_wrapper") or (lambda requests: {"requests": requests})
+        batch_results_path = kwargs.get("batch_results_path")
+
+        # Every other argument (base params, response format, streaming
+        # options) is forwarded as in per-page mode; only the method and body
+        # belong to the bulk request. Base params also go into each page entry
+        scrape_kwargs = {
+            key: value for key, value in kwargs.items()
+            if key not in ("method", "data", "json_data")
+        }
+
+        self.logger.info("Starting batched API pagination (%s pages per request)", batch_size)
+
+        while page <= max_pages:
+            pages = range(page, min(page + batch_size, max_pages + 1))
+            batch = [page_params(p, (p - 1) * page_size, None) for p in pages]
+
+            result = self.scrape(batch_endpoint, method="POST", json_data=batch_wrapper(batch), **scrape_kwargs)
+
+            if not result.get("success", False):
+                self.logger.warning("Pagination stopped at page %s due to error", page)
+                break
+
+            data = result.get("data")
+            if batch_results_path:
+                data = self._get_nested_value(data, batch_results_path)
+
+            if not isinstance(data, list):
+                self.logger.warning("Bulk response is not a list, stopping at page %s", page)
+                break
+
+            for page_data in data[:len(batch)]:
+                results.append({
+                    "url": batch_endpoint,
+                    "status_code": result.get("status_code"),
+                    "data": page_data,
+                    "success": True
+                })
+
+                if self._is_last_page(page_data, page_size):
+                    self.logger.info("No more pages (empty or partial page)")
+                    self.logger.info("API pagination complete. Scraped %s pages", len(results))
+                    return results
+
+            # A short bulk response means the server ran out of pages
+            if len(data) < len(batch):
+                break
+
+            page += len(batch)
+
+        self.logger.info("API pagination complete. Scraped %s pages", len(results))
 
         return results
 
+    def _scrape_pagination_prefetched(
+        self,
+        base_url: str,
+        page_params: Callable[[int, int, Any], Dict[str, Any]],
+        max_pages: int,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape page/offset pagination with a sliding window of prefetched pages.
+
+        Pages are consumed in order; requests still outstanding when the
+        last page is seen are cancelled or discarded.
+
+        Args:
+            base_url: Base API endpoint URL
+            page_params: Builds the query parameters for a page and offset
+            max_pages: Maximum number of pages to scrape
+            **kwargs: Pagination arguments (see scrape_with_pagination)
+
+        Returns:
+            List of dictionaries containing all paginated results
+        """
+        results = []
+        page_size = kwargs.get("page_size", 50)
+        prefetch = kwargs["prefetch"]
+        scrape_kwargs = {key: value for key, value in kwargs.items() if key != "params"}
+        items_key = None
+
+        self.logger.info("Starting API pagination with %s pages prefetched", prefetch)
+
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            futures = {}
+
+            def submit(page: int) -> None:
+                if page <= max_pages:
+                    params = page_params(page, (page - 1) * page_size, None)
+                    futures[page] = executor.submit(self.scrape, base_url, params=params, **scrape_kwargs)
+
+            for page in range(1, prefetch + 1):
+                submit(page)
+
+            page = 1
+            while page in futures:
+                result = futures.pop(page).result()
+                submit(page + prefetch)
+
+                # Check for errors
+                if not result.get("success", False):
+                    self.logger.warning("Pagination stopped at page %s due to error", page)
+                    break
+
+                results.append(result)
+
+                if self._is_last_page(result.get("data", {}), page_size):
+                    self.logger.info("No more pages (empty or partial page)")
+                    break
+
+                page += 1
+
+            for future in futures.values():
+                future.cancel()
+
+        self.logger.info("API pagination complete. Scraped %s pages", len(results))
+
+        return results
+
+    def _is_last_page(self, data: Any, page_size: int) -> bool:
+        """
+        Check whether a page payload is the last page.
+
+        Args:
+            data: Parsed page payload
+            page_size: Items per page
+
+        Returns:
+            True if the page is empty or partial
+        """
+        items = self._get_page_items(data)
+        if items is None:
+            return False
+
+        # Empty or smaller than page_size
+        return len(items) == 0 or len(items) < page_size
+
+    def _get_page_items(self, data: Any, items_key: Optional[str] = None) -> Optional[List[Any]]:
+        """
+        Get the item list of a page payload.
+
+        Args:
+            data: Parsed page payload
+            items_key: Key holding the items in dict payloads, as found by
+                _find_items_key (optional)
+
+        Returns:
+            The payload itself if it is a list, the items under items_key or
+            a common key (items, results, data) if it is a dict, otherwise None
+        """
+        if isinstance(data, list):
+            return data
+
+        if isinstance(data, dict):
+            if items_key is not None:
+                return data.get(items_key) or []
+
+            # Check common pagination indicators
+            return data.get("items") or data.get("results") or data.get("data") or []
+
+        return None
+
+    def _find_items_key(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Find which common key holds the item list of a dict payload.
+
+        Args:
+            data: Parsed page payload
+
+        Returns:
+            First of items, results, data whose value is a non-empty list,
+            or None
+        """
+        return next((key for key in PAGE_ITEM_KEYS if isinstance(data.get(key), list) and data[key]), None)
+
     def _get_nested_value(self, data: Dict, path: str, separator: str = ".") -> Any:
         """
         Get value from nested dictionary using dot notation.
@@ -325,13 +1212,13 @@ class APIScraper(BaseScraper):
         Returns:
             Value at path or None if not found
         """
-        keys = path.split(separator)
         value = data
 
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
+        for key in _compile_path(path, separator):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key, _MISSING)
+            if value is _MISSING:
                 return None
 
         return value
@@ -340,3 +1227,5 @@ class APIScraper(BaseScraper):
         """Cleanup when scraper is destroyed."""
         if hasattr(self, 'session'):
             self.session.close()
+        for client in getattr(self, '_proxy_clients', {}).values():
+            client.close()
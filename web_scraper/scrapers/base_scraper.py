@@ -5,8 +5,11 @@ Defines the interface and common functionality for all scrapers.
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from typing import Any, Dict, List, Optional, Union
 from pathlib import Path
+import queue
+import threading
 import time
 from urllib.parse import urljoin, urlparse
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -17,6 +20,10 @@ from web_scraper.utils.proxy_manager import ProxyManager
 from web_scraper.utils.user_agent_rotator import UserAgentRotator
 from web_scraper.utils.robots_checker import RobotsChecker
 
+# Failed-URL writer flush thresholds
+FAILED_URLS_FLUSH_LINES = 100
+FAILED_URLS_FLUSH_INTERVAL = 5.0  # seconds
+
 
 class BaseScraper(ABC):
     """
@@ -71,9 +78,9 @@ class BaseScraper(ABC):
                         proxy_file=proxy_file,
                         rotation_strategy=request_config.get("proxy_rotation_strategy", "round_robin")
                     )
-                    self.logger.info(f"Loaded proxies from {proxy_file}")
+                    self.logger.info("Loaded proxies from %s", proxy_file)
                 except Exception as e:
-                    self.logger.warning(f"Failed to load proxies: {e}")
+                    self.logger.warning("Failed to load proxies: %s", e)
 
         # Initialize user-agent rotator
         self.ua_rotator = UserAgentRotator(
@@ -81,10 +88,22 @@ class BaseScraper(ABC):
             use_fake_ua=request_config.get("rotate_user_agent", True)
         )
 
+        # Base request headers, built once; without rotation the user-agent
+        # is picked once and the complete headers are reused
+        self._headers_template = dict(request_config.get("headers", {}))
+        self._rotate_user_agent = request_config.get("rotate_user_agent", True)
+        self._fixed_headers: Optional[Dict[str, str]] = None
+        if not self._rotate_user_agent:
+            self._fixed_headers = {**self._headers_template, "User-Agent": self.ua_rotator.get_random_user_agent()}
+
         # Initialize robots.txt checker
         advanced_config = self.config.get("advanced", {})
         self.robots_checker = RobotsChecker(
-            respect_robots_txt=advanced_config.get("respect_robots_txt", True)
+            respect_robots_txt=advanced_config.get("respect_robots_txt", True),
+            failure_ttl=advanced_config.get("robots_failure_ttl", 60),
+            disk_cache_dir=advanced_config.get("robots_cache_dir"),
+            parser_backend=advanced_config.get("robots_parser", "stdlib"),
+            background_sweep=advanced_config.get("robots_background_sweep", False)
         )
 
         # Retry configuration
@@ -102,11 +121,21 @@ class BaseScraper(ABC):
             "end_time": None
         }
 
-        # Failed URLs tracking
-        self.failed_urls: List[Dict[str, Any]] = []
+        # Failed URLs tracking, stored column-wise (see the failed_urls property)
+        self._failed_url_list: List[str] = []
+        self._failed_error_list: List[str] = []
+        self._failed_timestamps = array("d")
+        self._failed_lock = threading.Lock()
         self.save_failed_urls = log_config.get("save_failed_urls", True)
         self.failed_urls_file = log_config.get("failed_urls_file", "failed_urls.txt")
 
+        # Background writer appending failed URLs to disk as they occur; only
+        # runs inside a with block (started on its first failure, stopped by
+        # __exit__), so scrapers used without one never touch the file
+        self._failed_queue: Optional[queue.Queue] = None
+        self._failed_writer: Optional[threading.Thread] = None
+        self._failed_streaming = False
+
     @abstractmethod
     def scrape(self, url: str, **kwargs) -> Dict[str, Any]:
         """
@@ -148,22 +177,59 @@ class BaseScraper(ABC):
         try:
             allowed = self.robots_checker.can_fetch(url)
             if not allowed:
-                self.logger.warning(f"Robots.txt disallows scraping: {url}")
+                self.logger.warning("Robots.txt disallows scraping: %s", url)
             return allowed
         except Exception as e:
-            self.logger.error(f"Error checking robots.txt: {e}")
+            self.logger.error("Error checking robots.txt: %s", e)
             return True  # Allow by default on error
 
+    async def _check_robots_txt_async(self, url: str) -> bool:
+        """
+        Check if URL can be scraped according to robots.txt, without blocking the event loop.
+
+        Args:
+            url: URL to check
+
+        Returns:
+            True if allowed, False otherwise
+        """
+        try:
+            allowed = await self.robots_checker.acan_fetch(url)
+            if not allowed:
+                self.logger.warning("Robots.txt disallows scraping: %s", url)
+            return allowed
+        except Exception as e:
+            self.logger.error("Error checking robots.txt: %s", e)
+            return True  # Allow by default on error
+
+    def _include_html(self, kwargs: Dict[str, Any], has_selectors: bool) -> bool:
+        """
+        Decide whether a result should carry the full page HTML.
+
+        Uses the include_html argument, then extraction.include_html; when
+        neither is set, HTML is returned only if no selectors were given.
+
+        Args:
+            kwargs: Arguments passed to scrape()
+            has_selectors: Whether any selectors were applied to the page
+
+        Returns:
+            True if the HTML should be included
+        """
+        include = kwargs.get("include_html", self.config.get("extraction", {}).get("include_html"))
+        return not has_selectors if include is None else bool(include)
+
     def _get_headers(self) -> Dict[str, str]:
         """
         Get request headers with rotated user-agent.
 
         Returns:
-            Dictionary of headers
+            Dictionary of headers (a new dictionary the caller may modify)
         """
-        headers = self.config.get("request", {}).get("headers", {}).copy()
-        headers["User-Agent"] = self.ua_rotator.get_random_user_agent()
-        return headers
+        if self._fixed_headers is not None:
+            return dict(self._fixed_headers)
+
+        return {**self._headers_template, "User-Agent": self.ua_rotator.get_random_user_agent()}
 
     def _get_proxy(self) -> Optional[Dict[str, str]]:
         """
@@ -192,7 +258,7 @@ class BaseScraper(ABC):
 
         # Report to proxy manager
         if proxy_url and self.proxy_manager:
-            self.proxy_manager.report_success(proxy_url)
+            self.proxy_manager.record_result(proxy_url, True)
 
     def _handle_request_failure(
         self,
@@ -211,14 +277,20 @@ class BaseScraper(ABC):
         self.stats["failed_requests"] += 1
 
         # Log failure
-        self.logger.error(f"Failed to scrape {url}: {str(error)}")
+        self.logger.error("Failed to scrape %s: %s", url, error)
 
-        # Track failed URL
-        self.failed_urls.append({
-            "url": url,
-            "error": str(error),
-            "timestamp": time.time()
-        })
+        # Track failed URL (locked so concurrent failures keep the columns aligned)
+        error_message = str(error)
+        with self._failed_lock:
+            self._failed_url_list.append(url)
+            self._failed_error_list.append(error_message)
+            self._failed_timestamps.append(time.time())
+
+            if self.save_failed_urls and self._failed_streaming:
+                if self._failed_writer is None:
+                    self._start_failed_writer()
+                else:
+                    self._failed_queue.put_nowait(f"{url}\t{error_message}\n")
 
         # Report to rate limiter if adaptive
         if isinstance(self.rate_limiter, AdaptiveRateLimiter):
@@ -226,20 +298,93 @@ class BaseScraper(ABC):
 
         # Report to proxy manager
         if proxy_url and self.proxy_manager:
-            self.proxy_manager.report_failure(proxy_url)
+            self.proxy_manager.record_result(proxy_url, False)
 
-    def _save_failed_urls(self) -> None:
-        """Save failed URLs to file."""
-        if not self.save_failed_urls or not self.failed_urls:
-            return
+    @property
+    def failed_urls(self) -> List[Dict[str, Any]]:
+        """
+        Failed URLs as a list of dictionaries.
+
+        Built on access from the column-wise storage; modifying the returned
+        list does not affect the tracked failures.
+
+        Returns:
+            List of dictionaries with 'url', 'error' and 'timestamp' keys
+        """
+        return [
+            {"url": url, "error": error, "timestamp": timestamp}
+            for url, error, timestamp in zip(self._failed_url_list, self._failed_error_list, self._failed_timestamps)
+        ]
+
+    def _start_failed_writer(self) -> None:
+        """
+        Start the background thread that writes failed URLs to file.
+
+        The file is rewritten from the start, seeded with every failure
+        tracked so far, so it always lists all of this scraper's failures
+        as the old write-at-exit did. The caller must hold _failed_lock.
+        """
+        self._failed_queue = queue.Queue()
+        for url, error in zip(self._failed_url_list, self._failed_error_list):
+            self._failed_queue.put_nowait(f"{url}\t{error}\n")
+
+        self._failed_writer = threading.Thread(
+            target=self._write_failed_urls,
+            args=(self._failed_queue,),
+            name="failed-urls-writer",
+            daemon=True
+        )
+        self._failed_writer.start()
+
+    def _write_failed_urls(self, lines: queue.Queue) -> None:
+        """
+        Write queued failed-URL lines to file until a None sentinel arrives.
 
+        Output is buffered and flushed every FAILED_URLS_FLUSH_LINES lines or
+        FAILED_URLS_FLUSH_INTERVAL seconds, so a crash loses little.
+
+        Args:
+            lines: Queue of formatted lines
+        """
         try:
-            with open(self.failed_urls_file, 'w') as f:
-                for failed in self.failed_urls:
-                    f.write(f"{failed['url']}\t{failed['error']}\n")
-            self.logger.info(f"Saved {len(self.failed_urls)} failed URLs to {self.failed_urls_file}")
+            with open(self.failed_urls_file, "w", buffering=1 << 16) as f:
+                pending = 0
+                while True:
+                    try:
+                        line = lines.get(timeout=FAILED_URLS_FLUSH_INTERVAL)
+                    except queue.Empty:
+                        line = ""
+
+                    if line is None:
+                        break
+
+                    if line:
+                        f.write(line)
+                        pending += 1
+
+                    if pending and (pending >= FAILED_URLS_FLUSH_LINES or not line):
+                        f.flush()
+                        pending = 0
         except Exception as e:
-            self.logger.error(f"Failed to save failed URLs: {e}")
+            self.logger.error("Failed to save failed URLs: %s", e)
+
+    def _save_failed_urls(self) -> None:
+        """Flush failed URLs to file and stop the background writer."""
+        with self._failed_lock:
+            self._failed_streaming = False
+            if self._failed_writer is None:
+                # No failure inside the with block; still save earlier ones
+                if not self.save_failed_urls or not self._failed_url_list:
+                    return
+                self._start_failed_writer()
+
+            writer = self._failed_writer
+            self._failed_queue.put_nowait(None)
+            self._failed_queue = None
+            self._failed_writer = None
+
+        writer.join()
+        self.logger.info("Saved %s failed URLs to %s", len(self._failed_url_list), self.failed_urls_file)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -259,9 +404,9 @@ class BaseScraper(ABC):
         # Add sub-component stats
         stats["rate_limiter"] = self.rate_limiter.get_stats()
         if self.proxy_manager:
-            stats["proxy_manager"] = self.proxy_manager.get_stats()
-        stats["user_agent_rotator"] = self.ua_rotator.get_stats()
-        stats["robots_checker"] = self.robots_checker.get_stats()
+            stats["proxy_manager"] = self.proxy_manager.get_summary()
+        stats["user_agent_rotator"] = self.ua_rotator.snapshot_stats()
+        stats["robots_checker"] = self.robots_checker.snapshot_stats()
 
         return stats
 
@@ -275,7 +420,10 @@ class BaseScraper(ABC):
             "start_time": None,
             "end_time": None
         }
-        self.failed_urls.clear()
+        with self._failed_lock:
+            self._failed_url_list.clear()
+            self._failed_error_list.clear()
+            del self._failed_timestamps[:]
         self.rate_limiter.reset()
         if self.proxy_manager:
             self.proxy_manager.stats = {
@@ -289,6 +437,7 @@ class BaseScraper(ABC):
     def __enter__(self):
         """Context manager entry."""
         self.stats["start_time"] = time.time()
+        self._failed_streaming = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -4,13 +4,242 @@ Dynamic content scraper using Playwright.
 Modern alternative to Selenium with better performance and features.
 """
 
-import time
-from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import multiprocessing
+import queue
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright
+from playwright.async_api import BrowserContext as AsyncBrowserContext, Page as AsyncPage
 from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
 from web_scraper.scrapers.base_scraper import BaseScraper
+from web_scraper.scrapers.static_scraper import StaticScraper
+
+
+# Page-side conditions used instead of fixed sleeps
+_READY_STATE_JS = "() => document.readyState === 'complete'"
+
+# Scrolls to the bottom until the page stops growing or a budget runs out,
+# entirely in the page. Each scroll waits up to pauseMs for new content.
+# Returns [scrolls, reason], reason being why scrolling stopped.
+_SCROLL_JS = """async ({pauseMs, maxScrolls, maxBytes, maxMs}) => {
+    const deadline = performance.now() + maxMs;
+    const grown = height => new Promise(resolve => {
+        const done = result => {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(result);
+        };
+        const observer = new MutationObserver(() => {
+            if (document.body.scrollHeight > height) done(true);
+        });
+        const timer = setTimeout(() => done(document.body.scrollHeight > height), pauseMs);
+        observer.observe(document.body, {childList: true, subtree: true});
+    });
+    for (let i = 0; i < maxScrolls; i++) {
+        if (performance.now() >= deadline) return [i, "max_seconds"];
+        const height = document.body.scrollHeight;
+        window.scrollTo(0, height);
+        if (!(await grown(height))) return [i, "end"];
+        if (document.documentElement.outerHTML.length > maxBytes) return [i + 1, "max_dom_bytes"];
+    }
+    return [maxScrolls, "max_scrolls"];
+}"""
+
+# Extracts the rendered text (innerText) of every selector in one round trip.
+# Unlike StaticScraper._extract_element_data this leaves out hidden content and
+# separates block elements with line breaks; text is likewise stripped, and
+# None when empty
+_EXTRACT_JS = """([selectors, extractAll, clean]) => {
+    const text = el => {
+        let t = el.innerText.trim();
+        if (clean) t = t.replace(/\\s+/g, ' ');
+        return t || null;
+    };
+    const data = {};
+    for (const [field, selector] of Object.entries(selectors)) {
+        try {
+            if (extractAll) {
+                data[field] = Array.from(document.querySelectorAll(selector), text);
+            } else {
+                const el = document.querySelector(selector);
+                data[field] = el ? text(el) : null;
+            }
+        } catch (e) {
+            data[field] = null;
+        }
+    }
+    return data;
+}"""
+
+# Subresources never needed for HTML/text extraction
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+# Hosts whose cookies are kept between scrapes
+MAX_STORED_HOSTS = 256
+
+# How long to wait (ms) for a page to settle after a script or click
+INTERACTION_TIMEOUT = 2000
+
+
+def _parse_and_extract(
+    page_content: str,
+    selectors: Dict[str, str],
+    extract_all: bool,
+    clean_whitespace: bool
+) -> Dict[str, Any]:
+    """
+    Parse HTML and extract data using CSS selectors.
+
+    Module-level so it can run in a worker process.
+
+    Args:
+        page_content: Rendered HTML
+        selectors: Dictionary of field_name: selector pairs
+        extract_all: Whether to extract all matches
+        clean_whitespace: Whether to collapse whitespace in extracted text
+
+    Returns:
+        Dictionary of extracted data
+    """
+    def element_text(element) -> Optional[str]:
+        text = element.get_text(strip=True)
+        if clean_whitespace:
+            text = " ".join(text.split())
+        return text if text else None
+
+    soup = BeautifulSoup(page_content, "lxml")
+    data = {}
+
+    for field, selector in selectors.items():
+        try:
+            if extract_all:
+                data[field] = [element_text(el) for el in soup.select(selector)]
+            else:
+                element = soup.select_one(selector)
+                data[field] = element_text(element) if element else None
+
+        except Exception:
+            data[field] = None
+
+    return data
+
+
+def _shutdown_browser(browser: Any, playwright: Any) -> None:
+    """
+    Close a browser and stop its Playwright driver, ignoring errors.
+
+    Module-level so a finalizer can call it without keeping the scraper alive.
+
+    Args:
+        browser: Browser to close
+        playwright: Started Playwright instance to stop
+    """
+    try:
+        browser.close()
+    except Exception:
+        pass
+    try:
+        playwright.stop()
+    except Exception:
+        pass
+
+
+class BrowserContextPool:
+    """
+    Bounded pool of reusable browser contexts.
+
+    Contexts are reset between uses and replaced after a number of
+    uses, so long runs don't accumulate browser memory.
+    """
+
+    def __init__(self, create_context: Callable[[], BrowserContext], size: int = 2, max_uses: int = 50):
+        """
+        Initialize the pool and pre-create its contexts.
+
+        Args:
+            create_context: Creates a new browser context
+            size: Number of contexts kept in the pool
+            max_uses: Uses after which a context is closed and replaced
+        """
+        self.create_context = create_context
+        self.max_uses = max_uses
+        self._contexts: "queue.Queue[BrowserContext]" = queue.Queue(maxsize=size)
+        self._uses: Dict[int, int] = {}
+
+        for _ in range(size):
+            self._contexts.put_nowait(self._new_context())
+
+    def _new_context(self) -> BrowserContext:
+        """Create a context and start counting its uses."""
+        context = self.create_context()
+        self._uses[id(context)] = 0
+        return context
+
+    def _discard(self, context: BrowserContext) -> None:
+        """Close a context and forget its use count."""
+        self._uses.pop(id(context), None)
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def acquire(self) -> BrowserContext:
+        """
+        Take a context from the pool.
+
+        A new context is created when all pooled contexts are in use.
+
+        Returns:
+            BrowserContext instance
+        """
+        try:
+            return self._contexts.get_nowait()
+        except queue.Empty:
+            return self._new_context()
+
+    def release(self, context: BrowserContext) -> None:
+        """
+        Reset a context and return it to the pool.
+
+        Args:
+            context: Context previously returned by acquire()
+        """
+        uses = self._uses.get(id(context), 0) + 1
+
+        if uses >= self.max_uses:
+            self._discard(context)
+            context = self._new_context()
+        else:
+            try:
+                # Drop per-site state and any pages left open
+                context.clear_cookies()
+                for page in context.pages:
+                    page.close()
+            except Exception:
+                self._discard(context)
+                return
+            self._uses[id(context)] = uses
+
+        try:
+            self._contexts.put_nowait(context)
+        except queue.Full:
+            self._discard(context)
+
+    def close(self) -> None:
+        """Close all pooled contexts."""
+        while True:
+            try:
+                self._discard(self._contexts.get_nowait())
+            except queue.Empty:
+                break
 
 
 class PlaywrightScraper(BaseScraper):
@@ -35,59 +264,265 @@ class PlaywrightScraper(BaseScraper):
         self.browser_type = scraping_config.get("browser", "chromium").lower()
         self.headless = scraping_config.get("headless", True)
         self.page_load_timeout = scraping_config.get("page_load_timeout", 60) * 1000  # Convert to ms
+        self.nav_timeout = scraping_config.get("nav_timeout_ms", 8000)
+
+        # Scroll budgets, so infinite feeds can't scroll forever
+        self.max_scrolls = scraping_config.get("max_scrolls", 50)
+        self.max_dom_bytes = scraping_config.get("max_dom_bytes", 10_000_000)
+        self.max_scroll_seconds = scraping_config.get("max_scroll_seconds", 60)
+        self.max_concurrency = scraping_config.get("max_concurrency", 5)
+        # Processes for parsing in concurrent batches (0 = threads, the default)
+        self.parse_workers = scraping_config.get("parse_workers", 0)
+        self.context_pool_size = scraping_config.get("context_pool_size", 2)
+        self.context_max_uses = scraping_config.get("context_max_uses", 50)
+        self.reuse_cookies = scraping_config.get("reuse_cookies", True)
+
+        # Extraction configuration
+        extraction_config = self.config.get("extraction", {})
+        self.native_selectors = extraction_config.get("native_selectors", True)
+        self.clean_whitespace = extraction_config.get("clean_whitespace", True)
 
         # Advanced configuration
         advanced_config = self.config.get("advanced", {})
         self.take_screenshots = advanced_config.get("take_screenshots", False)
         self.screenshot_dir = advanced_config.get("screenshot_dir", "screenshots")
         self.screenshot_on_error = advanced_config.get("screenshot_on_error", False)
+        self.screenshot_format = advanced_config.get("screenshot_format", "jpeg").lower()
+        self.screenshot_quality = int(advanced_config.get("screenshot_quality", 70))
+
+        # Writes screenshots to disk so the page can close without waiting on I/O
+        self._screenshot_writer: Optional[ThreadPoolExecutor] = None
+
+        # Screenshots need images and styling, so nothing is blocked then
+        self.block_resources = scraping_config.get("block_resources", True) and not self.take_screenshots
 
         self.playwright = None
         self.browser = None
+        self._context_pool: Optional[BrowserContextPool] = None
+        self._finalizer: Optional[weakref.finalize] = None
+
+        # Cookies per host, restored into contexts so consent and session
+        # cookies from an earlier visit carry over
+        self._storage_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Created on first CSS extraction and reused for every page
+        self._css_extractor: Optional[StaticScraper] = None
+
+        self.logger.info("PlaywrightScraper initialized with %s browser", self.browser_type)
+
+    def _get_launcher(self, playwright: Any) -> Any:
+        """
+        Get the browser launcher for the configured browser type.
+
+        Args:
+            playwright: Started sync or async Playwright instance
+
+        Returns:
+            BrowserType used to launch the browser
 
-        self.logger.info(f"PlaywrightScraper initialized with {self.browser_type} browser")
+        Raises:
+            ValueError: If the browser type is not supported
+        """
+        if self.browser_type == "chromium":
+            return playwright.chromium
+        elif self.browser_type == "firefox":
+            return playwright.firefox
+        elif self.browser_type == "webkit":
+            return playwright.webkit
+        else:
+            raise ValueError(f"Unsupported browser: {self.browser_type}")
 
     def _init_browser(self) -> None:
         """Initialize Playwright browser."""
         if self.playwright is None:
             self.playwright = sync_playwright().start()
 
-            # Select browser
-            if self.browser_type == "chromium":
-                browser_launcher = self.playwright.chromium
-            elif self.browser_type == "firefox":
-                browser_launcher = self.playwright.firefox
-            elif self.browser_type == "webkit":
-                browser_launcher = self.playwright.webkit
-            else:
-                raise ValueError(f"Unsupported browser: {self.browser_type}")
-
             # Launch browser
-            self.browser = browser_launcher.launch(headless=self.headless)
+            self.browser = self._get_launcher(self.playwright).launch(headless=self.headless)
+
+            # Shut the browser down even if close() is never called
+            self._finalizer = weakref.finalize(self, _shutdown_browser, self.browser, self.playwright)
+
+            # Pre-create reusable contexts
+            self._context_pool = BrowserContextPool(
+                self._new_context, self.context_pool_size, self.context_max_uses
+            )
+
+    def close(self) -> None:
+        """Close pooled contexts and the browser, and stop Playwright."""
+        if self._context_pool:
+            self._context_pool.close()
+        if self._finalizer:
+            self._finalizer()
+        if self._screenshot_writer:
+            self._screenshot_writer.shutdown()
+
+        self._context_pool = None
+        self._screenshot_writer = None
+        self._finalizer = None
+        self.browser = None
+        self.playwright = None
 
-    def _create_context(self) -> BrowserContext:
+    def _context_options(self) -> Dict[str, Any]:
         """
-        Create new browser context.
+        Get the options for a new browser context.
 
         Returns:
-            BrowserContext instance
+            Keyword arguments for Browser.new_context()
         """
-        self._init_browser()
+        return {
+            "user_agent": self.ua_rotator.get_random_user_agent(),
+            "viewport": {"width": 1920, "height": 1080},
+            "accept_downloads": False
+        }
 
-        # Get user agent
-        user_agent = self.ua_rotator.get_random_user_agent()
+    def _new_context(self) -> BrowserContext:
+        """
+        Create new browser context.
 
+        Returns:
+            BrowserContext instance
+        """
         # Create context with custom settings
-        context = self.browser.new_context(
-            user_agent=user_agent,
-            viewport={"width": 1920, "height": 1080},
-            accept_downloads=False
-        )
+        context = self.browser.new_context(**self._context_options())
 
         context.set_default_timeout(self.page_load_timeout)
+        context.set_default_navigation_timeout(self.nav_timeout)
+
+        if self.block_resources:
+            context.route("**/*", self._route_resource)
 
         return context
 
+    def _route_resource(self, route: Any) -> None:
+        """
+        Abort subresources that extraction doesn't need.
+
+        Args:
+            route: Playwright Route for the intercepted request
+        """
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _route_resource_async(self, route: Any) -> None:
+        """
+        Abort subresources that extraction doesn't need, on the event loop.
+
+        Args:
+            route: Async Playwright Route for the intercepted request
+        """
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _get_load_state(self, kwargs: Dict[str, Any]) -> str:
+        """
+        Get the load state to wait for on navigation.
+
+        "networkidle" waits for a quiet network that many pages never
+        reach, so it is downgraded to "load".
+
+        Args:
+            kwargs: Arguments passed to scrape()
+
+        Returns:
+            Load state for Page.goto()
+        """
+        load_state = kwargs.get("wait_for_load_state", "load")
+        if load_state == "networkidle":
+            self.logger.warning("wait_for_load_state 'networkidle' is discouraged, using 'load' instead")
+            return "load"
+        return load_state
+
+    def _goto(self, page: Page, url: str, load_state: str = "load") -> Optional[Any]:
+        """
+        Navigate to a URL within the navigation timeout.
+
+        A timed-out navigation is not an error: the DOM is usually there
+        and only slow subresources are missing, so scraping continues
+        with whatever has loaded.
+
+        Args:
+            page: Playwright Page instance
+            url: URL to navigate to
+            load_state: Load state to wait for
+
+        Returns:
+            Main resource Response, or None if there is none or it timed out
+        """
+        try:
+            return page.goto(url, wait_until=load_state)
+        except PlaywrightTimeout:
+            self.logger.warning("Navigation timed out after %sms, using partial page: %s", self.nav_timeout, url)
+            return None
+
+    async def _goto_async(self, page: AsyncPage, url: str, load_state: str = "load") -> Optional[Any]:
+        """
+        Navigate to a URL within the navigation timeout, on the event loop.
+
+        Args:
+            page: Async Playwright Page instance
+            url: URL to navigate to
+            load_state: Load state to wait for
+
+        Returns:
+            Main resource Response, or None if there is none or it timed out
+        """
+        try:
+            return await page.goto(url, wait_until=load_state)
+        except PlaywrightTimeout:
+            self.logger.warning("Navigation timed out after %sms, using partial page: %s", self.nav_timeout, url)
+            return None
+
+    def _acquire_context(self, url: Optional[str] = None) -> BrowserContext:
+        """
+        Take a browser context from the pool.
+
+        Args:
+            url: URL the context will load; cookies saved for its host
+                are restored (optional)
+
+        Returns:
+            BrowserContext instance, to be handed back with _release_context()
+        """
+        self._init_browser()
+        context = self._context_pool.acquire()
+
+        if url and self.reuse_cookies:
+            cookies = self._storage_cache.get(urlparse(url).netloc)
+            if cookies:
+                context.add_cookies(cookies)
+
+        return context
+
+    def _store_cookies(self, url: str, cookies: List[Dict[str, Any]]) -> None:
+        """
+        Remember the cookies for a URL's host.
+
+        Args:
+            url: URL that was loaded
+            cookies: Cookies that apply to the URL
+        """
+        host = urlparse(url).netloc
+
+        # Least recently stored hosts are dropped first
+        self._storage_cache.pop(host, None)
+        if len(self._storage_cache) >= MAX_STORED_HOSTS:
+            self._storage_cache.pop(next(iter(self._storage_cache)))
+        self._storage_cache[host] = cookies
+
+    def _release_context(self, context: BrowserContext) -> None:
+        """
+        Return a browser context to the pool.
+
+        Args:
+            context: Context from _acquire_context()
+        """
+        self._context_pool.release(context)
+
     def scrape(self, url: str, **kwargs) -> Dict[str, Any]:
         """
         Scrape data from a single URL.
@@ -117,14 +552,14 @@ class PlaywrightScraper(BaseScraper):
                 raise PermissionError(f"Robots.txt disallows scraping: {url}")
 
             # Create context and page
-            context = self._create_context()
+            context = self._acquire_context(url)
             page = context.new_page()
 
             self.stats["total_requests"] += 1
 
             # Navigate to URL
-            self.logger.debug(f"Navigating to {url}")
-            response = page.goto(url, wait_until=kwargs.get("wait_for_load_state", "load"))
+            self.logger.debug("Navigating to %s", url)
+            response = self._goto(page, url, self._get_load_state(kwargs))
 
             # Wait for specific selector if provided
             wait_for = kwargs.get("wait_for_selector")
@@ -133,22 +568,30 @@ class PlaywrightScraper(BaseScraper):
                 try:
                     page.wait_for_selector(wait_for, timeout=wait_timeout)
                 except PlaywrightTimeout:
-                    self.logger.warning(f"Timeout waiting for selector: {wait_for}")
+                    self.logger.warning("Timeout waiting for selector: %s", wait_for)
 
             # Execute custom JavaScript
             script = kwargs.get("execute_script")
             if script:
                 page.evaluate(script)
-                time.sleep(1)
+                try:
+                    page.wait_for_function(_READY_STATE_JS, timeout=INTERACTION_TIMEOUT)
+                except PlaywrightTimeout:
+                    pass
 
             # Click elements if specified
             click_selectors = kwargs.get("click_selectors", [])
             for selector in click_selectors:
                 try:
                     page.click(selector)
-                    time.sleep(1)
                 except Exception as e:
-                    self.logger.warning(f"Failed to click selector '{selector}': {e}")
+                    self.logger.warning("Failed to click selector '%s': %s", selector, e)
+                    continue
+
+                try:
+                    page.wait_for_load_state("domcontentloaded", timeout=INTERACTION_TIMEOUT)
+                except PlaywrightTimeout:
+                    pass
 
             # Scroll to bottom if requested
             if kwargs.get("scroll_to_bottom", False):
@@ -158,36 +601,30 @@ class PlaywrightScraper(BaseScraper):
             page_content = page.content()
             current_url = page.url
 
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(page_content, "lxml")
-
-            # Extract data
-            data = {
-                "url": url,
-                "final_url": current_url,
-                "title": page.title(),
-                "html": page_content,
-                "status_code": response.status if response else None
-            }
+            data = self._build_result(
+                url, current_url, page.title(), page_content,
+                response.status if response else None
+            )
 
             # Extract using CSS selectors
-            selectors = kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
+            selectors = self._get_selectors(kwargs)
             if selectors:
-                from web_scraper.scrapers.static_scraper import StaticScraper
-                static_scraper = StaticScraper(self.config)
-                data["extracted_data"] = static_scraper._extract_with_css(soup, selectors, kwargs.get("extract_all", False))
+                data["extracted_data"] = self._extract_from_page(page, page_content, selectors, kwargs.get("extract_all", False))
 
             # Take screenshot if enabled
             if self.take_screenshots:
                 self._take_screenshot(page, url)
 
+            if self.reuse_cookies:
+                self._store_cookies(url, context.cookies(current_url))
+
             self._handle_request_success(url)
             self.stats["total_items_scraped"] += 1
 
             return data
 
         except Exception as e:
-            self.logger.error(f"Error scraping {url}: {e}")
+            self.logger.error("Error scraping %s: %s", url, e)
 
             # Take screenshot on error
             if page and self.screenshot_on_error:
@@ -208,31 +645,204 @@ class PlaywrightScraper(BaseScraper):
             if page:
                 page.close()
             if context:
-                context.close()
+                self._release_context(context)
 
-    def _scroll_to_bottom(self, page: Page, pause_time: float = 2.0) -> None:
+    def _build_result(
+        self,
+        url: str,
+        final_url: str,
+        title: str,
+        page_content: str,
+        status_code: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        Build the result dictionary for a loaded page.
+
+        Args:
+            url: URL that was requested
+            final_url: URL after redirects
+            title: Page title
+            page_content: Rendered HTML
+            status_code: Status of the main response, if any
+
+        Returns:
+            Dictionary containing scraped data
+        """
+        return {
+            "url": url,
+            "final_url": final_url,
+            "title": title,
+            "html": page_content,
+            "status_code": status_code
+        }
+
+    def _get_selectors(self, kwargs: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the CSS selectors to extract with.
+
+        Args:
+            kwargs: Arguments passed to scrape()
+
+        Returns:
+            Dictionary of field_name: selector pairs (empty if none)
+        """
+        return kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
+
+    def _extract_from_page(
+        self,
+        page: Page,
+        page_content: str,
+        selectors: Dict[str, str],
+        extract_all: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Extract data from a loaded page using CSS selectors.
+
+        With extraction.native_selectors set, selectors run in the browser
+        against the live DOM; otherwise the HTML is parsed with BeautifulSoup.
+
+        Args:
+            page: Playwright Page instance
+            page_content: Rendered HTML of the page
+            selectors: Dictionary of field_name: selector pairs
+            extract_all: Whether to extract all matches
+
+        Returns:
+            Dictionary of extracted data
+        """
+        if self.native_selectors:
+            return page.evaluate(_EXTRACT_JS, [selectors, extract_all, self.clean_whitespace])
+
+        soup = BeautifulSoup(page_content, "lxml")
+        return self._extract_with_css(soup, selectors, extract_all)
+
+    def _extract_with_css(self, soup: BeautifulSoup, selectors: Dict[str, str], extract_all: bool = False) -> Dict[str, Any]:
+        """
+        Extract data using CSS selectors.
+
+        Args:
+            soup: BeautifulSoup object
+            selectors: Dictionary of field_name: selector pairs
+            extract_all: Whether to extract all matches
+
+        Returns:
+            Dictionary of extracted data
+        """
+        if self._css_extractor is None:
+            self._css_extractor = StaticScraper(self.config)
+
+        return self._css_extractor._extract_with_css(soup, selectors, extract_all)
+
+    def _scroll_to_bottom(self, page: Page, pause_time: float = 2.0, max_scrolls: Optional[int] = None) -> int:
         """
         Scroll to bottom of page to load dynamic content.
 
+        The scroll loop runs inside the page, so it costs one round trip.
+        Scrolling stops at the end of the page or when the scroll count,
+        DOM size (scraping.max_dom_bytes) or time (scraping.max_scroll_seconds)
+        budget runs out.
+
         Args:
             page: Playwright Page instance
-            pause_time: Time to pause between scrolls
+            pause_time: Longest time to wait for new content after a scroll
+            max_scrolls: Maximum number of scrolls (scraping.max_scrolls if None)
+
+        Returns:
+            Number of scrolls that loaded new content
         """
-        last_height = page.evaluate("document.body.scrollHeight")
+        return self._record_scroll_stop(page.evaluate(_SCROLL_JS, self._scroll_args(pause_time, max_scrolls)))
 
-        while True:
-            # Scroll down
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            time.sleep(pause_time)
+    def _scroll_args(self, pause_time: float, max_scrolls: Optional[int]) -> Dict[str, Any]:
+        """
+        Get the arguments for the in-page scroll loop.
 
-            # Calculate new height
-            new_height = page.evaluate("document.body.scrollHeight")
+        Args:
+            pause_time: Longest time to wait for new content after a scroll
+            max_scrolls: Maximum number of scrolls (scraping.max_scrolls if None)
 
-            # Break if no more content
-            if new_height == last_height:
-                break
+        Returns:
+            Argument for _SCROLL_JS
+        """
+        return {
+            "pauseMs": int(pause_time * 1000),
+            "maxScrolls": self.max_scrolls if max_scrolls is None else max_scrolls,
+            "maxBytes": self.max_dom_bytes,
+            "maxMs": self.max_scroll_seconds * 1000
+        }
+
+    def _record_scroll_stop(self, outcome: List[Any]) -> int:
+        """
+        Count why a scroll loop stopped in stats["scroll_stops"].
+
+        Args:
+            outcome: [scrolls, reason] returned by _SCROLL_JS
+
+        Returns:
+            Number of scrolls that loaded new content
+        """
+        scrolls, reason = outcome
+
+        scroll_stops = self.stats.setdefault("scroll_stops", {})
+        scroll_stops[reason] = scroll_stops.get(reason, 0) + 1
+
+        if reason in ("max_dom_bytes", "max_seconds"):
+            self.logger.warning("Stopped scrolling after %s scrolls: %s budget reached", scrolls, reason)
+
+        return scrolls
+
+    def _screenshot_path(self, url: str, suffix: str = "") -> Path:
+        """
+        Get the screenshot file path for a URL.
+
+        Args:
+            url: URL being scraped
+            suffix: Suffix for filename
+
+        Returns:
+            Path of the screenshot file
+        """
+        screenshot_dir = Path(self.screenshot_dir)
+        screenshot_dir.mkdir(parents=True, exist_ok=True)
+
+        # Create filename from URL hash
+        url_hash = hashlib.blake2b(url.encode(), digest_size=5).hexdigest()
+        extension = "jpg" if self.screenshot_format == "jpeg" else "png"
+        return screenshot_dir / f"screenshot_{url_hash}{suffix}.{extension}"
+
+    def _screenshot_options(self) -> Dict[str, Any]:
+        """
+        Get the options for Page.screenshot().
+
+        JPEG (the default) is much smaller and faster to encode than PNG
+        for full-page captures.
 
-            last_height = new_height
+        Returns:
+            Keyword arguments for Page.screenshot()
+        """
+        options = {"full_page": True, "type": self.screenshot_format}
+        if self.screenshot_format == "jpeg":
+            options["quality"] = self.screenshot_quality
+        return options
+
+    def _save_screenshot(self, filename: Path, image: bytes) -> None:
+        """
+        Write a captured screenshot to disk in the background.
+
+        Args:
+            filename: Path of the screenshot file
+            image: Encoded image bytes
+        """
+        if self._screenshot_writer is None:
+            self._screenshot_writer = ThreadPoolExecutor(max_workers=1)
+
+        def write() -> None:
+            try:
+                filename.write_bytes(image)
+                self.logger.info("Screenshot saved: %s", filename)
+            except Exception as e:
+                self.logger.warning("Failed to save screenshot: %s", e)
+
+        self._screenshot_writer.submit(write)
 
     def _take_screenshot(self, page: Page, url: str, suffix: str = "") -> None:
         """
@@ -244,47 +854,284 @@ class PlaywrightScraper(BaseScraper):
             suffix: Suffix for filename
         """
         try:
-            from pathlib import Path
-            import hashlib
+            filename = self._screenshot_path(url, suffix)
+            self._save_screenshot(filename, page.screenshot(**self._screenshot_options()))
 
-            screenshot_dir = Path(self.screenshot_dir)
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            self.logger.warning("Failed to save screenshot: %s", e)
 
-            # Create filename from URL hash
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
-            filename = screenshot_dir / f"screenshot_{url_hash}{suffix}.png"
+    async def _take_screenshot_async(self, page: AsyncPage, url: str, suffix: str = "") -> None:
+        """
+        Take screenshot of current page on the event loop.
 
-            page.screenshot(path=str(filename), full_page=True)
-            self.logger.info(f"Screenshot saved: {filename}")
+        Args:
+            page: Async Playwright Page instance
+            url: URL being scraped
+            suffix: Suffix for filename
+        """
+        try:
+            filename = self._screenshot_path(url, suffix)
+            self._save_screenshot(filename, await page.screenshot(**self._screenshot_options()))
 
         except Exception as e:
-            self.logger.warning(f"Failed to save screenshot: {e}")
+            self.logger.warning("Failed to save screenshot: %s", e)
 
-    def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+    async def _scroll_to_bottom_async(
+        self,
+        page: AsyncPage,
+        pause_time: float = 2.0,
+        max_scrolls: Optional[int] = None
+    ) -> int:
         """
-        Scrape multiple URLs.
+        Scroll to bottom of page on the event loop.
 
         Args:
-            urls: List of URLs to scrape
-            **kwargs: Additional arguments passed to scrape()
+            page: Async Playwright Page instance
+            pause_time: Longest time to wait for new content after a scroll
+            max_scrolls: Maximum number of scrolls (scraping.max_scrolls if None)
 
         Returns:
-            List of dictionaries containing scraped data
+            Number of scrolls that loaded new content
         """
-        results = []
+        return self._record_scroll_stop(await page.evaluate(_SCROLL_JS, self._scroll_args(pause_time, max_scrolls)))
 
-        # Get settings
-        show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+    async def _scrape_async(
+        self,
+        url: str,
+        semaphore: asyncio.Semaphore,
+        context: AsyncBrowserContext,
+        parse_pool: Optional[Executor] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Scrape a single URL in a new page of a shared context.
 
-        # Playwright is single-threaded, so we scrape sequentially
-        iterator = tqdm(urls, desc="Scraping") if show_progress else urls
+        Args:
+            url: URL to scrape
+            semaphore: Bounds the number of open pages
+            context: Browser context shared by the batch
+            parse_pool: Executor for HTML parsing (default executor if None)
+            **kwargs: Same arguments as scrape()
 
-        for url in iterator:
-            result = self.scrape(url, **kwargs)
-            results.append(result)
+        Returns:
+            Dictionary containing scraped data
+        """
+        async with semaphore:
+            page = None
+            loop = asyncio.get_running_loop()
+
+            try:
+                # The rate limiter blocks, so run it off the event loop
+                await loop.run_in_executor(None, self.rate_limiter.acquire)
+
+                if not await self._check_robots_txt_async(url):
+                    raise PermissionError(f"Robots.txt disallows scraping: {url}")
+
+                page = await context.new_page()
+
+                self.stats["total_requests"] += 1
+
+                self.logger.debug("Navigating to %s", url)
+                response = await self._goto_async(page, url, self._get_load_state(kwargs))
+
+                wait_for = kwargs.get("wait_for_selector")
+                if wait_for:
+                    wait_timeout = kwargs.get("wait_timeout", 10000)
+                    try:
+                        await page.wait_for_selector(wait_for, timeout=wait_timeout)
+                    except PlaywrightTimeout:
+                        self.logger.warning("Timeout waiting for selector: %s", wait_for)
+
+                script = kwargs.get("execute_script")
+                if script:
+                    await page.evaluate(script)
+                    try:
+                        await page.wait_for_function(_READY_STATE_JS, timeout=INTERACTION_TIMEOUT)
+                    except PlaywrightTimeout:
+                        pass
+
+                for selector in kwargs.get("click_selectors", []):
+                    try:
+                        await page.click(selector)
+                    except Exception as e:
+                        self.logger.warning("Failed to click selector '%s': %s", selector, e)
+                        continue
+
+                    try:
+                        await page.wait_for_load_state("domcontentloaded", timeout=INTERACTION_TIMEOUT)
+                    except PlaywrightTimeout:
+                        pass
+
+                if kwargs.get("scroll_to_bottom", False):
+                    await self._scroll_to_bottom_async(page)
+
+                page_content = await page.content()
+
+                data = self._build_result(
+                    url, page.url, await page.title(), page_content,
+                    response.status if response else None
+                )
+
+                selectors = self._get_selectors(kwargs)
+                if selectors and self.native_selectors:
+                    data["extracted_data"] = await page.evaluate(
+                        _EXTRACT_JS, [selectors, kwargs.get("extract_all", False), self.clean_whitespace]
+                    )
+                elif selectors:
+                    # Parse in a worker process so other pages keep loading meanwhile
+                    data["extracted_data"] = await loop.run_in_executor(
+                        parse_pool, _parse_and_extract,
+                        page_content, selectors, kwargs.get("extract_all", False), self.clean_whitespace
+                    )
+
+                if self.take_screenshots:
+                    await self._take_screenshot_async(page, url)
+
+                if self.reuse_cookies:
+                    self._store_cookies(url, await context.cookies(page.url))
+
+                self._handle_request_success(url)
+                self.stats["total_items_scraped"] += 1
+
+                return data
+
+            except Exception as e:
+                self.logger.error("Error scraping %s: %s", url, e)
+
+                if page and self.screenshot_on_error:
+                    await self._take_screenshot_async(page, url, suffix="_error")
+
+                self._handle_request_failure(url, e)
+
+                return {
+                    "url": url,
+                    "error": str(e),
+                    "success": False
+                }
+
+            finally:
+                if page:
+                    await page.close()
+
+    async def _new_context_async(self, browser: Any, host: str) -> AsyncBrowserContext:
+        """
+        Create a browser context for one host in a batch.
+
+        Args:
+            browser: Async Playwright Browser instance
+            host: Host (netloc) whose pages the context will load
+
+        Returns:
+            Async BrowserContext instance
+        """
+        context = await browser.new_context(**self._context_options())
+        context.set_default_timeout(self.page_load_timeout)
+        context.set_default_navigation_timeout(self.nav_timeout)
+
+        if self.block_resources:
+            await context.route("**/*", self._route_resource_async)
+
+        if self.reuse_cookies:
+            cookies = self._storage_cache.get(host)
+            if cookies:
+                await context.add_cookies(cookies)
+
+        return context
+
+    async def _scrape_many_async(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Scrape multiple URLs concurrently, sharing a context per host.
+
+        URLs are grouped by host, and each group is split into runs of up
+        to scraping.context_max_uses URLs that share one context, so pages
+        on a host reuse its connections and TLS sessions.
+
+        Args:
+            urls: List of URLs to scrape
+            **kwargs: Additional arguments passed to _scrape_async()
+
+        Returns:
+            List of dictionaries containing scraped data, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # Bounds open contexts as well; a context is only useful with a free page slot
+        context_slots = asyncio.Semaphore(self.max_concurrency)
+
+        # Worker processes for parsing, only needed when extracting; spawned
+        # rather than forked, since forking here would copy the running event
+        # loop and Playwright's connection threads into the workers
+        parse_pool = None
+        if self._get_selectors(kwargs) and not self.native_selectors and self.parse_workers > 0:
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+
+        # Input positions of the URLs on each host
+        by_host: Dict[str, List[int]] = {}
+        for index, url in enumerate(urls):
+            by_host.setdefault(urlparse(url).netloc, []).append(index)
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+        progress = tqdm(total=len(urls), desc="Scraping") if show_progress else None
+
+        async with async_playwright() as playwright:
+            browser = await self._get_launcher(playwright).launch(headless=self.headless)
+
+            async def scrape_run(host: str, indices: List[int]) -> None:
+                async with context_slots:
+                    context = await self._new_context_async(browser, host)
+                    try:
+                        async def scrape_one(index: int) -> None:
+                            results[index] = await self._scrape_async(
+                                urls[index], semaphore, context, parse_pool, **kwargs
+                            )
+                            if progress:
+                                progress.update(1)
+
+                        await asyncio.gather(*(scrape_one(index) for index in indices))
+                    finally:
+                        await context.close()
+
+            run_size = max(1, self.context_max_uses)
+
+            try:
+                await asyncio.gather(*(
+                    scrape_run(host, indices[start:start + run_size])
+                    for host, indices in by_host.items()
+                    for start in range(0, len(indices), run_size)
+                ))
+
+            finally:
+                await browser.close()
+                if parse_pool:
+                    parse_pool.shutdown()
+                if progress:
+                    progress.close()
 
         return results
 
+    def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Scrape multiple URLs concurrently.
+
+        Pages are opened on an asyncio event loop, in one browser context
+        per host, with at most scraping.max_concurrency pages open at once.
+
+        Args:
+            urls: List of URLs to scrape
+            **kwargs: Additional arguments passed to scrape()
+
+        Returns:
+            List of dictionaries containing scraped data
+        """
+        if not urls:
+            return []
+
+        return asyncio.run(self._scrape_many_async(urls, **kwargs))
+
     def scrape_with_infinite_scroll(
         self,
         url: str,
@@ -298,7 +1145,7 @@ class PlaywrightScraper(BaseScraper):
         Args:
             url: URL to scrape
             max_scrolls: Maximum number of scrolls
-            pause_time: Time to pause between scrolls
+            pause_time: Longest time to wait for new content after a scroll
             **kwargs: Additional arguments
 
         Returns:
@@ -308,25 +1155,18 @@ class PlaywrightScraper(BaseScraper):
         page = None
 
         try:
-            context = self._create_context()
+            context = self._acquire_context(url)
             page = context.new_page()
 
-            page.goto(url)
+            self._goto(page, url)
 
             # Scroll multiple times
-            for i in range(max_scrolls):
-                last_height = page.evaluate("document.body.scrollHeight")
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(pause_time)
-
-                new_height = page.evaluate("document.body.scrollHeight")
-                if new_height == last_height:
-                    self.logger.info(f"Reached end of scroll at iteration {i}")
-                    break
+            scrolls = self._scroll_to_bottom(page, pause_time, max_scrolls)
+            if scrolls < max_scrolls:
+                self.logger.info("Reached end of scroll at iteration %s", scrolls)
 
             # Get final page content
             page_content = page.content()
-            soup = BeautifulSoup(page_content, "lxml")
 
             data = {
                 "url": url,
@@ -335,11 +1175,9 @@ class PlaywrightScraper(BaseScraper):
             }
 
             # Extract data
-            selectors = kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
+            selectors = self._get_selectors(kwargs)
             if selectors:
-                from web_scraper.scrapers.static_scraper import StaticScraper
-                static_scraper = StaticScraper(self.config)
-                data["extracted_data"] = static_scraper._extract_with_css(soup, selectors, kwargs.get("extract_all", True))
+                data["extracted_data"] = self._extract_from_page(page, page_content, selectors, kwargs.get("extract_all", True))
 
             return data
 
@@ -347,11 +1185,17 @@ class PlaywrightScraper(BaseScraper):
             if page:
                 page.close()
             if context:
-                context.close()
-
-    def __del__(self):
-        """Cleanup when scraper is destroyed."""
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+                self._release_context(context)
+
+    def __enter__(self):
+        """Context manager entry; starts the browser."""
+        super().__enter__()
+        self._init_browser()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; closes the browser."""
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
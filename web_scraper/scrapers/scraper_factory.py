@@ -4,11 +4,38 @@ Scraper factory for automatic scraper selection.
 Analyzes websites and selects the most appropriate scraper.
 """
 
+import asyncio
+import httpx
 import requests
-from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 import re
 
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401  (lets httpx and urllib3 decode br)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
 from web_scraper.scrapers.base_scraper import BaseScraper
 from web_scraper.scrapers.static_scraper import StaticScraper
 from web_scraper.scrapers.selenium_scraper import SeleniumScraper
@@ -16,6 +43,87 @@ from web_scraper.scrapers.playwright_scraper import PlaywrightScraper
 from web_scraper.scrapers.api_scraper import APIScraper
 
 
+# Bytes of a page read for detection; enough for <head> scripts and root divs
+DETECTION_SAMPLE_BYTES = 65536
+
+# Hosts whose detected scraper type is remembered
+MAX_DETECTION_CACHE = 1024
+
+# Concurrent connections used by batch detection
+MAX_DETECTION_CONNECTIONS = 1024
+
+# Request headers for detection fetches
+_DETECTION_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Encoding": "br, gzip, deflate" if BROTLI_AVAILABLE else "gzip, deflate",
+    "Range": f"bytes=0-{DETECTION_SAMPLE_BYTES - 1}"
+}
+
+# Connect and read timeouts for detection fetches
+_DETECTION_TIMEOUT = httpx.Timeout(7.0, connect=3.0)
+
+# URL patterns that suggest an API endpoint
+_API_URL_RE = re.compile(
+    "|".join([
+        r'/api/',
+        r'/rest/',
+        r'/v\d+/',
+        r'/graphql',
+        r'\.json$',
+        r'\.xml$',
+    ]),
+    re.IGNORECASE
+)
+
+# Common JavaScript framework indicators
+_FRAMEWORK_RE = re.compile(
+    "|".join([
+        r'react',
+        r'vue\.js',
+        r'angular',
+        r'next\.js',
+        r'nuxt',
+        r'gatsby',
+        r'svelte',
+        r'ember'
+    ]),
+    re.IGNORECASE
+)
+
+# Heavy AJAX usage indicators
+_AJAX_RE = re.compile(
+    "|".join([
+        r'xhr',
+        r'fetch\(',
+        r'axios',
+        r'$.ajax',
+        r'$.get',
+        r'$.post'
+    ]),
+    re.IGNORECASE
+)
+
+# Single-page application indicators (case-sensitive)
+_SPA_RE = re.compile(
+    "|".join([
+        r'<div[^>]+id=["\']root["\']',
+        r'<div[^>]+id=["\']app["\']',
+        r'__NEXT_DATA__',
+        r'__NUXT__',
+    ])
+)
+
+# Script/style blocks (skipped whole) or elements with direct text content,
+# so static content is counted in one pass without stripping scripts first
+_CONTENT_SCAN_RE = re.compile(
+    r'<(script|style)[^>]*>.*?</\1>|<(p|div|article|section|h\d)[^>]*>[^<]+</\2>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# Content elements below which a page is assumed to render client-side
+MIN_STATIC_CONTENT_TAGS = 5
+
+
 class ScraperFactory:
     """
     Factory for creating the appropriate scraper based on URL and content type.
@@ -23,6 +131,9 @@ class ScraperFactory:
     Automatically detects whether to use static, dynamic, or API scraper.
     """
 
+    # Detection client shared by all factories, so connections are reused
+    _CLIENT: Optional[httpx.Client] = None
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize scraper factory.
@@ -32,6 +143,12 @@ class ScraperFactory:
         """
         self.config = config or {}
 
+        # Detected scraper type per (scheme, host); pages on a site rarely differ
+        self._host_types: Dict[Tuple[str, str], str] = {}
+
+        # Disk-backed detection cache, used with advanced.enable_cache
+        self._cached_session: Optional[requests.Session] = None
+
     def create_scraper(
         self,
         url: str,
@@ -100,38 +217,257 @@ class ScraperFactory:
         if self._is_api_endpoint(url):
             return "api"
 
+        parsed = urlparse(url)
+        host_key = (parsed.scheme, parsed.netloc)
+
+        detected_type = self._host_types.get(host_key)
+        if detected_type is not None:
+            return detected_type
+
         # Try to fetch page and analyze
         try:
-            response = requests.get(
-                url,
-                headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
-                timeout=10
+            content_type, html_content = self._fetch_sample(url)
+        except Exception:
+            # On error, default to static scraper
+            return "static"
+
+        detected_type = self._classify(url, content_type, html_content)
+        self._remember(host_key, detected_type)
+
+        return detected_type
+
+    def detect_scraper_types(self, urls: List[str]) -> List[str]:
+        """
+        Detect the best scraper type for many URLs at once.
+
+        Pages are fetched concurrently, one per host, since pages on a
+        site rarely need different scrapers. Called from a running event
+        loop, where asyncio.run is unavailable, URLs are detected one by
+        one with detect_scraper_type() instead.
+
+        Args:
+            urls: URLs to analyze
+
+        Returns:
+            Scraper types, one per input URL
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._detect_many_async(urls))
+
+        return [self.detect_scraper_type(url) for url in urls]
+
+    async def _detect_many_async(self, urls: List[str]) -> List[str]:
+        """
+        Detect scraper types concurrently on an event loop.
+
+        Args:
+            urls: URLs to analyze
+
+        Returns:
+            Scraper types, one per input URL
+        """
+        # One URL to fetch per host that isn't known yet
+        to_fetch: Dict[Tuple[str, str], str] = {}
+        for url in urls:
+            if self._is_api_endpoint(url):
+                continue
+            parsed = urlparse(url)
+            host_key = (parsed.scheme, parsed.netloc)
+            if host_key not in self._host_types:
+                to_fetch.setdefault(host_key, url)
+
+        if to_fetch:
+            limits = httpx.Limits(max_connections=MAX_DETECTION_CONNECTIONS)
+            async with httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=limits,
+                timeout=_DETECTION_TIMEOUT,
+                follow_redirects=True
+            ) as client:
+                async def detect(host_key: Tuple[str, str], url: str) -> None:
+                    try:
+                        content_type, html_content = await self._fetch_sample_async(client, url)
+                    except Exception:
+                        return
+                    self._remember(host_key, self._classify(url, content_type, html_content))
+
+                await asyncio.gather(*(detect(host_key, url) for host_key, url in to_fetch.items()))
+
+        # Hosts that failed to load default to static, as in detect_scraper_type()
+        return [self._cached_type(url) for url in urls]
+
+    def _cached_type(self, url: str) -> str:
+        """
+        Get the detected type for a URL without fetching it.
+
+        Args:
+            url: URL to look up
+
+        Returns:
+            Scraper type, "static" if the host is unknown
+        """
+        if self._is_api_endpoint(url):
+            return "api"
+
+        parsed = urlparse(url)
+        return self._host_types.get((parsed.scheme, parsed.netloc), "static")
+
+    def _classify(self, url: str, content_type: str, html_content: str) -> str:
+        """
+        Choose a scraper type from a fetched page sample.
+
+        Args:
+            url: URL of the page
+            content_type: Lowercased Content-Type of the response
+            html_content: Start of the response body
+
+        Returns:
+            Scraper type (static, playwright, api)
+        """
+        # Check content type
+        if "application/json" in content_type or "application/xml" in content_type:
+            return "api"
+
+        # Analyze HTML content; prefer Playwright for heavy JavaScript usage
+        if "text/html" in content_type and self._has_heavy_javascript(html_content, url):
+            return "playwright"
+
+        # Default to static scraper
+        return "static"
+
+    def _remember(self, host_key: Tuple[str, str], detected_type: str) -> None:
+        """
+        Cache the detected scraper type for a host.
+
+        Args:
+            host_key: (scheme, netloc) of the host
+            detected_type: Detected scraper type
+        """
+        if len(self._host_types) >= MAX_DETECTION_CACHE:
+            self._host_types.pop(next(iter(self._host_types)))
+        self._host_types[host_key] = detected_type
+
+    @classmethod
+    def _client(cls) -> httpx.Client:
+        """
+        Get the shared, connection-pooled client used for detection.
+
+        Uses HTTP/2 when the h2 package is installed.
+
+        Returns:
+            httpx Client instance
+        """
+        if cls._CLIENT is None:
+            transport = httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=2,
+                limits=httpx.Limits(max_keepalive_connections=64)
+            )
+            cls._CLIENT = httpx.Client(transport=transport, timeout=_DETECTION_TIMEOUT, follow_redirects=True)
+
+        return cls._CLIENT
+
+    def _cache_session(self) -> Optional[requests.Session]:
+        """
+        Get the disk-cached session for detection fetches, if enabled.
+
+        With advanced.enable_cache set and requests-cache installed, samples
+        are cached on disk under advanced.cache_dir for advanced.cache_expiry
+        seconds. Expired entries are revalidated with ETag/Last-Modified.
+
+        Returns:
+            requests-cache CachedSession, or None when caching is off
+        """
+        advanced_config = self.config.get("advanced", {})
+        if not advanced_config.get("enable_cache", False) or not REQUESTS_CACHE_AVAILABLE:
+            return None
+
+        if self._cached_session is None:
+            cache_dir = Path(advanced_config.get("cache_dir", ".scraper_cache"))
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            session = requests_cache.CachedSession(
+                cache_name=str(cache_dir / "detect_cache"),
+                backend="sqlite",
+                expire_after=advanced_config.get("cache_expiry", 3600),
+                # Ranged samples come back as 206
+                allowable_codes=(200, 206)
             )
+            adapter = HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.3))
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._cached_session = session
+
+        return self._cached_session
 
+    def _fetch_sample(self, url: str) -> Tuple[str, str]:
+        """
+        Fetch the start of a page for detection.
+
+        Only the first DETECTION_SAMPLE_BYTES of the body are read, and the
+        connection is released without downloading the rest.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Tuple of (lowercased Content-Type, decoded body sample)
+        """
+        session = self._cache_session()
+        if session is not None:
+            with session.get(url, headers=_DETECTION_HEADERS, stream=True, timeout=(3, 7)) as response:
+                content_type = response.headers.get("Content-Type", "").lower()
+                sample = response.raw.read(DETECTION_SAMPLE_BYTES, decode_content=True)
+
+            return content_type, sample.decode(response.encoding or "utf-8", errors="replace")
+
+        with self._client().stream("GET", url, headers=_DETECTION_HEADERS) as response:
             content_type = response.headers.get("Content-Type", "").lower()
+            sample = self._read_sample(response.iter_bytes())
 
-            # Check content type
-            if "application/json" in content_type or "application/xml" in content_type:
-                return "api"
+        return content_type, sample.decode(response.encoding or "utf-8", errors="replace")
 
-            # Analyze HTML content
-            if "text/html" in content_type:
-                html_content = response.text
+    def _read_sample(self, chunks: Iterator[bytes]) -> bytes:
+        """
+        Read up to DETECTION_SAMPLE_BYTES from decoded body chunks.
 
-                # Check for heavy JavaScript usage
-                if self._has_heavy_javascript(html_content, url):
-                    # Prefer Playwright for modern sites
-                    return "playwright"
+        Args:
+            chunks: Decoded body chunks
 
-                # Default to static scraper
-                return "static"
+        Returns:
+            Start of the body
+        """
+        sample = bytearray()
+        for chunk in chunks:
+            sample += chunk
+            if len(sample) >= DETECTION_SAMPLE_BYTES:
+                break
 
-            # Default
-            return "static"
+        return bytes(sample[:DETECTION_SAMPLE_BYTES])
 
-        except Exception:
-            # On error, default to static scraper
-            return "static"
+    async def _fetch_sample_async(self, client: httpx.AsyncClient, url: str) -> Tuple[str, str]:
+        """
+        Fetch the start of a page for detection on the event loop.
+
+        Args:
+            client: Async HTTP client
+            url: URL to fetch
+
+        Returns:
+            Tuple of (lowercased Content-Type, decoded body sample)
+        """
+        async with client.stream("GET", url, headers=_DETECTION_HEADERS) as response:
+            content_type = response.headers.get("Content-Type", "").lower()
+
+            sample = bytearray()
+            async for chunk in response.aiter_bytes():
+                sample += chunk
+                if len(sample) >= DETECTION_SAMPLE_BYTES:
+                    break
+
+        return content_type, sample[:DETECTION_SAMPLE_BYTES].decode(response.encoding or "utf-8", errors="replace")
 
     def _is_api_endpoint(self, url: str) -> bool:
         """
@@ -144,18 +480,8 @@ class ScraperFactory:
             True if likely API, False otherwise
         """
         # Check URL patterns
-        api_patterns = [
-            r'/api/',
-            r'/rest/',
-            r'/v\d+/',
-            r'/graphql',
-            r'\.json$',
-            r'\.xml$',
-        ]
-
-        for pattern in api_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return True
+        if _API_URL_RE.search(url):
+            return True
 
         # Check subdomain
         parsed = urlparse(url)
@@ -175,64 +501,29 @@ class ScraperFactory:
         Returns:
             True if heavy JavaScript usage detected
         """
-        # Common JavaScript framework indicators
-        js_frameworks = [
-            r'react',
-            r'vue\.js',
-            r'angular',
-            r'next\.js',
-            r'nuxt',
-            r'gatsby',
-            r'svelte',
-            r'ember'
-        ]
-
-        html_lower = html.lower()
-
         # Check for framework indicators
-        for framework in js_frameworks:
-            if re.search(framework, html_lower):
-                return True
+        if _FRAMEWORK_RE.search(html):
+            return True
 
         # Check for heavy AJAX usage
-        ajax_indicators = [
-            r'xhr',
-            r'fetch\(',
-            r'axios',
-            r'$.ajax',
-            r'$.get',
-            r'$.post'
-        ]
-
-        for indicator in ajax_indicators:
-            if re.search(indicator, html_lower):
-                return True
+        if _AJAX_RE.search(html):
+            return True
 
         # Check for single-page application indicators
-        spa_indicators = [
-            r'<div[^>]+id=["\']root["\']',
-            r'<div[^>]+id=["\']app["\']',
-            r'__NEXT_DATA__',
-            r'__NUXT__',
-        ]
-
-        for indicator in spa_indicators:
-            if re.search(indicator, html):
-                return True
-
-        # Check for minimal static content (indicates dynamic rendering)
-        # Remove scripts and styles
-        cleaned_html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        cleaned_html = re.sub(r'<style[^>]*>.*?</style>', '', cleaned_html, flags=re.DOTALL | re.IGNORECASE)
-
-        # Check for actual content
-        content_tags = len(re.findall(r'<(p|div|article|section|h\d)[^>]*>[^<]+</\1>', cleaned_html, re.IGNORECASE))
-
-        if content_tags < 5:
-            # Very little static content, likely dynamic
+        if _SPA_RE.search(html):
             return True
 
-        return False
+        # Check for minimal static content (indicates dynamic rendering),
+        # stopping as soon as enough content elements are found
+        content_tags = 0
+        for match in _CONTENT_SCAN_RE.finditer(html):
+            if match.group(2):
+                content_tags += 1
+                if content_tags >= MIN_STATIC_CONTENT_TAGS:
+                    return False
+
+        # Very little static content, likely dynamic
+        return True
 
     def get_recommended_scraper_info(self, url: str) -> Dict[str, Any]:
         """
@@ -4,8 +4,16 @@ Dynamic content scraper using Selenium.
 Handles JavaScript-heavy sites with Selenium WebDriver.
 """
 
+import base64
+import copy
+import hashlib
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, ClassVar, Dict, List, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -15,13 +23,82 @@ from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
+from selenium.webdriver.common.driver_finder import DriverFinder
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 from web_scraper.scrapers.base_scraper import BaseScraper
+from web_scraper.scrapers.static_scraper import StaticScraper
+
+# DriverFinder(service, options).get_driver_path() appeared in Selenium 4.20;
+# older releases only offer the static DriverFinder.get_path
+DRIVER_FINDER_INSTANCE_API = hasattr(DriverFinder, "get_driver_path")
+
+
+# Extraction results kept for repeated page sources
+MAX_PARSE_CACHE = 128
+
+# Resets page state before a pooled driver is handed to the next URL
+_CLEAR_STORAGE_JS = (
+    "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+)
+
+# Page activity snapshot: [readyState, active jQuery requests, unfinished
+# resource entries, total resource entries]
+_AJAX_STATE_JS = """
+var resources = window.performance ? performance.getEntriesByType('resource') : [];
+return [
+    document.readyState,
+    typeof jQuery === 'undefined' ? 0 : jQuery.active,
+    resources.filter(function (r) { return !r.responseEnd; }).length,
+    resources.length
+];
+"""
+
+# Scrolls to the bottom and reports the new height in one round trip
+_SCROLL_JS = "window.scrollTo(0, document.body.scrollHeight); return document.body.scrollHeight;"
+
+
+def _page_digest(page_source: str) -> bytes:
+    """
+    Hash a page source for the extraction cache.
+
+    Uses xxHash when installed, otherwise BLAKE2b.
+
+    Args:
+        page_source: Rendered HTML
+
+    Returns:
+        128-bit digest
+    """
+    data = page_source.encode("utf-8", errors="surrogatepass")
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128_digest(data)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _quit_drivers(drivers: List[webdriver.Remote]) -> None:
+    """
+    Quit every driver in the list, emptying it.
+
+    Module-level so it can be registered as a finalizer without keeping
+    the scraper alive.
+
+    Args:
+        drivers: Live WebDriver instances
+    """
+    while drivers:
+        try:
+            drivers.pop().quit()
+        except Exception:
+            pass
 
 
 class SeleniumScraper(BaseScraper):
@@ -31,6 +108,10 @@ class SeleniumScraper(BaseScraper):
     Handles JavaScript rendering, AJAX requests, and dynamic content loading.
     """
 
+    # Driver and browser binaries resolved by Selenium Manager, per browser,
+    # shared by all instances
+    _binary_paths: ClassVar[Dict[str, Dict[str, str]]] = {}
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize Selenium scraper.
@@ -46,6 +127,11 @@ class SeleniumScraper(BaseScraper):
         self.headless = scraping_config.get("headless", True)
         self.page_load_timeout = scraping_config.get("page_load_timeout", 60)
 
+        # "eager" returns from get() at DOMContentLoaded instead of waiting for
+        # every subresource; the ready-state waits below follow the same rule
+        self.page_load_strategy = scraping_config.get("page_load_strategy", "eager")
+        self._ready_states = ("complete",) if self.page_load_strategy == "normal" else ("interactive", "complete")
+
         # AJAX configuration
         advanced_config = self.config.get("advanced", {})
         self.detect_ajax = advanced_config.get("detect_ajax", True)
@@ -55,11 +141,29 @@ class SeleniumScraper(BaseScraper):
         self.take_screenshots = advanced_config.get("take_screenshots", False)
         self.screenshot_dir = advanced_config.get("screenshot_dir", "screenshots")
         self.screenshot_on_error = advanced_config.get("screenshot_on_error", False)
+        self.screenshot_format = advanced_config.get("screenshot_format", "jpeg").lower()
+        self.screenshot_quality = int(advanced_config.get("screenshot_quality", 70))
 
-        # Driver pool for concurrent scraping
-        self.driver_pool: List[webdriver.Remote] = []
+        # Skip images and stylesheets unless screenshots need the page to render
+        self.block_resources = scraping_config.get("block_resources", True) and not self.take_screenshots
 
-        self.logger.info(f"SeleniumScraper initialized with {self.browser} browser")
+        # Driver pool, filled lazily up to one driver per worker
+        self.driver_pool_size = max(1, scraping_config.get("max_workers", 1))
+        self._driver_pool: queue.Queue = queue.Queue(maxsize=self.driver_pool_size)
+        self._drivers: List[webdriver.Remote] = []
+        self._driver_count = 0
+        self._pool_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _quit_drivers, self._drivers)
+
+        # Created on first use; shares the CSS extraction logic of StaticScraper
+        self._css_extractor: Optional[StaticScraper] = None
+
+        # Extraction results by (page digest, selectors, extract_all), so
+        # identical pages (error templates, unchanged feeds) are parsed once
+        self._parse_cache: OrderedDict = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+
+        self.logger.info("SeleniumScraper initialized with %s browser", self.browser)
 
     def _create_driver(self) -> webdriver.Remote:
         """
@@ -77,12 +181,20 @@ class SeleniumScraper(BaseScraper):
                 options.add_argument("--disable-dev-shm-usage")
                 options.add_argument("--disable-gpu")
                 options.add_argument("--window-size=1920,1080")
+                options.page_load_strategy = self.page_load_strategy
+
+                if self.block_resources:
+                    options.add_experimental_option("prefs", {
+                        "profile.managed_default_content_settings.images": 2,
+                        "profile.managed_default_content_settings.stylesheets": 2
+                    })
 
                 # Add user agent
                 user_agent = self.ua_rotator.get_chrome()
                 options.add_argument(f"user-agent={user_agent}")
 
-                service = ChromeService(ChromeDriverManager().install())
+                service = ChromeService()
+                self._resolve_binaries(service, options)
                 driver = webdriver.Chrome(service=service, options=options)
 
             elif self.browser == "firefox":
@@ -91,12 +203,18 @@ class SeleniumScraper(BaseScraper):
                     options.add_argument("--headless")
                 options.add_argument("--width=1920")
                 options.add_argument("--height=1080")
+                options.page_load_strategy = self.page_load_strategy
+
+                if self.block_resources:
+                    options.set_preference("permissions.default.image", 2)
+                    options.set_preference("permissions.default.stylesheet", 2)
 
                 # Add user agent
                 user_agent = self.ua_rotator.get_firefox()
                 options.set_preference("general.useragent.override", user_agent)
 
-                service = FirefoxService(GeckoDriverManager().install())
+                service = FirefoxService()
+                self._resolve_binaries(service, options)
                 driver = webdriver.Firefox(service=service, options=options)
 
             else:
@@ -107,9 +225,128 @@ class SeleniumScraper(BaseScraper):
             return driver
 
         except Exception as e:
-            self.logger.error(f"Failed to create WebDriver: {e}")
+            self.logger.error("Failed to create WebDriver: %s", e)
             raise
 
+    def _resolve_binaries(self, service: Any, options: Any) -> None:
+        """
+        Point a service and options at the driver and browser binaries.
+
+        Selenium Manager (bundled with Selenium) is run only for the first
+        driver of each browser type; its result is reused afterwards. On
+        Selenium releases before 4.20, which lack the DriverFinder instance
+        API, nothing is cached and Selenium resolves the binaries itself.
+
+        Args:
+            service: Chrome or Firefox Service instance
+            options: Matching browser options
+        """
+        if not DRIVER_FINDER_INSTANCE_API:
+            return
+
+        paths = SeleniumScraper._binary_paths.get(self.browser)
+        if paths is None:
+            finder = DriverFinder(service, options)
+            paths = {"driver_path": finder.get_driver_path(), "browser_path": finder.get_browser_path()}
+            SeleniumScraper._binary_paths[self.browser] = paths
+
+        service.path = paths["driver_path"]
+        if paths["browser_path"]:
+            options.binary_location = paths["browser_path"]
+
+    def _acquire_driver(self) -> webdriver.Remote:
+        """
+        Take a driver from the pool, creating one if the pool is not yet full.
+
+        Blocks until a driver is released when all pooled drivers are in use.
+
+        Returns:
+            WebDriver instance
+        """
+        try:
+            return self._driver_pool.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            create = self._driver_count < self.driver_pool_size
+            if create:
+                self._driver_count += 1
+
+        if not create:
+            return self._driver_pool.get()
+
+        try:
+            driver = self._create_driver()
+        except Exception:
+            with self._pool_lock:
+                self._driver_count -= 1
+            raise
+
+        self._drivers.append(driver)
+        return driver
+
+    def _release_driver(self, driver: webdriver.Remote) -> None:
+        """
+        Reset a driver and return it to the pool.
+
+        Args:
+            driver: WebDriver instance taken from the pool
+        """
+        if self._reset_driver(driver):
+            self._driver_pool.put(driver)
+
+    def _reset_driver(self, driver: webdriver.Remote) -> bool:
+        """
+        Clear a driver's cookies and storage before its next URL.
+
+        Drivers that fail to reset (e.g. a crashed browser) are quit instead.
+
+        Args:
+            driver: WebDriver instance taken from the pool
+
+        Returns:
+            True if the driver can be reused, False if it was discarded
+        """
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(_CLEAR_STORAGE_JS)
+        except WebDriverException as e:
+            self.logger.warning("Discarding WebDriver that failed to reset: %s", e)
+            self._discard_driver(driver)
+            return False
+
+        return True
+
+    def _discard_driver(self, driver: webdriver.Remote) -> None:
+        """
+        Quit a driver and free its pool slot.
+
+        Args:
+            driver: WebDriver instance taken from the pool
+        """
+        with self._pool_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._driver_count -= 1
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Quit all pooled drivers."""
+        while True:
+            try:
+                self._driver_pool.get_nowait()
+            except queue.Empty:
+                break
+
+        with self._pool_lock:
+            _quit_drivers(self._drivers)
+            self._driver_count = 0
+
     def _wait_for_page_load(self, driver: webdriver.Remote, timeout: Optional[int] = None) -> None:
         """
         Wait for page to fully load.
@@ -123,22 +360,61 @@ class SeleniumScraper(BaseScraper):
         try:
             # Wait for document ready state
             WebDriverWait(driver, timeout).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
+                lambda d: d.execute_script("return document.readyState") in self._ready_states
             )
 
             # Wait for AJAX if enabled
             if self.detect_ajax:
-                time.sleep(self.ajax_wait_time)
-                # Wait for jQuery if present
-                try:
-                    WebDriverWait(driver, 5).until(
-                        lambda d: d.execute_script("return typeof jQuery != 'undefined' ? jQuery.active == 0 : true")
-                    )
-                except:
-                    pass  # jQuery not present
+                self._wait_for_ajax(driver)
 
         except TimeoutException:
-            self.logger.warning(f"Page load timeout after {timeout} seconds")
+            self.logger.warning("Page load timeout after %s seconds", timeout)
+
+    def _wait_for_ajax(self, driver: webdriver.Remote) -> None:
+        """
+        Wait until AJAX activity settles, for at most ajax_wait_time seconds.
+
+        Returns as soon as the page looks idle; on timeout the page is used
+        as it is.
+
+        Args:
+            driver: WebDriver instance
+        """
+        last_resources = [-1]
+
+        def settled(d: webdriver.Remote) -> bool:
+            state = d.execute_script(_AJAX_STATE_JS)
+            idle = self._is_ajax_idle(state, last_resources[0])
+            last_resources[0] = state[3]
+            return idle
+
+        try:
+            WebDriverWait(driver, self.ajax_wait_time).until(settled)
+        except TimeoutException:
+            self.logger.debug("AJAX still active after %s seconds", self.ajax_wait_time)
+
+    def _is_ajax_idle(self, state: List[Any], last_resources: int) -> bool:
+        """
+        Decide whether a page activity snapshot counts as idle.
+
+        The page is idle once it has loaded, jQuery has no active requests
+        and no resource entries were added since the previous poll.
+        Override this for sites that need a different settling rule.
+
+        Args:
+            state: Snapshot returned by the activity script
+            last_resources: Resource entry count at the previous poll (-1 on the first)
+
+        Returns:
+            True if the page is idle
+        """
+        ready_state, jquery_active, pending, resources = state
+        return (
+            ready_state in self._ready_states
+            and not jquery_active
+            and not pending
+            and resources == last_resources
+        )
 
     def scrape(self, url: str, **kwargs) -> Dict[str, Any]:
         """
@@ -152,11 +428,27 @@ class SeleniumScraper(BaseScraper):
                 - scroll_to_bottom: Whether to scroll to page bottom
                 - execute_script: JavaScript to execute
                 - click_selectors: List of selectors to click
+                - include_html: Whether to return the page HTML (default: only
+                  when no selectors are given)
 
         Returns:
             Dictionary containing scraped data
         """
-        driver = None
+        return self._scrape_with_driver(None, url, **kwargs)
+
+    def _scrape_with_driver(self, driver: Optional[webdriver.Remote], url: str, **kwargs) -> Dict[str, Any]:
+        """
+        Scrape a single URL with a given driver.
+
+        Args:
+            driver: Driver to use, or None to take one from the pool for this URL
+            url: URL to scrape
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Dictionary containing scraped data
+        """
+        pooled = driver is None
 
         try:
             # Apply rate limiting
@@ -166,13 +458,14 @@ class SeleniumScraper(BaseScraper):
             if not self._check_robots_txt(url):
                 raise PermissionError(f"Robots.txt disallows scraping: {url}")
 
-            # Create driver
-            driver = self._create_driver()
+            # Take a driver from the pool
+            if pooled:
+                driver = self._acquire_driver()
 
             self.stats["total_requests"] += 1
 
             # Navigate to URL
-            self.logger.debug(f"Navigating to {url}")
+            self.logger.debug("Navigating to %s", url)
             driver.get(url)
 
             # Wait for page load
@@ -187,7 +480,7 @@ class SeleniumScraper(BaseScraper):
                         EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
                     )
                 except TimeoutException:
-                    self.logger.warning(f"Timeout waiting for selector: {wait_for}")
+                    self.logger.warning("Timeout waiting for selector: %s", wait_for)
 
             # Execute custom JavaScript
             script = kwargs.get("execute_script")
@@ -203,33 +496,30 @@ class SeleniumScraper(BaseScraper):
                     element.click()
                     time.sleep(1)
                 except Exception as e:
-                    self.logger.warning(f"Failed to click selector '{selector}': {e}")
+                    self.logger.warning("Failed to click selector '%s': %s", selector, e)
 
             # Scroll to bottom if requested
             if kwargs.get("scroll_to_bottom", False):
                 self._scroll_to_bottom(driver)
 
-            # Get page source
-            page_source = driver.page_source
-            current_url = driver.current_url
-
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(page_source, "lxml")
-
             # Extract data
             data = {
                 "url": url,
-                "final_url": current_url,
-                "title": driver.title,
-                "html": page_source
+                "final_url": driver.current_url,
+                "title": driver.title
             }
 
-            # Extract using CSS selectors
+            # Page source is only transferred from the browser when needed
             selectors = kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
+            include_html = self._include_html(kwargs, bool(selectors))
+            page_source = driver.page_source if selectors or include_html else None
+
+            # Extract using CSS selectors
             if selectors:
-                from web_scraper.scrapers.static_scraper import StaticScraper
-                static_scraper = StaticScraper(self.config)
-                data["extracted_data"] = static_scraper._extract_with_css(soup, selectors, kwargs.get("extract_all", False))
+                data["extracted_data"] = self._extract_page(page_source, selectors, kwargs.get("extract_all", False))
+
+            if include_html:
+                data["html"] = page_source
 
             # Take screenshot if enabled
             if self.take_screenshots:
@@ -241,7 +531,7 @@ class SeleniumScraper(BaseScraper):
             return data
 
         except Exception as e:
-            self.logger.error(f"Error scraping {url}: {e}")
+            self.logger.error("Error scraping %s: %s", url, e)
 
             # Take screenshot on error
             if driver and self.screenshot_on_error:
@@ -259,8 +549,55 @@ class SeleniumScraper(BaseScraper):
             }
 
         finally:
-            if driver:
-                driver.quit()
+            if pooled and driver:
+                self._release_driver(driver)
+
+    def _extract_page(self, page_source: str, selectors: Dict[str, str], extract_all: bool = False) -> Dict[str, Any]:
+        """
+        Extract data from a page source, reusing results for identical pages.
+
+        Args:
+            page_source: Rendered HTML
+            selectors: Dictionary of field_name: selector pairs
+            extract_all: Whether to extract all matches
+
+        Returns:
+            Dictionary of extracted data
+        """
+        key = (_page_digest(page_source), tuple(selectors.items()), extract_all)
+
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+                return copy.deepcopy(cached)
+
+        soup = BeautifulSoup(page_source, "lxml")
+        data = self._extract_with_css(soup, selectors, extract_all)
+
+        with self._parse_cache_lock:
+            self._parse_cache[key] = copy.deepcopy(data)
+            if len(self._parse_cache) > MAX_PARSE_CACHE:
+                self._parse_cache.popitem(last=False)
+
+        return data
+
+    def _extract_with_css(self, soup: BeautifulSoup, selectors: Dict[str, str], extract_all: bool = False) -> Dict[str, Any]:
+        """
+        Extract data using CSS selectors.
+
+        Args:
+            soup: BeautifulSoup object
+            selectors: Dictionary of field_name: selector pairs
+            extract_all: Whether to extract all matches
+
+        Returns:
+            Dictionary of extracted data
+        """
+        if self._css_extractor is None:
+            self._css_extractor = StaticScraper(self.config)
+
+        return self._css_extractor._extract_with_css(soup, selectors, extract_all)
 
     def _scroll_to_bottom(self, driver: webdriver.Remote, pause_time: float = 2.0) -> None:
         """
@@ -270,15 +607,13 @@ class SeleniumScraper(BaseScraper):
             driver: WebDriver instance
             pause_time: Time to pause between scrolls
         """
-        last_height = driver.execute_script("return document.body.scrollHeight")
+        last_height = driver.execute_script(_SCROLL_JS)
 
         while True:
-            # Scroll down
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             time.sleep(pause_time)
 
-            # Calculate new height
-            new_height = driver.execute_script("return document.body.scrollHeight")
+            # Scroll down again and measure the new height
+            new_height = driver.execute_script(_SCROLL_JS)
 
             # Break if no more content
             if new_height == last_height:
@@ -296,21 +631,30 @@ class SeleniumScraper(BaseScraper):
             suffix: Suffix for filename
         """
         try:
-            from pathlib import Path
-            import hashlib
-
             screenshot_dir = Path(self.screenshot_dir)
             screenshot_dir.mkdir(parents=True, exist_ok=True)
 
             # Create filename from URL hash
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:10]
-            filename = screenshot_dir / f"screenshot_{url_hash}{suffix}.png"
+            url_hash = hashlib.blake2b(url.encode(), digest_size=5).hexdigest()
+
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Chromium: capture in one DevTools command and write the bytes directly
+                params = {"format": self.screenshot_format, "captureBeyondViewport": True}
+                if self.screenshot_format == "jpeg":
+                    params["quality"] = self.screenshot_quality
+                image = driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"]
+
+                extension = "jpg" if self.screenshot_format == "jpeg" else "png"
+                filename = screenshot_dir / f"screenshot_{url_hash}{suffix}.{extension}"
+                filename.write_bytes(base64.b64decode(image))
+            else:
+                filename = screenshot_dir / f"screenshot_{url_hash}{suffix}.png"
+                driver.save_screenshot(str(filename))
 
-            driver.save_screenshot(str(filename))
-            self.logger.info(f"Screenshot saved: {filename}")
+            self.logger.info("Screenshot saved: %s", filename)
 
         except Exception as e:
-            self.logger.warning(f"Failed to save screenshot: {e}")
+            self.logger.warning("Failed to save screenshot: %s", e)
 
     def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
         """
@@ -333,9 +677,27 @@ class SeleniumScraper(BaseScraper):
         # Sequential scraping (recommended for Selenium)
         if max_workers == 1:
             iterator = tqdm(urls, desc="Scraping") if show_progress else urls
-            for url in iterator:
-                result = self.scrape(url, **kwargs)
-                results.append(result)
+            driver = None
+
+            try:
+                for url in iterator:
+                    # One driver serves the whole run; it is replaced only if it breaks
+                    if driver is None:
+                        try:
+                            driver = self._acquire_driver()
+                        except Exception:
+                            # scrape() reports the failure for this URL
+                            results.append(self.scrape(url, **kwargs))
+                            continue
+
+                    results.append(self._scrape_with_driver(driver, url, **kwargs))
+
+                    if not self._reset_driver(driver):
+                        driver = None
+
+            finally:
+                if driver:
+                    self._driver_pool.put(driver)
 
         # Concurrent scraping (use with caution - resource intensive)
         else:
@@ -373,40 +735,47 @@ class SeleniumScraper(BaseScraper):
         driver = None
 
         try:
-            driver = self._create_driver()
+            driver = self._acquire_driver()
             driver.get(url)
             self._wait_for_page_load(driver)
 
             # Scroll multiple times
+            last_height = driver.execute_script(_SCROLL_JS)
             for i in range(max_scrolls):
-                last_height = driver.execute_script("return document.body.scrollHeight")
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
                 time.sleep(pause_time)
 
-                new_height = driver.execute_script("return document.body.scrollHeight")
+                new_height = driver.execute_script(_SCROLL_JS)
                 if new_height == last_height:
-                    self.logger.info(f"Reached end of scroll at iteration {i}")
+                    self.logger.info("Reached end of scroll at iteration %s", i)
                     break
 
+                last_height = new_height
+
             # Get final page source
             page_source = driver.page_source
-            soup = BeautifulSoup(page_source, "lxml")
 
             data = {
                 "url": url,
-                "html": page_source,
                 "title": driver.title
             }
 
             # Extract data
             selectors = kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
             if selectors:
-                from web_scraper.scrapers.static_scraper import StaticScraper
-                static_scraper = StaticScraper(self.config)
-                data["extracted_data"] = static_scraper._extract_with_css(soup, selectors, kwargs.get("extract_all", True))
+                data["extracted_data"] = self._extract_page(page_source, selectors, kwargs.get("extract_all", True))
+
+            if self._include_html(kwargs, bool(selectors)):
+                data["html"] = page_source
 
             return data
 
         finally:
             if driver:
-                driver.quit()
+                self._release_driver(driver)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit; quits pooled drivers."""
+        try:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self.close()
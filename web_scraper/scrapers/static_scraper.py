@@ -4,16 +4,179 @@ Static HTML scraper using BeautifulSoup and requests.
 Handles static HTML pages with CSS selectors, XPath, and regex patterns.
 """
 
+import asyncio
+import logging
+import multiprocessing
 import re
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache, partial
+import httpx
 import requests
-from typing import Any, Dict, List, Optional, Union
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from bs4 import BeautifulSoup
 from lxml import html as lxml_html, etree
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
+try:
+    import h2  # noqa: F401  (enables HTTP/2 support in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 from web_scraper.scrapers.base_scraper import BaseScraper
+from web_scraper.utils.selector_cache import compile_pattern, compile_selector, compile_xpath
+
+# Chunk size for reading response bodies
+READ_CHUNK_SIZE = 65536
+
+# Extraction-only scraper used by parse worker processes, created once per
+# process (see StaticScraper._for_parsing)
+_worker_scraper: Optional["StaticScraper"] = None
+
+
+def _decode_match(match: Union[bytes, Tuple[bytes, ...], None]) -> Union[str, Tuple[str, ...], None]:
+    """
+    Decode a regex match taken from an ASCII body.
+
+    Args:
+        match: Matched bytes, a tuple of group matches, or None
+
+    Returns:
+        The same value with bytes decoded to str
+    """
+    if isinstance(match, tuple):
+        return tuple(group.decode("ascii") for group in match)
+    return match.decode("ascii") if match is not None else None
+
+
+def _compile_regex(pattern: Union[str, re.Pattern], as_bytes: bool = False) -> re.Pattern:
+    """
+    Get the compiled form of a regex field pattern.
+
+    Args:
+        pattern: Pattern string, or an already compiled pattern
+        as_bytes: Whether the pattern is matched against a raw ASCII body
+
+    Returns:
+        Compiled pattern for text, or for bytes when as_bytes is set
+    """
+    if isinstance(pattern, re.Pattern):
+        if not as_bytes or isinstance(pattern.pattern, bytes):
+            return pattern
+        # re.UNICODE is implied for text patterns and invalid for bytes ones
+        return compile_pattern(pattern.pattern.encode("ascii"), pattern.flags & ~re.UNICODE)
+    return compile_pattern(pattern.encode("ascii") if as_bytes else pattern)
+
+
+def _pattern_source(pattern: Union[str, re.Pattern]) -> Union[str, bytes]:
+    """
+    Get the source of a regex field pattern.
+
+    Args:
+        pattern: Pattern string, or an already compiled pattern
+
+    Returns:
+        The pattern string
+    """
+    return pattern.pattern if isinstance(pattern, re.Pattern) else pattern
+
+
+@lru_cache(maxsize=64)
+def _compile_prefilter(patterns: Tuple[str, ...]) -> Optional["hyperscan.Database"]:
+    """
+    Compile regex patterns into one Hyperscan database used as a prefilter.
+
+    The database is built in prefilter mode, so constructs Hyperscan cannot
+    run exactly are widened and it may over-report but never miss a match.
+    Extraction itself still uses re, so results are unchanged.
+
+    Args:
+        patterns: Regex pattern strings, in field order
+
+    Returns:
+        Compiled database, or None if Hyperscan rejects the patterns
+    """
+    flags = (
+        hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_ALLOWEMPTY
+        | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    )
+
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[pattern.encode("utf-8") for pattern in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns)
+        )
+        return database
+    except Exception:
+        return None
+
+
+class _FetchedPage:
+    """
+    Picklable stand-in for a fetched response, sent to parse worker processes.
+
+    Carries only what _build_result() reads from a response.
+    """
+
+    __slots__ = ("status_code", "headers", "content", "encoding")
+
+    def __init__(self, response: httpx.Response):
+        """
+        Copy the parts of a response needed for parsing.
+
+        Args:
+            response: Fetched response
+        """
+        self.status_code = response.status_code
+        self.headers = {"Content-Type": response.headers.get("Content-Type", "")}
+        self.content = response.content
+        self.encoding = response.encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        """Body decoded with the response's encoding."""
+        try:
+            return self.content.decode(self.encoding, errors="replace")
+        except LookupError:
+            return self.content.decode("utf-8", errors="replace")
+
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """
+    Create the extraction-only scraper a parse worker process extracts with.
+
+    Args:
+        config: Configuration of the parent scraper
+    """
+    global _worker_scraper
+    _worker_scraper = StaticScraper._for_parsing(config)
+
+
+def _parse_in_worker(url: str, page: _FetchedPage, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a fetched page and extract data in a worker process.
+
+    Args:
+        url: URL that was scraped
+        page: Fetched page
+        kwargs: Same arguments as scrape()
+
+    Returns:
+        Dictionary containing scraped data
+    """
+    return _worker_scraper._build_result(url, page, **kwargs)
 
 
 class StaticScraper(BaseScraper):
@@ -33,17 +196,61 @@ class StaticScraper(BaseScraper):
         """
         super().__init__(config)
 
-        # Session for connection pooling
-        self.session = requests.Session()
-
         # Timeout configuration
         scraping_config = self.config.get("scraping", {})
         self.timeout = scraping_config.get("timeout", 30)
 
+        # Largest response body read before a page is abandoned (None = no limit)
+        self.max_bytes = scraping_config.get("max_bytes", 5 * 1024 * 1024)
+
+        # Session for connection pooling, sized so every worker keeps its
+        # keep-alive connection instead of overflowing urllib3's default pool
+        self.max_workers = max(1, scraping_config.get("max_workers", 5))
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Processes for parsing in concurrent async batches (0 = threads, the default)
+        self.parse_workers = scraping_config.get("parse_workers", 0)
+
+        self._init_extraction()
+
+        self.logger.info("StaticScraper initialized")
+
+    @classmethod
+    def _for_parsing(cls, config: Dict[str, Any]) -> "StaticScraper":
+        """
+        Create a scraper that only parses and extracts, for parse workers.
+
+        Skips BaseScraper setup, so a worker process builds no logging
+        handlers, robots checker, proxy manager, user-agent rotator or
+        sessions; its log records go to the plain module logger.
+
+        Args:
+            config: Configuration of the parent scraper
+
+        Returns:
+            StaticScraper usable only through _build_result()
+        """
+        scraper = cls.__new__(cls)
+        scraper.config = config
+        scraper.logger = logging.getLogger(__name__)
+        scraper.stats = {"total_items_scraped": 0}
+        scraper._init_extraction()
+        return scraper
+
+    def _init_extraction(self) -> None:
+        """Set the parser and read extraction settings from the config."""
         # Parser preference
         self.parser = "lxml"  # Can be: lxml, html.parser, html5lib
 
-        self.logger.info("StaticScraper initialized")
+        # Extraction settings, read once instead of per page or element
+        extraction_config = self.config.get("extraction", {})
+        self.clean_whitespace = extraction_config.get("clean_whitespace", True)
+        self._default_css = extraction_config.get("css_selectors", {})
+        self._default_xpath = extraction_config.get("xpath_selectors", {})
+        self._default_regex = extraction_config.get("regex_patterns", {})
 
     @retry(
         stop=stop_after_attempt(3),
@@ -62,6 +269,7 @@ class StaticScraper(BaseScraper):
 
         Raises:
             requests.RequestException: If request fails after retries
+            ValueError: If the response body exceeds max_bytes
         """
         # Apply rate limiting
         self.rate_limiter.acquire()
@@ -73,6 +281,7 @@ class StaticScraper(BaseScraper):
         # Get headers and proxy
         headers = self._get_headers()
         proxy = self._get_proxy()
+        proxy_url = proxy["http"] if proxy else None
 
         self.stats["total_requests"] += 1
 
@@ -82,19 +291,34 @@ class StaticScraper(BaseScraper):
                 headers=headers,
                 proxies=proxy,
                 timeout=self.timeout,
-                allow_redirects=True
+                allow_redirects=True,
+                stream=True
             )
-            response.raise_for_status()
+
+            # Read the body in chunks so oversized pages are abandoned early
+            try:
+                response.raise_for_status()
+                self._check_body_size(url, int(response.headers.get("Content-Length") or 0))
+
+                body = bytearray()
+                for chunk in response.iter_content(READ_CHUNK_SIZE):
+                    body.extend(chunk)
+                    self._check_body_size(url, len(body))
+            except Exception:
+                response.close()
+                raise
+
+            # Keep .content and .text working on the buffered body
+            response._content = bytes(body)
+            response._content_consumed = True
 
             # Report success
-            proxy_url = proxy.get("http") if proxy else None
             self._handle_request_success(url, proxy_url)
 
             return response
 
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             # Report failure
-            proxy_url = proxy.get("http") if proxy else None
             self._handle_request_failure(url, e, proxy_url)
             raise
 
@@ -109,60 +333,276 @@ class StaticScraper(BaseScraper):
                 - xpath_selectors: Dict of XPath selectors
                 - regex_patterns: Dict of regex patterns
                 - extract_all: Whether to extract all matches (default: False)
+                - include_html: Whether to return the page HTML (default: only
+                  when no selectors are given)
 
         Returns:
             Dictionary containing scraped data
         """
         try:
             response = self._fetch_page(url)
+            return self._build_result(url, response, **kwargs)
+
+        except Exception as e:
+            self.logger.error("Error scraping %s: %s", url, e)
+            return {
+                "url": url,
+                "error": str(e),
+                "success": False
+            }
+
+    def _build_result(self, url: str, response: Union[requests.Response, httpx.Response], **kwargs) -> Dict[str, Any]:
+        """
+        Parse a fetched page and extract data from it.
 
-            # Parse HTML
+        Args:
+            url: URL that was scraped
+            response: requests or httpx response for the page
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Dictionary containing scraped data
+        """
+        # Extract data
+        data = {
+            "url": url,
+            "status_code": response.status_code,
+            "content_type": response.headers.get("Content-Type", "")
+        }
+
+        # Extract using CSS selectors
+        selectors = kwargs.get("selectors") or self._default_css
+        if selectors:
+            # Parse only the trees the configured selectors need
             soup = BeautifulSoup(response.content, self.parser)
+            data["extracted_data"] = self._extract_with_css(soup, selectors, kwargs.get("extract_all", False))
+
+        # Extract using XPath
+        xpath_selectors = kwargs.get("xpath_selectors") or self._default_xpath
+        if xpath_selectors:
             tree = lxml_html.fromstring(response.content)
+            xpath_data = self._extract_with_xpath(tree, xpath_selectors, kwargs.get("extract_all", False))
+            if "extracted_data" in data:
+                data["extracted_data"].update(xpath_data)
+            else:
+                data["extracted_data"] = xpath_data
+
+        # Extract using regex
+        regex_patterns = kwargs.get("regex_patterns") or self._default_regex
+        if regex_patterns:
+            subject = self._regex_subject(response, regex_patterns)
+            regex_data = self._extract_with_regex(subject, regex_patterns, kwargs.get("extract_all", False))
+            if "extracted_data" in data:
+                data["extracted_data"].update(regex_data)
+            else:
+                data["extracted_data"] = regex_data
+
+        # Decoding the body is skipped when only extracted fields are wanted
+        if self._include_html(kwargs, "extracted_data" in data):
+            data["html"] = response.text
+
+        self.stats["total_items_scraped"] += 1
 
-            # Extract data
-            data = {
-                "url": url,
-                "status_code": response.status_code,
-                "content_type": response.headers.get("Content-Type", ""),
-                "html": response.text
-            }
+        return data
 
-            # Extract using CSS selectors
-            selectors = kwargs.get("selectors") or self.config.get("extraction", {}).get("css_selectors", {})
-            if selectors:
-                data["extracted_data"] = self._extract_with_css(soup, selectors, kwargs.get("extract_all", False))
-
-            # Extract using XPath
-            xpath_selectors = kwargs.get("xpath_selectors") or self.config.get("extraction", {}).get("xpath_selectors", {})
-            if xpath_selectors:
-                xpath_data = self._extract_with_xpath(tree, xpath_selectors, kwargs.get("extract_all", False))
-                if "extracted_data" in data:
-                    data["extracted_data"].update(xpath_data)
-                else:
-                    data["extracted_data"] = xpath_data
-
-            # Extract using regex
-            regex_patterns = kwargs.get("regex_patterns") or self.config.get("extraction", {}).get("regex_patterns", {})
-            if regex_patterns:
-                regex_data = self._extract_with_regex(response.text, regex_patterns, kwargs.get("extract_all", False))
-                if "extracted_data" in data:
-                    data["extracted_data"].update(regex_data)
-                else:
-                    data["extracted_data"] = regex_data
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception_type((httpx.HTTPError, ConnectionError))
+    )
+    async def _fetch_page_async(
+        self,
+        url: str,
+        get_client: Callable[[Optional[str]], httpx.AsyncClient]
+    ) -> httpx.Response:
+        """
+        Fetch a page on the event loop with retry logic.
 
-            self.stats["total_items_scraped"] += 1
+        Args:
+            url: URL to fetch
+            get_client: Returns the async client for a proxy URL
+
+        Returns:
+            Response object
+
+        Raises:
+            httpx.HTTPError: If request fails after retries
+            ValueError: If the response body exceeds max_bytes
+        """
+        loop = asyncio.get_running_loop()
+
+        # The rate limiter blocks, so run it off the event loop
+        await loop.run_in_executor(None, self.rate_limiter.acquire)
+
+        if not await self._check_robots_txt_async(url):
+            raise PermissionError(f"Robots.txt disallows scraping: {url}")
 
-            return data
+        # Get headers and proxy
+        headers = self._get_headers()
+        proxy = self._get_proxy()
+        proxy_url = proxy["http"] if proxy else None
+
+        self.stats["total_requests"] += 1
+
+        try:
+            async with get_client(proxy_url).stream("GET", url, headers=headers) as response:
+                response.raise_for_status()
+                self._check_body_size(url, int(response.headers.get("Content-Length") or 0))
+
+                # Read the body in chunks so oversized pages are abandoned early
+                body = bytearray()
+                async for chunk in response.aiter_bytes(READ_CHUNK_SIZE):
+                    body.extend(chunk)
+                    self._check_body_size(url, len(body))
+
+            # Keep .content and .text working on the buffered body
+            response._content = bytes(body)
+
+            # Report success
+            self._handle_request_success(url, proxy_url)
+
+            return response
+
+        except (httpx.HTTPError, ValueError) as e:
+            # Report failure
+            self._handle_request_failure(url, e, proxy_url)
+            raise
+
+    def _check_body_size(self, url: str, size: int) -> None:
+        """
+        Abort a fetch whose body is larger than max_bytes.
+
+        Args:
+            url: URL being fetched
+            size: Body size read or announced so far
+
+        Raises:
+            ValueError: If the size exceeds max_bytes
+        """
+        if self.max_bytes and size > self.max_bytes:
+            raise ValueError(f"Response body exceeds {self.max_bytes} bytes: {url}")
+
+    async def _scrape_async(
+        self,
+        url: str,
+        get_client: Callable[[Optional[str]], httpx.AsyncClient],
+        semaphore: asyncio.Semaphore,
+        parse_pool: Optional[Executor] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Scrape a single URL on the event loop.
+
+        Args:
+            url: URL to scrape
+            get_client: Returns the async client for a proxy URL
+            semaphore: Bounds the number of in-flight requests
+            parse_pool: Process pool for parsing (default executor if None)
+            **kwargs: Same arguments as scrape()
+
+        Returns:
+            Dictionary containing scraped data
+        """
+        try:
+            async with semaphore:
+                response = await self._fetch_page_async(url, get_client)
+
+            # Parse off the event loop so other fetches keep progressing
+            loop = asyncio.get_running_loop()
+            if parse_pool is None:
+                return await loop.run_in_executor(None, partial(self._build_result, url, response, **kwargs))
+
+            result = await loop.run_in_executor(parse_pool, _parse_in_worker, url, _FetchedPage(response), kwargs)
+            self.stats["total_items_scraped"] += 1
+            return result
 
         except Exception as e:
-            self.logger.error(f"Error scraping {url}: {e}")
+            self.logger.error("Error scraping %s: %s", url, e)
             return {
                 "url": url,
                 "error": str(e),
                 "success": False
             }
 
+    async def _scrape_many_async(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
+        """
+        Scrape multiple URLs concurrently with one async client per proxy.
+
+        Args:
+            urls: List of URLs to scrape
+            **kwargs: Additional arguments passed to _scrape_async()
+
+        Returns:
+            List of dictionaries containing scraped data, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        clients: Dict[Optional[str], httpx.AsyncClient] = {}
+
+        def get_client(proxy_url: Optional[str]) -> httpx.AsyncClient:
+            client = clients.get(proxy_url)
+            if client is None:
+                client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    proxy=proxy_url,
+                    timeout=self.timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=self.max_workers,
+                        max_connections=self.max_workers * 2
+                    )
+                )
+                clients[proxy_url] = client
+            return client
+
+        # Parse in worker processes when enabled and there is anything to
+        # extract; spawned, since forking here would copy the running event
+        # loop, locks and logging threads into the workers
+        parse_pool = None
+        if self.parse_workers > 0 and self._has_extraction(kwargs):
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(self.config,)
+            )
+
+        try:
+            tasks = [self._scrape_async(url, get_client, semaphore, parse_pool, **kwargs) for url in urls]
+
+            show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+            if show_progress:
+                with tqdm(total=len(urls), desc="Scraping") as progress:
+                    async def tracked(task):
+                        result = await task
+                        progress.update(1)
+                        return result
+
+                    return await asyncio.gather(*(tracked(task) for task in tasks))
+
+            return await asyncio.gather(*tasks)
+
+        finally:
+            for client in clients.values():
+                await client.aclose()
+            if parse_pool:
+                parse_pool.shutdown()
+
+    def _has_extraction(self, kwargs: Dict[str, Any]) -> bool:
+        """
+        Check whether any selectors or patterns will be applied to pages.
+
+        Args:
+            kwargs: Arguments passed to scrape()
+
+        Returns:
+            True if CSS, XPath or regex extraction is configured
+        """
+        return bool(
+            kwargs.get("selectors") or self._default_css
+            or kwargs.get("xpath_selectors") or self._default_xpath
+            or kwargs.get("regex_patterns") or self._default_regex
+        )
+
     def _extract_with_css(self, soup: BeautifulSoup, selectors: Dict[str, str], extract_all: bool = False) -> Dict[str, Any]:
         """
         Extract data using CSS selectors.
@@ -179,15 +619,16 @@ class StaticScraper(BaseScraper):
 
         for field, selector in selectors.items():
             try:
+                matcher = compile_selector(selector)
                 if extract_all:
-                    elements = soup.select(selector)
+                    elements = matcher.select(soup)
                     data[field] = [self._extract_element_data(el) for el in elements]
                 else:
-                    element = soup.select_one(selector)
+                    element = matcher.select_one(soup)
                     data[field] = self._extract_element_data(element) if element else None
 
             except Exception as e:
-                self.logger.warning(f"Error extracting '{field}' with selector '{selector}': {e}")
+                self.logger.warning("Error extracting '%s' with selector '%s': %s", field, selector, e)
                 data[field] = None
 
         return data
@@ -208,7 +649,7 @@ class StaticScraper(BaseScraper):
 
         for field, xpath in selectors.items():
             try:
-                elements = tree.xpath(xpath)
+                elements = compile_xpath(xpath)(tree)
 
                 if not elements:
                     data[field] = None
@@ -218,40 +659,132 @@ class StaticScraper(BaseScraper):
                     data[field] = self._extract_xpath_element(elements[0])
 
             except Exception as e:
-                self.logger.warning(f"Error extracting '{field}' with XPath '{xpath}': {e}")
+                self.logger.warning("Error extracting '%s' with XPath '%s': %s", field, xpath, e)
                 data[field] = None
 
         return data
 
-    def _extract_with_regex(self, text: str, patterns: Dict[str, str], extract_all: bool = False) -> Dict[str, Any]:
+    def _regex_subject(
+        self,
+        response: Union[requests.Response, httpx.Response],
+        patterns: Dict[str, Union[str, re.Pattern]]
+    ) -> Union[str, bytes]:
         """
-        Extract data using regex patterns.
+        Pick what regex patterns are matched against.
+
+        ASCII pages are matched as raw bytes, which finds exactly what the
+        decoded text would without decoding the body or detecting its
+        encoding. Other pages, or patterns that only work on text, use
+        response.text.
 
         Args:
-            text: Text to search
+            response: Fetched response
             patterns: Dictionary of field_name: pattern pairs
+
+        Returns:
+            Response body as bytes, or as decoded text
+        """
+        content = response.content
+        if not content.isascii() or not all(_pattern_source(pattern).isascii() for pattern in patterns.values()):
+            return response.text
+
+        try:
+            for pattern in patterns.values():
+                _compile_regex(pattern, as_bytes=True)
+        except (re.error, ValueError):
+            return response.text
+
+        return content
+
+    def _extract_with_regex(
+        self,
+        text: Union[str, bytes],
+        patterns: Dict[str, Union[str, re.Pattern]],
+        extract_all: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Extract data using regex patterns.
+
+        Args:
+            text: Text to search, or the raw body of an ASCII page
+            patterns: Dictionary of field_name: pattern pairs; patterns may be
+                strings or precompiled re.Pattern objects
             extract_all: Whether to extract all matches
 
         Returns:
             Dictionary of extracted data
         """
         data = {}
+        candidates = self._regex_candidates(text, patterns)
+        as_bytes = isinstance(text, bytes)
+
+        for index, (field, pattern) in enumerate(patterns.items()):
+            # Patterns ruled out by the prefilter cannot match
+            if candidates is not None and index not in candidates:
+                data[field] = None
+                continue
 
-        for field, pattern in patterns.items():
             try:
+                compiled = _compile_regex(pattern, as_bytes)
                 if extract_all:
-                    matches = re.findall(pattern, text)
+                    matches = compiled.findall(text)
+                    if as_bytes:
+                        matches = [_decode_match(match) for match in matches]
                     data[field] = matches if matches else None
                 else:
-                    match = re.search(pattern, text)
-                    data[field] = match.group(1) if match and match.groups() else (match.group(0) if match else None)
+                    match = compiled.search(text)
+                    value = match.group(1) if match and match.groups() else (match.group(0) if match else None)
+                    data[field] = _decode_match(value) if as_bytes else value
 
             except Exception as e:
-                self.logger.warning(f"Error extracting '{field}' with regex '{pattern}': {e}")
+                self.logger.warning("Error extracting '%s' with regex '%s': %s", field, _pattern_source(pattern), e)
                 data[field] = None
 
         return data
 
+    def _regex_candidates(
+        self,
+        text: Union[str, bytes],
+        patterns: Dict[str, Union[str, re.Pattern]]
+    ) -> Optional[Set[int]]:
+        """
+        Find which patterns may match a text in a single Hyperscan pass.
+
+        Args:
+            text: Text to search, or the raw body of an ASCII page
+            patterns: Dictionary of field_name: pattern pairs
+
+        Returns:
+            Indices of patterns that may match, or None to run every pattern
+            (Hyperscan unavailable, a single pattern, or patterns it rejects)
+        """
+        if not HYPERSCAN_AVAILABLE or len(patterns) < 2:
+            return None
+
+        # The prefilter only sees pattern strings, so compiled flags or bytes
+        # patterns could make it miss matches
+        if any(
+            isinstance(pattern, re.Pattern) and (isinstance(pattern.pattern, bytes) or pattern.flags & ~re.UNICODE)
+            for pattern in patterns.values()
+        ):
+            return None
+
+        database = _compile_prefilter(tuple(_pattern_source(pattern) for pattern in patterns.values()))
+        if database is None:
+            return None
+
+        candidates: Set[int] = set()
+
+        def on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+            candidates.add(pattern_id)
+
+        try:
+            database.scan(text if isinstance(text, bytes) else text.encode("utf-8"), match_event_handler=on_match)
+        except Exception:
+            return None
+
+        return candidates
+
     def _extract_element_data(self, element) -> Optional[str]:
         """
         Extract data from a BeautifulSoup element.
@@ -269,7 +802,7 @@ class StaticScraper(BaseScraper):
         text = element.get_text(strip=True)
 
         # Clean whitespace if configured
-        if self.config.get("extraction", {}).get("clean_whitespace", True):
+        if self.clean_whitespace:
             text = " ".join(text.split())
 
         return text if text else None
@@ -295,14 +828,14 @@ class StaticScraper(BaseScraper):
             text = str(element).strip()
 
         # Clean whitespace if configured
-        if self.config.get("extraction", {}).get("clean_whitespace", True):
+        if self.clean_whitespace:
             text = " ".join(text.split())
 
         return text if text else None
 
     def scrape_multiple(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
         """
-        Scrape multiple URLs concurrently.
+        Scrape multiple URLs, concurrently when max_workers > 1.
 
         Args:
             urls: List of URLs to scrape
@@ -311,35 +844,24 @@ class StaticScraper(BaseScraper):
         Returns:
             List of dictionaries containing scraped data
         """
-        results = []
+        if self.max_workers > 1:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                # Concurrent scraping on one event loop, multiplexed over HTTP/2 when available
+                return asyncio.run(self._scrape_many_async(urls, **kwargs))
 
-        # Get concurrency settings
-        scraping_config = self.config.get("scraping", {})
-        max_workers = scraping_config.get("max_workers", 5)
-        show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+            # Called from a running event loop, where asyncio.run would fail:
+            # scrape on worker threads instead, results in input order
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self.scrape, url, **kwargs) for url in urls]
+                return [future.result() for future in futures]
 
         # Sequential scraping (with optional progress bar)
-        if max_workers == 1:
-            iterator = tqdm(urls, desc="Scraping") if show_progress else urls
-            for url in iterator:
-                result = self.scrape(url, **kwargs)
-                results.append(result)
+        show_progress = self.config.get("advanced", {}).get("show_progress_bar", True)
+        iterator = tqdm(urls, desc="Scraping") if show_progress else urls
 
-        # Concurrent scraping
-        else:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_url = {executor.submit(self.scrape, url, **kwargs): url for url in urls}
-
-                # With progress bar
-                if show_progress:
-                    for future in tqdm(as_completed(future_to_url), total=len(urls), desc="Scraping"):
-                        results.append(future.result())
-                # Without progress bar
-                else:
-                    for future in as_completed(future_to_url):
-                        results.append(future.result())
-
-        return results
+        return [self.scrape(url, **kwargs) for url in iterator]
 
     def scrape_with_pagination(
         self,
@@ -363,34 +885,51 @@ class StaticScraper(BaseScraper):
             List of dictionaries containing scraped data
         """
         results = []
-        page = start_page
         max_pages = max_pages or self.config.get("scraping", {}).get("max_pages", 10)
-
-        self.logger.info(f"Starting pagination scraping from page {start_page}")
-
-        while page < start_page + max_pages:
-            # Construct URL
-            separator = "&" if "?" in base_url else "?"
-            url = f"{base_url}{separator}{page_param}={page}"
-
-            self.logger.debug(f"Scraping page {page}: {url}")
-
-            try:
-                result = self.scrape(url, **kwargs)
-
-                # Check if page is empty or has no data
-                if not result or result.get("error"):
-                    self.logger.info(f"Stopping pagination at page {page} (error or empty)")
+        separator = "&" if "?" in base_url else "?"
+
+        self.logger.info("Starting pagination scraping from page %s", start_page)
+
+        # Pages are independent URLs, so up to max_workers are fetched ahead
+        # and consumed in order; the first error or empty page ends the run
+        pages = iter(range(start_page, start_page + max_pages))
+        window: deque = deque()
+
+        def submit_next(executor: ThreadPoolExecutor) -> None:
+            page = next(pages, None)
+            if page is not None:
+                url = f"{base_url}{separator}{page_param}={page}"
+                self.logger.debug("Scraping page %s: %s", page, url)
+                window.append((page, executor.submit(self.scrape, url, **kwargs)))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max_pages)) as executor:
+            for _ in range(min(self.max_workers, max_pages)):
+                submit_next(executor)
+
+            while window:
+                page, future = window.popleft()
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error("Error scraping page %s: %s", page, e)
+                    result = None
+                else:
+                    # Check if page is empty or has no data
+                    if not result or result.get("error"):
+                        self.logger.info("Stopping pagination at page %s (error or empty)", page)
+                        result = None
+
+                if result is None:
+                    # Drop fetches queued past the last page
+                    for _, pending in window:
+                        pending.cancel()
                     break
 
                 results.append(result)
-                page += 1
-
-            except Exception as e:
-                self.logger.error(f"Error scraping page {page}: {e}")
-                break
+                submit_next(executor)
 
-        self.logger.info(f"Pagination complete. Scraped {len(results)} pages")
+        self.logger.info("Pagination complete. Scraped %s pages", len(results))
 
         return results
 
@@ -0,0 +1,97 @@
+"""
+Unit tests for API scraper.
+"""
+
+import httpx
+import pytest
+from web_scraper.scrapers.api_scraper import IJSON_AVAILABLE, APIScraper
+
+
+# Paginated JSON body with items followed by the next cursor
+STREAM_BODY = b'{"items": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}], "meta": {"next": "c2"}}'
+
+
+class TestAPIScraper:
+    """Test cases for APIScraper."""
+
+    @pytest.fixture
+    def scraper(self):
+        """Create scraper instance."""
+        config = {
+            "error_handling": {"log_level": "ERROR", "log_to_console": False},
+            "advanced": {"respect_robots_txt": False, "show_progress_bar": False}
+        }
+        with APIScraper(config) as scraper:
+            yield scraper
+
+    def _serve(self, scraper, body, content_type):
+        """Route the scraper's client to a mock transport serving body."""
+        scraper.session = httpx.Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body, headers={"Content-Type": content_type})
+            )
+        )
+
+    @pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson not installed")
+    def test_json_stream_collects_items_and_remainder(self, scraper):
+        """Test streamed JSON items are collected next to the scalar remainder."""
+        self._serve(scraper, STREAM_BODY, "application/json")
+
+        result = scraper.scrape("http://api.example.com/items", response_format="json_stream")
+
+        assert result["success"] is True
+        assert result["data"] == {
+            "items": [{"id": 1, "tags": ["a"]}, {"id": 2, "tags": []}],
+            "meta": {"next": "c2"}
+        }
+
+    @pytest.mark.skipif(not IJSON_AVAILABLE, reason="ijson not installed")
+    def test_json_stream_item_callback(self, scraper):
+        """Test streamed JSON items go to the callback instead of the result."""
+        self._serve(scraper, STREAM_BODY, "application/json")
+        seen = []
+
+        result = scraper.scrape(
+            "http://api.example.com/items",
+            response_format="json_stream",
+            item_callback=seen.append
+        )
+
+        assert [item["id"] for item in seen] == [1, 2]
+        assert result["data"] == {"meta": {"next": "c2"}}
+
+    def test_batched_pagination_forwards_request_arguments(self, scraper, monkeypatch):
+        """Test bulk requests carry the same arguments as per-page requests."""
+        calls = []
+
+        def fake_scrape(url, **kwargs):
+            calls.append((url, kwargs))
+            pages = kwargs["json_data"]["requests"]
+            # Two full pages, then a partial one ends the run
+            return {
+                "success": True,
+                "status_code": 200,
+                "data": [{"items": [0] * (2 if page["page"] < 3 else 1)} for page in pages]
+            }
+
+        monkeypatch.setattr(scraper, "scrape", fake_scrape)
+
+        results = scraper.scrape_with_pagination(
+            "http://api.example.com/items",
+            max_pages=5,
+            page_size=2,
+            batch_endpoint="http://api.example.com/bulk",
+            batch_size=2,
+            params={"api_key": "k"},
+            response_format="json",
+            return_headers=False
+        )
+
+        assert len(results) == 3
+        assert len(calls) == 2
+        for url, kwargs in calls:
+            assert url == "http://api.example.com/bulk"
+            assert kwargs["method"] == "POST"
+            assert kwargs["params"] == {"api_key": "k"}
+            assert kwargs["return_headers"] is False
+            assert all(page["api_key"] == "k" for page in kwargs["json_data"]["requests"])
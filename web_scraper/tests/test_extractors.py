@@ -0,0 +1,71 @@
+"""
+Unit tests for extractors.
+"""
+
+from bs4 import BeautifulSoup
+from web_scraper.extractors.table_extractor import TableExtractor
+from web_scraper.extractors.text_extractor import TextExtractor
+
+
+# Table whose cells mix plain text with script, style and comment content
+TABLE_HTML = """<html><body>
+<table>
+    <thead><tr><th>Name</th><th colspan="2">Value  </th></tr></thead>
+    <tr><td>a<script>var x=1</script><style>.c{}</style></td><td><b>b</b><!-- hidden --></td><td>c</td></tr>
+</table>
+<table><tr><td>second</td></tr></table>
+</body></html>"""
+
+
+class TestTableExtractor:
+    """Test cases for TableExtractor."""
+
+    def test_extract_tables_skips_script_and_style(self):
+        """Test that script and style text is not part of a cell value."""
+        tables = TableExtractor().extract_tables(TABLE_HTML)
+
+        assert tables[0][1] == ['a', 'b', 'c']
+
+    def test_extract_tables_matches_beautifulsoup(self):
+        """Test that the lxml path matches the BeautifulSoup extraction."""
+        extractor = TableExtractor()
+        expected = [
+            extractor._extract_table_data(table)
+            for table in BeautifulSoup(TABLE_HTML, "lxml").find_all("table")
+        ]
+
+        assert extractor.extract_tables(TABLE_HTML) == expected
+        assert expected == [[['Name', 'Value', 'Value'], ['a', 'b', 'c']], [['second']]]
+
+    def test_find_table_by_header_handles_xhtml_and_empty_documents(self):
+        """Test header lookup on an XML-declared page and on documents without elements."""
+        extractor = TableExtractor()
+        xhtml = '<?xml version="1.0" encoding="utf-8"?>\n' + TABLE_HTML
+
+        assert extractor.find_table_by_header(xhtml, "value") == [['Name', 'Value', 'Value'], ['a', 'b', 'c']]
+        assert extractor.find_table_by_header(TABLE_HTML, "missing") is None
+        assert extractor.find_table_by_header("<!-- only a comment -->", "name") is None
+        assert extractor.find_table_by_header("", "name") is None
+
+
+class TestTextExtractor:
+    """Test cases for TextExtractor."""
+
+    def test_extract_metadata(self):
+        """Test title and meta tag extraction, including XHTML and empty input."""
+        extractor = TextExtractor()
+        page = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html><head><title>  Home  page </title>'
+            '<meta name="description" content="About">'
+            '<meta property="og:type" content="website">'
+            '<meta name="empty" content=""></head></html>'
+        )
+
+        assert extractor.extract_metadata(page) == {
+            "title": "Home page",
+            "description": "About",
+            "og:type": "website",
+        }
+        assert extractor.extract_metadata("<!-- only a comment -->") == {}
+        assert extractor.extract_metadata("") == {}
@@ -0,0 +1,60 @@
+"""
+Unit tests for scraper selection and multi-URL scraping.
+"""
+
+import asyncio
+
+from main import WebScraper
+from web_scraper.scrapers.scraper_factory import ScraperFactory
+
+
+class _RecordingScraper:
+    """Stand-in scraper returning one result per URL, tagged with its type."""
+
+    def __init__(self, scraper_type):
+        self.scraper_type = scraper_type
+
+    def scrape_multiple(self, urls, **kwargs):
+        return [{"url": url, "scraper": self.scraper_type} for url in urls]
+
+
+class TestScraperFactory:
+    """Test cases for ScraperFactory."""
+
+    def test_detect_scraper_types_inside_running_loop(self):
+        """Test batch detection from a running event loop uses cached hosts."""
+        factory = ScraperFactory()
+        factory._remember(("http", "spa.example.com"), "playwright")
+        factory._remember(("http", "static.example.com"), "static")
+        urls = [
+            "http://spa.example.com/a",
+            "http://static.example.com/b",
+            "http://example.com/api/v1/items"
+        ]
+
+        async def detect_from_loop():
+            return factory.detect_scraper_types(urls)
+
+        assert asyncio.run(detect_from_loop()) == ["playwright", "static", "api"]
+
+
+class TestWebScraper:
+    """Test cases for WebScraper."""
+
+    def test_scrape_multiple_auto_keeps_input_order(self, monkeypatch):
+        """Test results follow the input order when URLs go to different scrapers."""
+        scraper = WebScraper()
+        urls = [f"http://example.com/{i}" for i in range(5)]
+        types = ["static", "api", "static", "playwright", "api"]
+
+        monkeypatch.setattr(scraper.factory, "detect_scraper_types", lambda urls: types)
+        monkeypatch.setattr(
+            scraper.factory,
+            "create_scraper",
+            lambda url, scraper_type: _RecordingScraper(scraper_type)
+        )
+
+        results = scraper.scrape_multiple(urls)
+
+        assert [result["url"] for result in results] == urls
+        assert [result["scraper"] for result in results] == types
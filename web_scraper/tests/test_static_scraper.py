@@ -2,16 +2,83 @@
 Unit tests for static scraper.
 """
 
+import re
+
 import pytest
+import responses
 from web_scraper.scrapers.static_scraper import StaticScraper
 
 
+QUOTES_URL = "http://quotes.toscrape.com/"
+
+# Compiled once at import and passed to the scraper as-is
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Trimmed copy of the quotes.toscrape.com front page served by the mocked tests
+SAMPLE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Quotes to Scrape</title>
+</head>
+<body>
+    <div class="container">
+        <div class="row header-box">
+            <div class="col-md-8">
+                <h1><a href="/" style="text-decoration: none">Quotes to Scrape</a></h1>
+            </div>
+        </div>
+        <div class="row">
+            <div class="col-md-8">
+                <div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+                    <span class="text" itemprop="text">“The world as we have created it is a process of our thinking.”</span>
+                    <span>by <small class="author" itemprop="author">Albert Einstein</small></span>
+                    <div class="tags">
+                        Tags:
+                        <a class="tag" href="/tag/change/page/1/">change</a>
+                        <a class="tag" href="/tag/thinking/page/1/">thinking</a>
+                    </div>
+                </div>
+                <div class="quote" itemscope itemtype="http://schema.org/CreativeWork">
+                    <span class="text" itemprop="text">“It is our choices, Harry, that show what we truly are.”</span>
+                    <span>by <small class="author" itemprop="author">J.K. Rowling</small></span>
+                    <div class="tags">
+                        Tags:
+                        <a class="tag" href="/tag/abilities/page/1/">abilities</a>
+                        <a class="tag" href="/tag/choices/page/1/">choices</a>
+                    </div>
+                </div>
+                <nav>
+                    <ul class="pager">
+                        <li class="next"><a href="/page/2/">Next</a></li>
+                    </ul>
+                </nav>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+def _mock_quotes_page():
+    """Register the sample quotes page with responses."""
+    responses.add(
+        responses.GET,
+        QUOTES_URL,
+        body=SAMPLE_HTML,
+        status=200,
+        content_type="text/html"
+    )
+
+
 class TestStaticScraper:
     """Test cases for StaticScraper."""
 
-    @pytest.fixture
-    def scraper(self):
-        """Create scraper instance for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def scraper(cls):
+        """Create scraper instance shared by the tests in this class."""
         config = {
             "scraping": {
                 "rate_limit": 1.0,
@@ -28,18 +95,29 @@ class TestStaticScraper:
         }
         return StaticScraper(config)
 
+    @pytest.fixture
+    def concurrent_scraper(self):
+        """Create a scraper with several workers."""
+        config = {
+            "scraping": {"rate_limit": 100.0, "max_workers": 4},
+            "error_handling": {"log_level": "ERROR", "log_to_console": False},
+            "advanced": {"respect_robots_txt": False, "show_progress_bar": False}
+        }
+        with StaticScraper(config) as scraper:
+            yield scraper
+
     def test_scraper_initialization(self, scraper):
         """Test scraper initializes correctly."""
         assert scraper is not None
         assert scraper.timeout == 10
         assert scraper.parser == "lxml"
 
+    @responses.activate
     def test_simple_scraping(self, scraper):
         """Test simple URL scraping."""
-        # Using a test site
-        url = "http://quotes.toscrape.com/"
+        _mock_quotes_page()
 
-        result = scraper.scrape(url)
+        result = scraper.scrape(QUOTES_URL)
 
         assert result is not None
         assert "url" in result
@@ -47,20 +125,42 @@ class TestStaticScraper:
         assert result["status_code"] == 200
         assert "html" in result
 
+    @responses.activate
     def test_scraping_with_css_selectors(self, scraper):
         """Test scraping with CSS selectors."""
-        url = "http://quotes.toscrape.com/"
+        _mock_quotes_page()
 
         selectors = {
             "quotes": ".quote .text"
         }
 
-        result = scraper.scrape(url, selectors=selectors, extract_all=True)
+        result = scraper.scrape(QUOTES_URL, selectors=selectors, extract_all=True)
 
         assert "extracted_data" in result
         assert "quotes" in result["extracted_data"]
         assert len(result["extracted_data"]["quotes"]) > 0
 
+    @responses.activate
+    def test_session_is_reused(self, scraper, monkeypatch):
+        """Test requests go through the scraper's persistent session."""
+        import requests
+
+        _mock_quotes_page()
+        sessions = []
+        original_send = requests.Session.send
+
+        def send(session, request, **kwargs):
+            sessions.append(session)
+            return original_send(session, request, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "send", send)
+
+        scraper.scrape(QUOTES_URL)
+        scraper.scrape(QUOTES_URL)
+
+        assert len(sessions) == 2
+        assert all(session is scraper.session for session in sessions)
+
     def test_extract_element_data(self, scraper):
         """Test extracting element data."""
         from bs4 import BeautifulSoup
@@ -73,11 +173,22 @@ class TestStaticScraper:
 
         assert text == "Hello World"
 
+    def test_extract_xpath_element(self, scraper):
+        """Test extracting element data from the lxml XPath path."""
+        from lxml import html as lxml_html
+
+        tree = lxml_html.fromstring('<div><p class="test">Hello World</p></div>')
+        element = tree.xpath('//p[@class="test"]')[0]
+
+        text = scraper._extract_xpath_element(element)
+
+        assert text == "Hello World"
+
     def test_extract_with_regex(self, scraper):
         """Test regex extraction."""
         text = "Email: test@example.com, Phone: 123-456-7890"
         patterns = {
-            "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+            "email": _EMAIL_RE
         }
 
         result = scraper._extract_with_regex(text, patterns, extract_all=False)
@@ -85,8 +196,10 @@ class TestStaticScraper:
         assert "email" in result
         assert result["email"] == "test@example.com"
 
+    @responses.activate
     def test_scrape_invalid_url(self, scraper):
         """Test scraping invalid URL."""
+        # No registered response, so responses raises a ConnectionError
         url = "http://this-does-not-exist-xyz123456.com/"
 
         result = scraper.scrape(url)
@@ -94,16 +207,57 @@ class TestStaticScraper:
         assert "error" in result
         assert result["success"] == False
 
+    def test_scrape_multiple_async_keeps_input_order(self, concurrent_scraper, monkeypatch):
+        """Test the event-loop path extracts every page and keeps input order."""
+        import httpx
+
+        def handler(request):
+            page = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, html=f"<html><body><h1>Page {page}</h1></body></html>")
+
+        real_client = httpx.AsyncClient
+
+        def mock_client(**kwargs):
+            kwargs.pop("proxy", None)
+            return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        monkeypatch.setattr(httpx, "AsyncClient", mock_client)
+
+        urls = [f"http://example.com/page/{i}" for i in range(6)]
+        results = concurrent_scraper.scrape_multiple(urls, selectors={"heading": "h1"})
+
+        assert [result["url"] for result in results] == urls
+        assert [result["extracted_data"]["heading"] for result in results] == [f"Page {i}" for i in range(6)]
+
+    @responses.activate
+    def test_scrape_multiple_inside_running_loop(self, concurrent_scraper):
+        """Test concurrent scraping from a running event loop keeps input order."""
+        import asyncio
+
+        urls = [f"http://example.com/page/{i}" for i in range(6)]
+        for url in urls:
+            responses.add(responses.GET, url, body=f"<html><title>{url}</title></html>")
+
+        async def scrape_from_loop():
+            return concurrent_scraper.scrape_multiple(urls)
+
+        results = asyncio.run(scrape_from_loop())
+
+        assert [result["url"] for result in results] == urls
+        assert all(result["status_code"] == 200 for result in results)
+
+    @responses.activate
     def test_stats_tracking(self, scraper):
         """Test statistics tracking."""
-        url = "http://quotes.toscrape.com/"
+        _mock_quotes_page()
 
-        # Initial stats
+        # Initial stats (the scraper is shared, so clear earlier requests)
+        scraper.reset_stats()
         stats = scraper.get_stats()
         assert stats["total_requests"] == 0
 
         # After scraping
-        scraper.scrape(url)
+        scraper.scrape(QUOTES_URL)
         stats = scraper.get_stats()
 
         assert stats["total_requests"] > 0
@@ -132,6 +286,30 @@ class TestRateLimiter:
         stats = limiter.get_stats()
         assert stats["total_requests"] == 1
 
+    def test_rate_limiter_delay_spaces_concurrent_callers(self):
+        """Test the politeness delay spaces concurrent requests apart."""
+        import threading
+        import time
+        from web_scraper.utils.rate_limiter import RateLimiter
+
+        limiter = RateLimiter(requests_per_second=100.0, delay_between_requests=0.1)
+        released = []
+
+        def worker():
+            limiter.acquire()
+            released.append(time.monotonic())
+
+        start = time.monotonic()
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        released.sort()
+        assert released[0] - start >= 0.09
+        assert all(later - earlier >= 0.09 for earlier, later in zip(released, released[1:]))
+
 
 class TestProxyManager:
     """Test proxy management functionality."""
@@ -153,6 +331,121 @@ class TestProxyManager:
         assert "http" in proxy
         assert "https" in proxy
 
+    def test_round_robin_skips_dead_proxies(self):
+        """Test round-robin rotation stops handing out a proxy after max_failures."""
+        from web_scraper.utils.proxy_manager import ProxyManager
+
+        proxies = [f"http://proxy{i}.example.com:8080" for i in range(3)]
+        manager = ProxyManager(proxies=proxies, max_failures=2)
+
+        assert [manager.get_proxy()["http"] for _ in range(3)] == proxies
+
+        manager.report_failure(proxies[1])
+        manager.record_result(proxies[1], False)
+
+        picks = [manager.get_proxy()["http"] for _ in range(4)]
+        assert sorted(picks) == [proxies[0], proxies[0], proxies[2], proxies[2]]
+        assert picks[0] != picks[1]
+
+    def test_weighted_selection_prefers_reliable_proxies(self):
+        """Test weighted rotation favours proxies with a higher success rate."""
+        import random
+        from web_scraper.utils.proxy_manager import NUMPY_AVAILABLE, ProxyManager
+
+        reliable, flaky = "http://reliable.example.com:8080", "http://flaky.example.com:8080"
+        manager = ProxyManager(proxies=[reliable, flaky], rotation_strategy="weighted", max_failures=10)
+        manager._rng = random.Random(0)
+        for _ in range(5):
+            manager.report_success(reliable)
+            manager.report_failure(flaky)
+
+        picks = [manager.get_proxy()["http"] for _ in range(1000)]
+
+        assert picks.count(reliable) > 5 * picks.count(flaky) > 0
+
+        if NUMPY_AVAILABLE:
+            from itertools import accumulate
+
+            now = manager.last_used[0] + 30
+            alive = manager._alive
+            expected = list(accumulate(manager._proxy_weights(alive, now)))
+            assert manager._cumulative_weights_np(alive, now) == pytest.approx(expected)
+
+
+class TestRobotsChecker:
+    """Test robots.txt checking."""
+
+    def test_can_fetch_many(self, monkeypatch):
+        """Test batch checks prefetch each host once and apply its rules."""
+        import httpx
+        from web_scraper.utils.robots_checker import RobotsChecker
+
+        fetched = []
+
+        def handler(request):
+            fetched.append(request.url.host)
+            return httpx.Response(200, text="User-agent: *\nDisallow: /private\n")
+
+        monkeypatch.setattr(
+            RobotsChecker,
+            "_new_async_client",
+            staticmethod(lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        )
+
+        checker = RobotsChecker()
+        urls = [
+            "http://a.example.com/private/1",
+            "http://a.example.com/public",
+            "http://b.example.com/private",
+            "http://b.example.com/"
+        ]
+
+        assert checker.can_fetch_many(urls) == [False, True, False, True]
+        assert sorted(fetched) == ["a.example.com", "b.example.com"]
+        assert checker.get_stats()["total_checks"] == 4
+
+    @responses.activate
+    def test_decisions_are_cached_per_host(self):
+        """Test cached decisions match the rules and are dropped with their host."""
+        import gc
+        from web_scraper.utils.robots_checker import RobotsChecker
+
+        for host in ("a.example.com", "b.example.com"):
+            responses.add(
+                responses.GET,
+                f"http://{host}/robots.txt",
+                body="User-agent: *\nDisallow: /private\nDisallow: /search?q=\n"
+            )
+
+        checker = RobotsChecker(max_entries=1)
+        urls = ["/", "/private/1", "/search?q=x", "/search?page=2"]
+        expected = [True, False, False, True]
+
+        assert [checker.can_fetch("http://a.example.com" + url) for url in urls] == expected
+        assert [checker.can_fetch("http://a.example.com" + url) for url in urls] == expected
+
+        # Caching host b evicts host a, and with it a's decisions
+        assert [checker.can_fetch("http://b.example.com" + url) for url in urls] == expected
+        gc.collect()
+        assert len(checker._parser_decisions) == 1
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_failed_fetch_is_retried_after_failure_ttl(self):
+        """Test an unreachable robots.txt is retried sooner than cache_timeout."""
+        import requests
+        from web_scraper.utils.robots_checker import RobotsChecker
+
+        robots_url = "http://a.example.com/robots.txt"
+        responses.add(responses.GET, robots_url, body=requests.ConnectionError("down"))
+        responses.add(responses.GET, robots_url, body="User-agent: *\nDisallow: /private\n")
+
+        checker = RobotsChecker(failure_ttl=0)
+
+        assert checker.can_fetch("http://a.example.com/private") is True
+        assert checker.can_fetch("http://a.example.com/private") is False
+        assert checker.get_stats()["errors"] == 1
+
 
 class TestConfigLoader:
     """Test configuration loading."""
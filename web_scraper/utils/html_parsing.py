@@ -0,0 +1,46 @@
+"""
+Shared HTML parsing helpers.
+
+Keeps the parser setup used by the extractors in one place.
+"""
+
+from typing import Optional, Union
+
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# lxml tree builder, passed to BeautifulSoup directly instead of looking up
+# the "lxml" feature name on every parse
+HTML_BUILDER = LXMLTreeBuilder
+
+# Parser for text input, re-encoded as UTF-8 before parsing; the explicit
+# encoding overrides any charset the markup itself declares
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def parse_document(html: Union[str, bytes]) -> Optional[etree._Element]:
+    """
+    Parse an HTML document with lxml.
+
+    Text is parsed as UTF-8 bytes, since lxml refuses str input that
+    carries an XML encoding declaration (as XHTML pages often do). Raw
+    bytes are passed through so a declared charset is still honoured.
+
+    Args:
+        html: HTML content (str or raw bytes)
+
+    Returns:
+        Root element, or None if the document is empty or has no elements
+    """
+    if not html or not html.strip():
+        return None
+
+    try:
+        if isinstance(html, str):
+            return lxml_html.document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+        return lxml_html.document_fromstring(html)
+    except etree.ParserError:
+        # "Document is empty", e.g. markup that is only a comment
+        return None
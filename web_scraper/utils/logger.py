@@ -5,31 +5,31 @@ Provides comprehensive logging with file and console output,
 different verbosity levels, and structured log formatting.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+from typing import ClassVar, Dict, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 class ScraperLogger:
     """
-    Custom logger for web scraping operations.
+    Setup helper for web scraping loggers.
 
     Supports multiple log levels, file and console output,
-    and automatic log rotation.
+    and automatic log rotation. Callers log through the returned
+    stdlib logging.Logger directly, with %-style arguments so
+    disabled levels skip formatting.
     """
 
-    _instances = {}
+    # Background listeners writing each logger's file handler, by logger name
+    _listeners: ClassVar[Dict[str, QueueListener]] = {}
 
-    def __new__(cls, name: str = "WebScraper"):
-        """Singleton pattern to ensure one logger per name."""
-        if name not in cls._instances:
-            cls._instances[name] = super().__new__(cls)
-        return cls._instances[name]
-
-    def __init__(
-        self,
+    @classmethod
+    def configure(
+        cls,
         name: str = "WebScraper",
         log_level: str = "INFO",
         log_file: Optional[str] = None,
@@ -37,9 +37,13 @@ class ScraperLogger:
         log_format: Optional[str] = None,
         max_bytes: int = 10 * 1024 * 1024,  # 10MB
         backup_count: int = 5
-    ):
+    ) -> logging.Logger:
         """
-        Initialize the logger.
+        Configure the stdlib logger for a name.
+
+        logging.getLogger already returns one logger per name, so handlers
+        are only attached the first time a name is configured; later calls
+        just update the level.
 
         Args:
             name: Logger name
@@ -49,16 +53,15 @@ class ScraperLogger:
             log_format: Custom log format string
             max_bytes: Maximum size of log file before rotation
             backup_count: Number of backup log files to keep
-        """
-        if hasattr(self, '_initialized'):
-            return
 
-        self._initialized = True
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(getattr(logging, log_level.upper()))
+        Returns:
+            Configured logging.Logger
+        """
+        logger = logging.getLogger(name)
+        logger.setLevel(getattr(logging, log_level.upper()))
 
-        # Clear existing handlers
-        self.logger.handlers.clear()
+        if logger.handlers:
+            return logger
 
         # Set log format
         if log_format is None:
@@ -70,7 +73,7 @@ class ScraperLogger:
         if log_to_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            logger.addHandler(console_handler)
 
         # Add file handler with rotation
         if log_file:
@@ -83,40 +86,28 @@ class ScraperLogger:
                 backupCount=backup_count
             )
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
-
-    def debug(self, message: str, **kwargs) -> None:
-        """Log debug message."""
-        self.logger.debug(message, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
-        """Log info message."""
-        self.logger.info(message, **kwargs)
+            # Writes and rotation happen on the listener thread; the logging
+            # thread only enqueues the record
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            cls._listeners[name] = listener
+            logger.addHandler(QueueHandler(log_queue))
 
-    def warning(self, message: str, **kwargs) -> None:
-        """Log warning message."""
-        self.logger.warning(message, **kwargs)
+        return logger
 
-    def error(self, message: str, **kwargs) -> None:
-        """Log error message."""
-        self.logger.error(message, **kwargs)
-
-    def critical(self, message: str, **kwargs) -> None:
-        """Log critical message."""
-        self.logger.critical(message, **kwargs)
-
-    def exception(self, message: str, **kwargs) -> None:
-        """Log exception with traceback."""
-        self.logger.exception(message, **kwargs)
-
-    def set_level(self, level: str) -> None:
+    @classmethod
+    def set_level(cls, name: str, level: str) -> None:
         """
-        Change the logging level.
+        Change the logging level of a configured logger.
 
         Args:
+            name: Logger name
             level: New logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
-        self.logger.setLevel(getattr(logging, level.upper()))
+        logging.getLogger(name).setLevel(getattr(logging, level.upper()))
 
 
 def get_logger(
@@ -124,9 +115,9 @@ def get_logger(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
     log_to_console: bool = True
-) -> ScraperLogger:
+) -> logging.Logger:
     """
-    Get or create a logger instance.
+    Get or create a configured logger.
 
     Args:
         name: Logger name
@@ -135,9 +126,9 @@ def get_logger(
         log_to_console: Whether to output to console
 
     Returns:
-        ScraperLogger instance
+        logging.Logger for the name
     """
-    return ScraperLogger(
+    return ScraperLogger.configure(
         name=name,
         log_level=log_level,
         log_file=log_file,
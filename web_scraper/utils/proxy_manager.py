@@ -5,13 +5,28 @@ Handles proxy rotation, validation, and failover to avoid
 IP blocking and distribute requests across multiple proxies.
 """
 
+import bisect
 import random
 import time
-from typing import List, Optional, Dict
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional
 from pathlib import Path
 from collections import deque
 import threading
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Seconds a cached weight table is reused before the idle-time boost is refreshed
+WEIGHT_REFRESH_INTERVAL = 5.0
+
+# Alive pool size from which weights are computed with NumPy, when installed
+NUMPY_MIN_PROXIES = 100
+
 
 class ProxyManager:
     """
@@ -19,6 +34,11 @@ class ProxyManager:
 
     Supports multiple proxy formats, automatic rotation,
     and proxy health tracking.
+
+    Proxy state is kept as parallel arrays indexed by proxy position
+    (URLs, success and failure counts, last-use times and alive flags),
+    so scans over the pool read packed numbers instead of one dict per
+    proxy.
     """
 
     def __init__(
@@ -39,7 +59,16 @@ class ProxyManager:
             validate_proxies: Whether to validate proxies before use
             max_failures: Maximum failures before marking proxy as dead
         """
-        self.proxies: List[Dict] = []
+        # Per-proxy state, one entry per proxy at the same index
+        self.urls: List[str] = []
+        self.mappings: List[Dict[str, str]] = []  # requests-compatible proxies mappings
+        self.successes = array('i')
+        self.failures = array('i')
+        self.last_used = array('d')  # 0.0 until first use
+        self.alive = bytearray()
+        self._url_to_idx: Dict[str, int] = {}
+        # Indices of proxies currently alive, kept in step with self.alive
+        self._alive: List[int] = []
         self.rotation_strategy = rotation_strategy
         self.validate_proxies = validate_proxies
         self.max_failures = max_failures
@@ -50,13 +79,23 @@ class ProxyManager:
         if proxy_file:
             self._load_from_file(proxy_file)
 
-        if not self.proxies:
+        if not self.urls:
             raise ValueError("No proxies provided")
 
         # Rotation state
         self.current_index = 0
-        self.proxy_queue = deque(self.proxies)
+        # Private generator, so selection does not share the module-level one
+        self._rng = random.Random()
+        # Cumulative weights over the alive list for weighted selection,
+        # rebuilt when proxy stats change or the table goes stale
+        self._cum_weights: List[float] = []
+        self._weights_dirty = True
+        self._weights_built_at = 0.0
+        self.proxy_queue = deque(self.urls)
         self.lock = threading.Lock()
+        # (proxy_url, success) results recorded without the lock and
+        # applied in one batch by the next get_proxy or get_stats
+        self._pending_results: deque = deque()
 
         # Statistics
         self.stats = {
@@ -68,14 +107,20 @@ class ProxyManager:
     def _load_proxies(self, proxy_list: List[str]) -> None:
         """Load proxies from list."""
         for proxy in proxy_list:
-            self.proxies.append({
-                "url": proxy.strip(),
-                "failures": 0,
-                "successes": 0,
-                "last_used": None,
-                "is_alive": True,
-                "response_time": None
-            })
+            proxy_url = proxy.strip()
+            if proxy_url in self._url_to_idx:
+                continue
+            idx = len(self.urls)
+            self._url_to_idx[proxy_url] = idx
+            self.urls.append(proxy_url)
+            # Built once and handed out by get_proxy for every use of the proxy
+            self.mappings.append({"http": proxy_url, "https": proxy_url})
+            self.successes.append(0)
+            self.failures.append(0)
+            self.last_used.append(0.0)
+            self.alive.append(1)
+            self._alive.append(idx)
+        self._weights_dirty = True
 
     def _load_from_file(self, file_path: str) -> None:
         """Load proxies from file."""
@@ -83,78 +128,173 @@ class ProxyManager:
         if not path.exists():
             raise FileNotFoundError(f"Proxy file not found: {file_path}")
 
-        with open(file_path, 'r') as f:
-            proxy_list = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-            self._load_proxies(proxy_list)
+        # One read and split; each line is stripped once before filtering
+        lines = path.read_bytes().decode().split('\n')
+        self._load_proxies([line for line in map(str.strip, lines) if line and line[0] != '#'])
 
     def get_proxy(self) -> Optional[Dict[str, str]]:
         """
         Get next proxy based on rotation strategy.
 
         Returns:
-            Dictionary with proxy configuration or None if no proxies available
+            Dictionary with proxy configuration or None if no proxies available.
+            The same dictionary is returned for every use of a proxy, so it
+            must not be modified.
         """
         with self.lock:
-            # Filter out dead proxies
-            alive_proxies = [p for p in self.proxies if p["is_alive"]]
+            if self._pending_results:
+                self._apply_pending_results()
+
+            alive_proxies = self._alive
 
             if not alive_proxies:
                 # Try to resurrect proxies if all are dead
-                for proxy in self.proxies:
-                    proxy["is_alive"] = True
-                    proxy["failures"] = 0
-                alive_proxies = self.proxies
+                count = len(self.urls)
+                self.alive = bytearray(b"\x01" * count)
+                self.failures = array('i', [0]) * count
+                alive_proxies = self._alive = list(range(count))
+                self._weights_dirty = True
+
+            # One clock read per call, shared by weighted selection and last_used
+            now = time.time()
 
             if self.rotation_strategy == "round_robin":
-                proxy = self._round_robin(alive_proxies)
+                idx = self._round_robin(alive_proxies)
             elif self.rotation_strategy == "random":
-                proxy = self._random_selection(alive_proxies)
+                idx = self._random_selection(alive_proxies)
             elif self.rotation_strategy == "weighted":
-                proxy = self._weighted_selection(alive_proxies)
+                idx = self._weighted_selection(alive_proxies, now)
             else:
-                proxy = alive_proxies[0]
+                idx = alive_proxies[0]
 
-            proxy["last_used"] = time.time()
+            self.last_used[idx] = now
             self.stats["total_requests"] += 1
 
             # Return proxy in requests-compatible format
-            return {
-                "http": proxy["url"],
-                "https": proxy["url"]
-            }
+            return self.mappings[idx]
 
-    def _round_robin(self, proxies: List[Dict]) -> Dict:
+    def _round_robin(self, proxies: List[int]) -> int:
         """Round-robin selection."""
-        proxy = proxies[self.current_index % len(proxies)]
+        idx = proxies[self.current_index % len(proxies)]
         self.current_index += 1
-        return proxy
+        return idx
 
-    def _random_selection(self, proxies: List[Dict]) -> Dict:
+    def _random_selection(self, proxies: List[int]) -> int:
         """Random selection."""
-        return random.choice(proxies)
+        return self._rng.choice(proxies)
 
-    def _weighted_selection(self, proxies: List[Dict]) -> Dict:
+    def _weighted_selection(self, proxies: List[int], now: Optional[float] = None) -> int:
         """
         Weighted selection based on success rate.
 
         Proxies with higher success rates are more likely to be selected.
+        The cumulative weights are cached and searched with bisect, so a
+        selection is O(log N) until the proxy stats change.
+
+        Args:
+            proxies: Indices of the alive proxies
+            now: Current time, read from the clock if omitted
+
+        Returns:
+            Index of the selected proxy
+        """
+        if now is None:
+            now = time.time()
+        if self._weights_dirty or now - self._weights_built_at > WEIGHT_REFRESH_INTERVAL:
+            if NUMPY_AVAILABLE and len(proxies) >= NUMPY_MIN_PROXIES:
+                self._cum_weights = self._cumulative_weights_np(proxies, now)
+            else:
+                self._cum_weights = list(accumulate(self._proxy_weights(proxies, now)))
+            self._weights_dirty = False
+            self._weights_built_at = now
+
+        cum_weights = self._cum_weights
+        return proxies[bisect.bisect(cum_weights, self._rng.random() * cum_weights[-1])]
+
+    def _proxy_weights(self, proxies: List[int], now: float) -> List[float]:
+        """
+        Compute the selection weights of proxies.
+
+        Args:
+            proxies: Indices of the proxies to weigh
+            now: Current time
+
+        Returns:
+            Weights in the order of proxies, each at least 0.1
         """
+        successes = self.successes
+        failures = self.failures
+        last_used = self.last_used
         weights = []
-        for proxy in proxies:
-            total = proxy["successes"] + proxy["failures"]
+        for idx in proxies:
+            ok = successes[idx]
+            total = ok + failures[idx]
             if total == 0:
                 weight = 1.0  # New proxy, give it a chance
             else:
-                weight = proxy["successes"] / total
+                weight = ok / total
 
             # Boost weight if not used recently
-            if proxy["last_used"]:
-                time_since_use = time.time() - proxy["last_used"]
-                weight *= (1 + min(time_since_use / 60, 1))  # Up to 2x boost
+            used = last_used[idx]
+            if used:
+                weight *= (1 + min((now - used) / 60, 1))  # Up to 2x boost
 
             weights.append(max(weight, 0.1))  # Minimum weight
 
-        return random.choices(proxies, weights=weights, k=1)[0]
+        return weights
+
+    def _cumulative_weights_np(self, proxies: List[int], now: float) -> List[float]:
+        """
+        Compute cumulative selection weights with NumPy.
+
+        Same weights as _proxy_weights, computed over zero-copy views of
+        the stat arrays. The views are dropped before returning, since the
+        arrays cannot grow while a view is exported.
+
+        Args:
+            proxies: Indices of the proxies to weigh
+            now: Current time
+
+        Returns:
+            Running totals of the weights in the order of proxies
+        """
+        sel = np.fromiter(proxies, dtype=np.intp, count=len(proxies))
+        successes = np.frombuffer(self.successes, dtype=np.intc)[sel].astype(np.float64)
+        total = successes + np.frombuffer(self.failures, dtype=np.intc)[sel]
+        last_used = np.frombuffer(self.last_used, dtype=np.float64)[sel]
+
+        # New proxies get weight 1.0, the rest their success rate
+        weights = np.where(total == 0, 1.0, successes / np.maximum(total, 1))
+        # Up to 2x boost for proxies not used recently
+        weights *= np.where(last_used > 0, 1 + np.minimum((now - last_used) / 60, 1), 1.0)
+        np.maximum(weights, 0.1, out=weights)
+
+        return np.cumsum(weights).tolist()
+
+    def record_result(self, proxy_url: str, success: bool) -> None:
+        """
+        Record the outcome of a proxy use without taking the lock.
+
+        The result is queued and applied with other pending results on the
+        next get_proxy or get_stats call, so concurrent workers share one
+        lock acquisition per batch instead of one per request.
+
+        Args:
+            proxy_url: URL of the proxy that was used
+            success: Whether the request through the proxy succeeded
+        """
+        # deque.append is atomic, so producers need no lock
+        self._pending_results.append((proxy_url, success))
+
+    def _apply_pending_results(self) -> None:
+        """Apply queued proxy results. The caller must hold the lock."""
+        pending = self._pending_results
+        while pending:
+            proxy_url, success = pending.popleft()
+            if success:
+                self._apply_success(proxy_url)
+            else:
+                self._apply_failure(proxy_url)
 
     def report_success(self, proxy_url: str) -> None:
         """
@@ -164,12 +304,16 @@ class ProxyManager:
             proxy_url: URL of the proxy that was successful
         """
         with self.lock:
-            for proxy in self.proxies:
-                if proxy["url"] == proxy_url:
-                    proxy["successes"] += 1
-                    proxy["failures"] = 0  # Reset failure count on success
-                    self.stats["successful_requests"] += 1
-                    break
+            self._apply_success(proxy_url)
+
+    def _apply_success(self, proxy_url: str) -> None:
+        """Update stats for a successful proxy use. The caller must hold the lock."""
+        idx = self._url_to_idx.get(proxy_url)
+        if idx is not None:
+            self.successes[idx] += 1
+            self.failures[idx] = 0  # Reset failure count on success
+            self.stats["successful_requests"] += 1
+            self._weights_dirty = True
 
     def report_failure(self, proxy_url: str) -> None:
         """
@@ -179,42 +323,95 @@ class ProxyManager:
             proxy_url: URL of the proxy that failed
         """
         with self.lock:
-            for proxy in self.proxies:
-                if proxy["url"] == proxy_url:
-                    proxy["failures"] += 1
-                    self.stats["failed_requests"] += 1
-
-                    # Mark as dead if too many failures
-                    if proxy["failures"] >= self.max_failures:
-                        proxy["is_alive"] = False
-                    break
-
-    def get_stats(self) -> Dict:
+            self._apply_failure(proxy_url)
+
+    def _apply_failure(self, proxy_url: str) -> None:
+        """Update stats for a failed proxy use. The caller must hold the lock."""
+        idx = self._url_to_idx.get(proxy_url)
+        if idx is not None:
+            self.failures[idx] += 1
+            self.stats["failed_requests"] += 1
+            self._weights_dirty = True
+
+            # Mark as dead if too many failures
+            if self.failures[idx] >= self.max_failures and self.alive[idx]:
+                self.alive[idx] = 0
+                self._alive.remove(idx)
+
+    def get_summary(self) -> Dict:
         """
-        Get proxy usage statistics.
+        Get aggregate proxy statistics.
+
+        Counts only, without per-proxy entries, so it is cheap to poll
+        regardless of pool size.
 
         Returns:
-            Dictionary with statistics
+            Dictionary with request and proxy counts
         """
         with self.lock:
-            alive_count = sum(1 for p in self.proxies if p["is_alive"])
+            if self._pending_results:
+                self._apply_pending_results()
+
+            alive_count = len(self._alive)
 
             return {
                 **self.stats,
-                "total_proxies": len(self.proxies),
+                "total_proxies": len(self.urls),
                 "alive_proxies": alive_count,
-                "dead_proxies": len(self.proxies) - alive_count,
-                "proxies": [
-                    {
-                        "url": p["url"],
-                        "successes": p["successes"],
-                        "failures": p["failures"],
-                        "is_alive": p["is_alive"],
-                        "last_used": p["last_used"]
-                    }
-                    for p in self.proxies
-                ]
+                "dead_proxies": len(self.urls) - alive_count
+            }
+
+    def get_proxy_details(self, offset: int = 0, limit: int = 100) -> Iterator[Dict]:
+        """
+        Iterate over per-proxy statistics for a page of the pool.
+
+        The page is copied under the lock; the dictionaries are built as
+        the iterator is consumed.
+
+        Args:
+            offset: Position of the first proxy to report
+            limit: Maximum number of proxies to report
+
+        Returns:
+            Iterator of per-proxy statistics dictionaries
+        """
+        with self.lock:
+            if self._pending_results:
+                self._apply_pending_results()
+
+            end = offset + limit
+            page = list(zip(
+                self.urls[offset:end],
+                self.successes[offset:end],
+                self.failures[offset:end],
+                self.alive[offset:end],
+                self.last_used[offset:end]
+            ))
+
+        return (
+            {
+                "url": url,
+                "successes": successes,
+                "failures": failures,
+                "is_alive": bool(alive),
+                "last_used": last_used or None
             }
+            for url, successes, failures, alive, last_used in page
+        )
+
+    def get_stats(self) -> Dict:
+        """
+        Get proxy usage statistics, including every proxy.
+
+        Builds one dictionary per proxy; use get_summary to poll counts and
+        get_proxy_details to page through large pools.
+
+        Returns:
+            Dictionary with statistics
+        """
+        stats = self.get_summary()
+        stats["proxies"] = list(self.get_proxy_details(0, stats["total_proxies"]))
+        return stats
 
     def reset_proxy(self, proxy_url: str) -> None:
         """
@@ -224,12 +421,14 @@ class ProxyManager:
             proxy_url: URL of the proxy to reset
         """
         with self.lock:
-            for proxy in self.proxies:
-                if proxy["url"] == proxy_url:
-                    proxy["failures"] = 0
-                    proxy["successes"] = 0
-                    proxy["is_alive"] = True
-                    break
+            idx = self._url_to_idx.get(proxy_url)
+            if idx is not None:
+                self.failures[idx] = 0
+                self.successes[idx] = 0
+                self._weights_dirty = True
+                if not self.alive[idx]:
+                    self.alive[idx] = 1
+                    self._alive.append(idx)
 
     def add_proxy(self, proxy_url: str) -> None:
         """
@@ -239,25 +438,31 @@ class ProxyManager:
             proxy_url: URL of the proxy to add
         """
         with self.lock:
-            # Check if proxy already exists
-            if any(p["url"] == proxy_url for p in self.proxies):
-                return
-
-            self.proxies.append({
-                "url": proxy_url,
-                "failures": 0,
-                "successes": 0,
-                "last_used": None,
-                "is_alive": True,
-                "response_time": None
-            })
+            self._load_proxies([proxy_url])
 
     def remove_proxy(self, proxy_url: str) -> None:
         """
         Remove a proxy from the pool.
 
+        Later proxies shift down one position, so their indices are
+        renumbered.
+
         Args:
             proxy_url: URL of the proxy to remove
         """
         with self.lock:
-            self.proxies = [p for p in self.proxies if p["url"] != proxy_url]
+            idx = self._url_to_idx.pop(proxy_url, None)
+            if idx is None:
+                return
+
+            del self.urls[idx]
+            del self.mappings[idx]
+            del self.successes[idx]
+            del self.failures[idx]
+            del self.last_used[idx]
+            del self.alive[idx]
+
+            for url in self.urls[idx:]:
+                self._url_to_idx[url] -= 1
+            self._alive = [i - (i > idx) for i in self._alive if i != idx]
+            self._weights_dirty = True
@@ -8,7 +8,6 @@ with configurable delays and politeness settings.
 import time
 import threading
 from typing import Optional
-from collections import deque
 
 
 class RateLimiter:
@@ -37,41 +36,75 @@ class RateLimiter:
         self.delay = delay_between_requests
         self.burst_size = burst_size or int(requests_per_second * 2)
 
-        # Token bucket implementation
+        # Token bucket implementation; tokens go negative while requests
+        # are reserved ahead of the refill
         self.tokens = self.burst_size
-        self.last_update = time.time()
-        self.lock = threading.Lock()
+        self.last_update = time.monotonic()
+        self.lock = threading.Condition()
+        # Bumped by reset() so callers waiting on a reservation are released
+        self._generation = 0
 
-        # Request history for statistics
-        self.request_times = deque(maxlen=1000)
+        # Monotonic time at which the latest token reservation may proceed
+        self.next_available = self.last_update
+
+        # Monotonic time at which the previous caller was released; each
+        # caller is released at least delay_between_requests after it
+        self._last_release = float("-inf")
+
+        # Request count and first/last request times for statistics
+        self._count = 0
+        self._first_t: Optional[float] = None
+        self._last_t = 0.0
 
     def acquire(self, tokens: int = 1) -> None:
         """
         Acquire tokens before making a request.
 
-        This method blocks until enough tokens are available.
+        This method blocks until enough tokens are available. Each caller
+        reserves its own slot under the lock, then waits on the condition,
+        which releases the lock, so concurrent callers do not queue behind
+        one sleeper. reset() wakes callers that are still waiting.
 
         Args:
             tokens: Number of tokens to acquire
         """
         with self.lock:
-            while self.tokens < tokens:
-                # Calculate time needed to accumulate tokens
-                tokens_needed = tokens - self.tokens
-                wait_time = tokens_needed / self.rate
-                time.sleep(wait_time)
-                self._add_tokens()
-
+            now = time.monotonic()
+            self._add_tokens(now)
             self.tokens -= tokens
-            self.request_times.append(time.time())
 
-            # Additional politeness delay
-            if self.delay > 0:
-                time.sleep(self.delay)
+            if self.tokens >= 0:
+                sleep_until = now
+            else:
+                # Reserve the slot at which the deficit will have refilled
+                self.next_available = max(self.next_available, now - self.tokens / self.rate)
+                sleep_until = self.next_available
+
+            # The politeness delay spaces callers out from each other, as it
+            # did when it was slept under the lock
+            release = max(sleep_until, self._last_release) + self.delay
+            self._last_release = release
+
+            self._count += 1
+            self._last_t = release
+            if self._first_t is None:
+                self._first_t = release
+
+            # Wait for the reserved slot
+            wait_time = release - time.monotonic()
+            if wait_time > 0:
+                generation = self._generation
+                self.lock.wait_for(lambda: self._generation != generation, timeout=wait_time)
+
+    def _add_tokens(self, now: Optional[float] = None) -> None:
+        """
+        Add tokens based on time elapsed since last update.
 
-    def _add_tokens(self) -> None:
-        """Add tokens based on time elapsed since last update."""
-        now = time.time()
+        Args:
+            now: Current monotonic time (read from the clock if omitted)
+        """
+        if now is None:
+            now = time.monotonic()
         elapsed = now - self.last_update
         new_tokens = elapsed * self.rate
 
@@ -86,20 +119,20 @@ class RateLimiter:
             Dictionary with request statistics
         """
         with self.lock:
-            if len(self.request_times) < 2:
+            if self._count < 2:
                 return {
-                    "total_requests": len(self.request_times),
+                    "total_requests": self._count,
                     "average_rate": 0.0,
-                    "current_tokens": self.tokens
+                    "current_tokens": max(self.tokens, 0)
                 }
 
-            time_span = self.request_times[-1] - self.request_times[0]
-            avg_rate = len(self.request_times) / time_span if time_span > 0 else 0
+            time_span = self._last_t - self._first_t
+            avg_rate = self._count / time_span if time_span > 0 else 0
 
             return {
-                "total_requests": len(self.request_times),
+                "total_requests": self._count,
                 "average_rate": avg_rate,
-                "current_tokens": self.tokens,
+                "current_tokens": max(self.tokens, 0),
                 "configured_rate": self.rate
             }
 
@@ -107,8 +140,14 @@ class RateLimiter:
         """Reset the rate limiter to initial state."""
         with self.lock:
             self.tokens = self.burst_size
-            self.last_update = time.time()
-            self.request_times.clear()
+            self.last_update = time.monotonic()
+            self.next_available = self.last_update
+            self._last_release = float("-inf")
+            self._count = 0
+            self._first_t = None
+            self._last_t = 0.0
+            self._generation += 1
+            self.lock.notify_all()
 
 
 class AdaptiveRateLimiter(RateLimiter):
@@ -4,11 +4,196 @@ Robots.txt compliance checker for web scraping.
 Checks and respects robots.txt directives to ensure ethical scraping.
 """
 
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
 import urllib.robotparser
-from urllib.parse import urlparse, urljoin
-from typing import Optional, Dict
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote, unquote, urlparse, urlunparse, urljoin
+from typing import Any, Optional, Dict, Iterable, List, Mapping, Sequence, Tuple
 import time
 import threading
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from web_scraper.utils.stats_view import StatsView
+
+try:
+    from protego import Protego
+    PROTEGO_AVAILABLE = True
+except ImportError:
+    PROTEGO_AVAILABLE = False
+
+# Timeout in seconds for robots.txt fetches
+ROBOTS_FETCH_TIMEOUT = 10.0
+
+# Bytes of robots.txt parsed per host; Google ignores content past 500 KiB
+MAX_ROBOTS_BYTES = 500 * 1024
+
+# Connection pool sizes of the shared robots.txt session: hosts kept pooled,
+# and keep-alive connections kept per host
+ROBOTS_POOL_CONNECTIONS = 64
+ROBOTS_POOL_MAXSIZE = 256
+
+# Maximum number of robots.txt files prefetch() downloads at once
+PREFETCH_CONCURRENCY = 64
+
+# Number of (user-agent, path) decisions remembered per cached host; the
+# oldest decision is dropped first
+DECISION_CACHE_SIZE = 4096
+
+# robots.txt parsing backends accepted by RobotsChecker
+PARSER_BACKENDS = ("stdlib", "protego")
+
+# Shared parser for hosts whose robots.txt allows everything (missing, empty
+# or without rules); checks against it skip parsing and the decision cache
+ALLOW_ALL = urllib.robotparser.RobotFileParser()
+ALLOW_ALL.allow_all = True
+
+# Cache lookup result for a missing or expired entry (None is a cached value:
+# a failed fetch, or a user-agent without rules)
+_MISS = object()
+
+# Statistics counters, in order of their slot in RobotsChecker._counts
+STAT_NAMES = ("total_checks", "allowed", "disallowed", "errors")
+_TOTAL, _ALLOWED, _DISALLOWED, _ERRORS = range(len(STAT_NAMES))
+
+
+def _request_path(url: str) -> str:
+    """
+    Normalize a URL to the quoted path RobotFileParser matches rules against.
+
+    Args:
+        url: URL to normalize
+
+    Returns:
+        Quoted path, params, query and fragment ("/" if empty)
+    """
+    parsed = urlparse(unquote(url))
+    path = quote(urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment)))
+    return path or "/"
+
+
+def _compile_rules(
+    parser: urllib.robotparser.RobotFileParser,
+    user_agent: str
+) -> Optional[Tuple[re.Pattern, Tuple[bool, ...]]]:
+    """
+    Compile the rules that apply to a user-agent into one anchored regex.
+
+    Each rule becomes a capture group in file order, so the first matching
+    alternative is the rule RobotFileParser would apply and match.lastindex
+    identifies its allowance.
+
+    Args:
+        parser: Parsed robots.txt
+        user_agent: User-agent to select the rule group for
+
+    Returns:
+        Tuple of (pattern, allowance per group), or None if no rule applies
+    """
+    entry = next((e for e in parser.entries if e.applies_to(user_agent)), parser.default_entry)
+    if entry is None or not entry.rulelines:
+        return None
+
+    alternatives = ["(.*)" if line.path == "*" else f"({re.escape(line.path)})" for line in entry.rulelines]
+    pattern = re.compile("(?:" + "|".join(alternatives) + ")", re.DOTALL)
+    return pattern, tuple(line.allowance for line in entry.rulelines)
+
+
+def _sweep_loop(checker_ref: "weakref.ref", stop: threading.Event, interval: float) -> None:
+    """
+    Background loop expiring a checker's cache entries every interval seconds.
+
+    Holds only a weak reference, so the thread ends once the checker is
+    garbage collected or closed.
+
+    Args:
+        checker_ref: Weak reference to the RobotsChecker
+        stop: Event set to stop the loop
+        interval: Seconds between sweeps
+    """
+    while not stop.wait(interval):
+        checker = checker_ref()
+        if checker is None:
+            return
+        checker._sweep_expired()
+        del checker
+
+
+class ProtegoParser:
+    """
+    Adapter exposing a Protego parser through the RobotFileParser interface.
+
+    Protego follows RFC 9309 (wildcards, longest-match precedence, grouped
+    User-agent lines) where urllib.robotparser does not.
+    """
+
+    def __init__(self, lines: List[str]):
+        """
+        Parse a robots.txt body.
+
+        Args:
+            lines: Lines of the robots.txt body
+        """
+        self._robots = Protego.parse("\n".join(lines))
+
+    def can_fetch(self, useragent: str, url: str) -> bool:
+        """
+        Check if a user-agent may fetch a URL.
+
+        Args:
+            useragent: User-agent to check for
+            url: URL to check
+
+        Returns:
+            True if URL can be fetched, False otherwise
+        """
+        return self._robots.can_fetch(url, useragent)
+
+    def crawl_delay(self, useragent: str) -> Optional[float]:
+        """
+        Get the crawl delay for a user-agent.
+
+        Args:
+            useragent: User-agent to check for
+
+        Returns:
+            Crawl delay in seconds or None if not specified
+        """
+        return self._robots.crawl_delay(useragent)
+
+    def request_rate(self, useragent: str) -> Optional[urllib.robotparser.RequestRate]:
+        """
+        Get the request rate for a user-agent.
+
+        Args:
+            useragent: User-agent to check for
+
+        Returns:
+            RequestRate of (requests, seconds) or None if not specified
+        """
+        rate = self._robots.request_rate(useragent)
+        if rate is None:
+            return None
+        return urllib.robotparser.RequestRate(rate.requests, rate.seconds)
+
+    def site_maps(self) -> Optional[List[str]]:
+        """
+        Get the sitemap URLs listed in the file.
+
+        Returns:
+            List of sitemap URLs or None if there are none
+        """
+        return list(self._robots.sitemaps) or None
 
 
 class RobotsChecker:
@@ -16,14 +201,22 @@ class RobotsChecker:
     Checks robots.txt compliance for URLs.
 
     Caches robots.txt parsers for efficiency and provides
-    methods to check if URLs can be scraped.
+    methods to check if URLs can be scraped. The cache is an LRU
+    bounded to max_entries hosts, with entries expiring after
+    cache_timeout seconds.
     """
 
     def __init__(
         self,
         user_agent: str = "*",
         respect_robots_txt: bool = True,
-        cache_timeout: int = 3600  # 1 hour
+        cache_timeout: int = 3600,  # 1 hour
+        failure_ttl: int = 60,
+        max_entries: int = 1024,
+        disk_cache_dir: Optional[str] = None,
+        disk_cache_ttl: int = 86400,  # 24 hours
+        parser_backend: str = "stdlib",
+        background_sweep: bool = False
     ):
         """
         Initialize robots.txt checker.
@@ -32,22 +225,105 @@ class RobotsChecker:
             user_agent: User-agent string for robots.txt checking
             respect_robots_txt: Whether to respect robots.txt
             cache_timeout: Cache timeout in seconds
+            failure_ttl: Seconds a failed robots.txt fetch is cached (and the
+                host allowed by default) before it is retried
+            max_entries: Maximum number of hosts kept in the parser cache
+            disk_cache_dir: Directory persisting fetched robots.txt files
+                across runs (optional)
+            disk_cache_ttl: Seconds a disk cache entry is used before it is
+                revalidated with the server
+            parser_backend: robots.txt parser, "stdlib" (urllib.robotparser)
+                or "protego"
+            background_sweep: Expire cache entries from a background thread
+                every cache_timeout / 4 seconds instead of on lookup; entries
+                may then outlive cache_timeout by up to one interval
+
+        Raises:
+            ValueError: If parser_backend is unknown
+            ImportError: If parser_backend is "protego" and protego is not installed
         """
+        if parser_backend not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown robots.txt parser backend: {parser_backend}")
+        if parser_backend == "protego" and not PROTEGO_AVAILABLE:
+            raise ImportError("protego is required for the protego backend. Install it with: pip install protego")
+
         self.user_agent = user_agent
         self.respect_robots_txt = respect_robots_txt
         self.cache_timeout = cache_timeout
+        self.failure_ttl = failure_ttl
+        self.max_entries = max_entries
+        self.disk_cache_dir = Path(disk_cache_dir) if disk_cache_dir else None
+        self.disk_cache_ttl = disk_cache_ttl
+        self.parser_backend = parser_backend
 
-        # Cache for robots.txt parsers
-        self.parsers: Dict[str, Dict] = {}
+        # LRU cache for robots.txt parsers, stored as parallel per-slot
+        # columns; _host_slots maps (scheme, host) to its slot, least recently
+        # used first, and evicted slots are reused. Guarded by self.lock
+        self._host_slots: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._slot_parsers: List[Optional[urllib.robotparser.RobotFileParser]] = []
+        self._slot_timestamps = array('d')
+        self._free_slots: List[int] = []
         self.lock = threading.Lock()
 
-        # Statistics
-        self.stats = {
-            "total_checks": 0,
-            "allowed": 0,
-            "disallowed": 0,
-            "errors": 0
-        }
+        # Optional background expiry; lookups skip the TTL check while it runs
+        self._stop_sweep = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+        if background_sweep:
+            self._sweeper = threading.Thread(
+                target=_sweep_loop,
+                args=(weakref.ref(self), self._stop_sweep, cache_timeout / 4),
+                name="robots-cache-sweeper",
+                daemon=True
+            )
+            self._sweeper.start()
+
+        # Shared session so robots.txt fetches reuse keep-alive connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=ROBOTS_POOL_CONNECTIONS, pool_maxsize=ROBOTS_POOL_MAXSIZE)
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        if user_agent != "*":
+            self._http.headers["User-Agent"] = user_agent
+
+        # One lock per host, so a slow robots.txt only blocks its own host
+        self._host_locks: Dict[Tuple[str, str], threading.Lock] = {}
+
+        # Async fetches in progress by host; concurrent misses await the same one
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+
+        # Per-parser caches of compiled rules (by user-agent) and can_fetch
+        # decisions (by user-agent and path). Weakly keyed, so they are
+        # dropped with the parser when its host is evicted, expired or
+        # refetched, and never serve stale answers
+        self._parser_rules: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._parser_decisions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+        # Statistics, one array slot per STAT_NAMES entry so an update is a
+        # single item increment rather than a dict lookup and store
+        self._counts = array('q', [0]) * len(STAT_NAMES)
+        self._stats_view = StatsView({
+            **{name: (lambda i=i: self._counts[i]) for i, name in enumerate(STAT_NAMES)},
+            "cached_domains": lambda: len(self._host_slots),
+            "respect_robots_txt": lambda: self.respect_robots_txt
+        })
+
+    @property
+    def respect_robots_txt(self) -> bool:
+        """
+        Whether robots.txt is respected.
+
+        While it is off, can_fetch is rebound to _allow_any so checks skip
+        parser lookup entirely.
+        """
+        return self._respect_robots_txt
+
+    @respect_robots_txt.setter
+    def respect_robots_txt(self, value: bool) -> None:
+        self._respect_robots_txt = value
+        if value:
+            self.__dict__.pop("can_fetch", None)
+        else:
+            self.can_fetch = self._allow_any
 
     def _get_robots_url(self, url: str) -> str:
         """
@@ -72,34 +348,478 @@ class RobotsChecker:
         Returns:
             RobotFileParser instance or None if failed
         """
-        robots_url = self._get_robots_url(url)
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
 
         with self.lock:
-            # Check cache
-            if robots_url in self.parsers:
-                cached = self.parsers[robots_url]
-                # Check if cache is still valid
-                if time.time() - cached["timestamp"] < self.cache_timeout:
-                    return cached["parser"]
-
-            # Create new parser
-            try:
-                parser = urllib.robotparser.RobotFileParser()
-                parser.set_url(robots_url)
-                parser.read()
+            cached = self._get_cached(key)
+            if cached is not _MISS:
+                return cached
+            host_lock = self._host_locks.setdefault(key, threading.Lock())
+
+        # The fetch runs under the host lock only, so other hosts proceed
+        with host_lock:
+            # Another thread may have fetched it while we waited
+            with self.lock:
+                cached = self._get_cached(key)
+            if cached is not _MISS:
+                return cached
 
-                # Cache parser
-                self.parsers[robots_url] = {
-                    "parser": parser,
-                    "timestamp": time.time()
-                }
+            robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+            entry = self._read_disk(robots_url)
+            if entry is not None and time.time() - entry[0] < self.disk_cache_ttl:
+                parser = self._build_parser(robots_url, entry[3], entry[4])
+            else:
+                try:
+                    fetched = self._fetch_robots(robots_url, self._conditional_headers(entry))
+                    parser = self._resolve_fetch(robots_url, entry, fetched)
 
-                return parser
+                except Exception:
+                    # If robots.txt can't be read, allow by default; the failure is
+                    # cached for failure_ttl so the host is not retried on every URL
+                    self._counts[_ERRORS] += 1
+                    parser = None
 
-            except Exception as e:
-                # If robots.txt doesn't exist or can't be read, allow by default
-                self.stats["errors"] += 1
-                return None
+            self._store(key, parser)
+            return parser
+
+    async def _aget_parser(
+        self,
+        url: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Get or create robots.txt parser for a URL without blocking the event loop.
+
+        Concurrent misses for the same host share a single fetch.
+
+        Args:
+            url: URL to get parser for
+            client: HTTP client to fetch with (optional, a new one is opened
+                per fetch otherwise)
+
+        Returns:
+            RobotFileParser instance or None if failed
+        """
+        parsed = urlparse(url)
+        key = (parsed.scheme, parsed.netloc)
+
+        with self.lock:
+            cached = self._get_cached(key)
+        if cached is not _MISS:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            parser = await self._aload_parser(f"{parsed.scheme}://{parsed.netloc}/robots.txt", client)
+            self._store(key, parser)
+            future.set_result(parser)
+            return parser
+        finally:
+            self._inflight.pop(key, None)
+            if not future.done():
+                # Cancelled mid-fetch: waiters allow by default, nothing is cached
+                future.set_result(None)
+
+    async def _aload_parser(
+        self,
+        robots_url: str,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Load a robots.txt parser from the disk cache or an async fetch.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            client: HTTP client to fetch with (optional)
+
+        Returns:
+            RobotFileParser instance or None if the fetch failed
+        """
+        entry = self._read_disk(robots_url)
+        if entry is not None and time.time() - entry[0] < self.disk_cache_ttl:
+            return self._build_parser(robots_url, entry[3], entry[4])
+
+        headers = self._conditional_headers(entry)
+        try:
+            if client is None:
+                async with self._new_async_client() as client:
+                    fetched = await self._afetch_robots(client, robots_url, headers)
+            else:
+                fetched = await self._afetch_robots(client, robots_url, headers)
+        except httpx.HTTPError:
+            # If robots.txt can't be read, allow by default
+            self._counts[_ERRORS] += 1
+            return None
+
+        return self._resolve_fetch(robots_url, entry, fetched)
+
+    @staticmethod
+    def _new_async_client() -> httpx.AsyncClient:
+        """
+        Create an HTTP client for async robots.txt fetches.
+
+        Returns:
+            httpx.AsyncClient following redirects with the fetch timeout
+        """
+        return httpx.AsyncClient(timeout=ROBOTS_FETCH_TIMEOUT, follow_redirects=True)
+
+    async def _afetch_robots(
+        self,
+        client: httpx.AsyncClient,
+        robots_url: str,
+        headers: Dict[str, str]
+    ) -> Tuple[int, List[str], Optional[str], Optional[str]]:
+        """
+        Fetch a robots.txt file asynchronously.
+
+        Args:
+            client: HTTP client to fetch with
+            robots_url: URL of the robots.txt file
+            headers: Extra request headers (conditional revalidation)
+
+        Returns:
+            Tuple of (status code, lines, ETag, Last-Modified)
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        async with client.stream("GET", robots_url, headers=headers) as response:
+            body = bytearray()
+            if response.status_code < 300:
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) > MAX_ROBOTS_BYTES:
+                        break
+
+        return (
+            response.status_code,
+            self._decode_lines(bytes(body)),
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified")
+        )
+
+    def _fetch_robots(self, robots_url: str, headers: Dict[str, str]) -> Tuple[int, List[str], Optional[str], Optional[str]]:
+        """
+        Fetch a robots.txt file.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            headers: Extra request headers (conditional revalidation)
+
+        Returns:
+            Tuple of (status code, lines, ETag, Last-Modified)
+
+        Raises:
+            requests.RequestException: If the request fails without an HTTP response
+        """
+        with self._http.get(robots_url, headers=headers, timeout=ROBOTS_FETCH_TIMEOUT, stream=True) as response:
+            if response.status_code >= 300:
+                return response.status_code, [], None, None
+
+            lines = self._decode_lines(response.raw.read(MAX_ROBOTS_BYTES + 1, decode_content=True))
+            return response.status_code, lines, response.headers.get("ETag"), response.headers.get("Last-Modified")
+
+    @staticmethod
+    def _decode_lines(body: bytes) -> List[str]:
+        """
+        Decode a robots.txt body into lines, keeping at most MAX_ROBOTS_BYTES.
+
+        When the body is longer, the line cut at the limit is dropped so a
+        truncated rule is never parsed.
+
+        Args:
+            body: Response body, read up to at least one byte past the limit
+
+        Returns:
+            Lines of the (truncated) body
+        """
+        if len(body) > MAX_ROBOTS_BYTES:
+            body = body[:MAX_ROBOTS_BYTES]
+            body = body[:body.rfind(b"\n") + 1]
+        return body.decode("utf-8", errors="replace").splitlines()
+
+    def _resolve_fetch(
+        self,
+        robots_url: str,
+        entry: Optional[Tuple],
+        fetched: Tuple[int, List[str], Optional[str], Optional[str]]
+    ) -> urllib.robotparser.RobotFileParser:
+        """
+        Build the parser for a fetch result and update the disk cache.
+
+        A 304 reuses the lines from the disk cache entry and refreshes its
+        timestamp. Server errors are not written to disk.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            entry: Disk cache entry the fetch revalidated, if any
+            fetched: Tuple of (status code, lines, ETag, Last-Modified)
+
+        Returns:
+            RobotFileParser instance
+        """
+        status, lines, etag, last_modified = fetched
+        if status == 304 and entry is not None:
+            _, etag, last_modified, status, lines = entry
+
+        if status < 500:
+            self._write_disk(robots_url, (time.time(), etag, last_modified, status, lines))
+
+        return self._build_parser(robots_url, status, lines)
+
+    def _build_parser(self, robots_url: str, status: int, lines: List[str]) -> urllib.robotparser.RobotFileParser:
+        """
+        Build a parser from a robots.txt response.
+
+        Status codes are handled like RobotFileParser.read: 401 and 403
+        disallow everything, other 4xx allow everything and server errors
+        leave the parser unread, which disallows everything. Successful
+        responses are parsed with the configured backend.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            status: HTTP status code
+            lines: Lines of the response body
+
+        Returns:
+            RobotFileParser instance, ProtegoParser for the protego backend,
+            or ALLOW_ALL if the file places no restrictions
+        """
+        if status < 400 and self.parser_backend == "protego":
+            return ProtegoParser(lines)
+
+        parser = urllib.robotparser.RobotFileParser(robots_url)
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif 400 <= status < 500:
+            return ALLOW_ALL
+        elif status < 400:
+            parser.parse(lines)
+            if not parser.entries and parser.default_entry is None and not parser.sitemaps:
+                return ALLOW_ALL
+        return parser
+
+    @staticmethod
+    def _conditional_headers(entry: Optional[Tuple]) -> Dict[str, str]:
+        """
+        Get revalidation headers for a disk cache entry.
+
+        Args:
+            entry: Disk cache entry, or None
+
+        Returns:
+            If-None-Match / If-Modified-Since headers, empty without an entry
+        """
+        headers = {}
+        if entry is not None:
+            if entry[1]:
+                headers["If-None-Match"] = entry[1]
+            if entry[2]:
+                headers["If-Modified-Since"] = entry[2]
+        return headers
+
+    def _disk_path(self, robots_url: str) -> Path:
+        """
+        Get the disk cache file for a robots.txt URL.
+
+        Args:
+            robots_url: URL of the robots.txt file
+
+        Returns:
+            Path of the JSON file
+        """
+        return self.disk_cache_dir / f"{hashlib.sha1(robots_url.encode()).hexdigest()}.json"
+
+    def _read_disk(self, robots_url: str) -> Optional[Tuple]:
+        """
+        Read a disk cache entry.
+
+        Args:
+            robots_url: URL of the robots.txt file
+
+        Returns:
+            Tuple of (fetched_at, ETag, Last-Modified, status, lines), or None
+            if disk caching is off or there is no valid entry
+        """
+        if self.disk_cache_dir is None:
+            return None
+
+        try:
+            with open(self._disk_path(robots_url), "r", encoding="utf-8") as f:
+                fetched_at, etag, last_modified, status, lines = json.load(f)
+        except Exception:
+            # Missing, unreadable, corrupt or foreign files count as no entry
+            return None
+
+        if not (
+            isinstance(fetched_at, (int, float))
+            and math.isfinite(fetched_at)
+            and isinstance(etag, (str, type(None)))
+            and isinstance(last_modified, (str, type(None)))
+            and isinstance(status, int)
+            and isinstance(lines, list)
+            and all(isinstance(line, str) for line in lines)
+        ):
+            return None
+
+        return fetched_at, etag, last_modified, status, lines
+
+    def _write_disk(self, robots_url: str, entry: Tuple) -> None:
+        """
+        Write a disk cache entry, replacing any previous one atomically.
+
+        Args:
+            robots_url: URL of the robots.txt file
+            entry: Tuple of (fetched_at, ETag, Last-Modified, status, lines)
+        """
+        if self.disk_cache_dir is None:
+            return
+
+        path = self._disk_path(robots_url)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            self.disk_cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _store(self, key: Tuple[str, str], parser: Optional[urllib.robotparser.RobotFileParser]) -> None:
+        """
+        Cache a parser, evicting the least recently used hosts over max_entries.
+
+        Args:
+            key: (scheme, host) cache key
+            parser: Parser to cache, or None for a failed fetch
+        """
+        with self.lock:
+            now = time.time()
+            slot = self._host_slots.get(key)
+            if slot is None:
+                if self._free_slots:
+                    slot = self._free_slots.pop()
+                    self._slot_parsers[slot] = parser
+                    self._slot_timestamps[slot] = now
+                else:
+                    slot = len(self._slot_parsers)
+                    self._slot_parsers.append(parser)
+                    self._slot_timestamps.append(now)
+                self._host_slots[key] = slot
+            else:
+                self._slot_parsers[slot] = parser
+                self._slot_timestamps[slot] = now
+                self._host_slots.move_to_end(key)
+
+            while len(self._host_slots) > self.max_entries:
+                evicted, slot = self._host_slots.popitem(last=False)
+                self._free_slot(slot)
+                self._host_locks.pop(evicted, None)
+
+    def _free_slot(self, slot: int) -> None:
+        """
+        Release a cache slot for reuse.
+
+        The caller must hold self.lock.
+
+        Args:
+            slot: Slot index to release
+        """
+        self._slot_parsers[slot] = None
+        self._free_slots.append(slot)
+
+    def _get_cached(self, key: Tuple[str, str]) -> Optional[urllib.robotparser.RobotFileParser]:
+        """
+        Look up an unexpired cached parser and mark it recently used.
+
+        The caller must hold self.lock.
+
+        Args:
+            key: (scheme, host) cache key
+
+        Returns:
+            Cached parser (None for a failed fetch), or _MISS if missing or expired
+        """
+        slot = self._host_slots.get(key)
+        if slot is None:
+            return _MISS
+
+        # Failures expire after failure_ttl, checked here even while the
+        # sweeper runs since it only wakes every cache_timeout / 4 seconds
+        parser = self._slot_parsers[slot]
+        if parser is None:
+            expired = time.time() - self._slot_timestamps[slot] >= self.failure_ttl
+        else:
+            expired = self._sweeper is None and time.time() - self._slot_timestamps[slot] >= self.cache_timeout
+
+        if expired:
+            del self._host_slots[key]
+            self._free_slot(slot)
+            return _MISS
+
+        self._host_slots.move_to_end(key)
+        return parser
+
+    def _sweep_expired(self) -> None:
+        """Drop every cache entry older than cache_timeout (failure_ttl for failures)."""
+        with self.lock:
+            now = time.time()
+            expired = [
+                (key, slot) for key, slot in self._host_slots.items()
+                if now - self._slot_timestamps[slot] >= (
+                    self.failure_ttl if self._slot_parsers[slot] is None else self.cache_timeout
+                )
+            ]
+            for key, slot in expired:
+                del self._host_slots[key]
+                self._free_slot(slot)
+
+    def prefetch(self, urls: Iterable[str]) -> None:
+        """
+        Fetch robots.txt for all hosts of the given URLs concurrently.
+
+        Warms the cache before crawling so later can_fetch calls do not block
+        on one fetch per newly seen host. Use aprefetch inside an event loop.
+
+        Args:
+            urls: URLs whose hosts should be fetched
+        """
+        if self.respect_robots_txt:
+            asyncio.run(self.aprefetch(urls))
+
+    async def aprefetch(self, urls: Iterable[str]) -> None:
+        """
+        Fetch robots.txt for all hosts of the given URLs concurrently.
+
+        At most PREFETCH_CONCURRENCY fetches run at once over a shared client;
+        hosts that are already cached are skipped.
+
+        Args:
+            urls: URLs whose hosts should be fetched
+        """
+        if not self.respect_robots_txt:
+            return
+
+        # One representative URL per host
+        hosts = {}
+        for url in urls:
+            parsed = urlparse(url)
+            hosts.setdefault((parsed.scheme, parsed.netloc), url)
+
+        semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+
+        async with self._new_async_client() as client:
+            async def fetch(url: str) -> None:
+                async with semaphore:
+                    await self._aget_parser(url, client)
+
+            await asyncio.gather(*(fetch(url) for url in hosts.values()))
 
     def can_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
         """
@@ -112,38 +832,194 @@ class RobotsChecker:
         Returns:
             True if URL can be fetched, False otherwise
         """
-        self.stats["total_checks"] += 1
+        self._counts[_TOTAL] += 1
+
+        try:
+            return self._check_parser(self._get_parser(url), url, user_agent)
+
+        except Exception:
+            # On error, allow by default
+            self._counts[_ERRORS] += 1
+            self._counts[_ALLOWED] += 1
+            return True
+
+    def can_fetch_many(self, urls: Sequence[str], user_agent: Optional[str] = None) -> List[bool]:
+        """
+        Check many URLs according to robots.txt.
+
+        URLs are grouped by host: missing robots.txt files are prefetched
+        concurrently, then each host's parser is looked up once and all of
+        its URLs are checked against it. Not for use inside a running event
+        loop (see prefetch).
+
+        Args:
+            urls: URLs to check
+            user_agent: User-agent to check for (optional)
+
+        Returns:
+            One flag per URL, True if it can be fetched
+        """
+        self._counts[_TOTAL] += len(urls)
+
+        if not self.respect_robots_txt:
+            self._counts[_ALLOWED] += len(urls)
+            return [True] * len(urls)
+
+        by_host: Dict[Tuple[str, str], List[int]] = {}
+        for i, url in enumerate(urls):
+            parsed = urlparse(url)
+            by_host.setdefault((parsed.scheme, parsed.netloc), []).append(i)
+
+        self.prefetch([urls[indices[0]] for indices in by_host.values()])
+
+        results = [True] * len(urls)
+        for indices in by_host.values():
+            try:
+                parser = self._get_parser(urls[indices[0]])
+            except Exception:
+                self._counts[_ERRORS] += 1
+                parser = None
+
+            for i in indices:
+                try:
+                    results[i] = self._check_parser(parser, urls[i], user_agent)
+                except Exception:
+                    # On error, allow by default
+                    self._counts[_ERRORS] += 1
+                    self._counts[_ALLOWED] += 1
+
+        return results
+
+    def _allow_any(self, url: str, user_agent: Optional[str] = None) -> bool:
+        """
+        can_fetch used while robots.txt is not respected: count and allow.
+
+        Args:
+            url: URL to check
+            user_agent: User-agent to check for (optional)
+
+        Returns:
+            Always True
+        """
+        self._counts[_TOTAL] += 1
+        self._counts[_ALLOWED] += 1
+        return True
+
+    async def acan_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
+        """
+        Check if URL can be fetched according to robots.txt, fetching it asynchronously.
+
+        Args:
+            url: URL to check
+            user_agent: User-agent to check for (optional)
+
+        Returns:
+            True if URL can be fetched, False otherwise
+        """
+        self._counts[_TOTAL] += 1
 
         # If not respecting robots.txt, allow everything
         if not self.respect_robots_txt:
-            self.stats["allowed"] += 1
+            self._counts[_ALLOWED] += 1
             return True
 
         try:
-            parser = self._get_parser(url)
+            return self._check_parser(await self._aget_parser(url), url, user_agent)
 
-            # If no parser (robots.txt doesn't exist or failed), allow by default
-            if parser is None:
-                self.stats["allowed"] += 1
-                return True
+        except Exception:
+            # On error, allow by default
+            self._counts[_ERRORS] += 1
+            self._counts[_ALLOWED] += 1
+            return True
 
-            # Check if fetch is allowed
-            ua = user_agent or self.user_agent
-            allowed = parser.can_fetch(ua, url)
+    def _check_parser(
+        self,
+        parser: Optional[urllib.robotparser.RobotFileParser],
+        url: str,
+        user_agent: Optional[str]
+    ) -> bool:
+        """
+        Check a URL against a cached parser and count the outcome.
 
-            if allowed:
-                self.stats["allowed"] += 1
-            else:
-                self.stats["disallowed"] += 1
+        Args:
+            parser: Parser for the URL's host, or None if unavailable
+            url: URL to check
+            user_agent: User-agent to check for (optional)
+
+        Returns:
+            True if URL can be fetched, False otherwise
+        """
+        # If no parser (robots.txt doesn't exist or failed) or no rules, allow
+        if parser is None or parser is ALLOW_ALL:
+            self._counts[_ALLOWED] += 1
+            return True
 
-            return allowed
+        # Check if fetch is allowed
+        ua = user_agent or self.user_agent
+        decisions = self._parser_decisions.get(parser)
+        if decisions is None:
+            decisions = self._parser_decisions.setdefault(parser, {})
 
-        except Exception:
-            # On error, allow by default
-            self.stats["errors"] += 1
-            self.stats["allowed"] += 1
+        path = _request_path(url)
+        allowed = decisions.get((ua, path))
+        if allowed is None:
+            allowed = self._parser_can_fetch(parser, ua, url, path)
+            if len(decisions) >= DECISION_CACHE_SIZE:
+                decisions.pop(next(iter(decisions), None), None)
+            decisions[(ua, path)] = allowed
+
+        if allowed:
+            self._counts[_ALLOWED] += 1
+        else:
+            self._counts[_DISALLOWED] += 1
+
+        return allowed
+
+    def _parser_can_fetch(
+        self,
+        parser: urllib.robotparser.RobotFileParser,
+        user_agent: str,
+        url: str,
+        path: str
+    ) -> bool:
+        """
+        Check a URL against a parser.
+
+        Parsed stdlib files are matched with one compiled regex per
+        user-agent instead of RobotFileParser's loop over rule lines; the
+        result is the same.
+
+        Args:
+            parser: Parser for the URL's host
+            user_agent: User-agent to check for
+            url: URL to check
+            path: Normalized request path of url (see _request_path)
+
+        Returns:
+            True if URL can be fetched, False otherwise
+        """
+        if (
+            type(parser) is not urllib.robotparser.RobotFileParser
+            or parser.allow_all
+            or parser.disallow_all
+            or not parser.last_checked
+        ):
+            return parser.can_fetch(user_agent, url)
+
+        rules_by_ua = self._parser_rules.get(parser)
+        if rules_by_ua is None:
+            rules_by_ua = self._parser_rules.setdefault(parser, {})
+
+        rules = rules_by_ua.get(user_agent, _MISS)
+        if rules is _MISS:
+            rules = rules_by_ua[user_agent] = _compile_rules(parser, user_agent)
+        if rules is None:
             return True
 
+        pattern, allowances = rules
+        match = pattern.match(path)
+        return allowances[match.lastindex - 1] if match else True
+
     def get_crawl_delay(self, url: str, user_agent: Optional[str] = None) -> Optional[float]:
         """
         Get crawl delay from robots.txt.
@@ -243,26 +1119,37 @@ class RobotsChecker:
     def clear_cache(self) -> None:
         """Clear the robots.txt cache."""
         with self.lock:
-            self.parsers.clear()
+            self._host_slots.clear()
+            self._slot_parsers.clear()
+            del self._slot_timestamps[:]
+            self._free_slots.clear()
+            self._host_locks.clear()
+        self._parser_decisions.clear()
+        self._parser_rules.clear()
+
+    def close(self) -> None:
+        """Stop the background sweeper and close pooled robots.txt connections."""
+        self._stop_sweep.set()
+        self._http.close()
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> Mapping[str, Any]:
         """
         Get checker statistics.
 
+        Returns:
+            Read-only live view of the statistics (see snapshot_stats for a copy)
+        """
+        return self._stats_view
+
+    def snapshot_stats(self) -> dict:
+        """
+        Get a copy of the checker statistics.
+
         Returns:
             Dictionary with statistics
         """
-        return {
-            **self.stats,
-            "cached_domains": len(self.parsers),
-            "respect_robots_txt": self.respect_robots_txt
-        }
+        return dict(self._stats_view)
 
     def reset_stats(self) -> None:
         """Reset statistics."""
-        self.stats = {
-            "total_checks": 0,
-            "allowed": 0,
-            "disallowed": 0,
-            "errors": 0
-        }
+        self._counts = array('q', [0]) * len(STAT_NAMES)
@@ -0,0 +1,64 @@
+"""
+Compiled CSS selector, XPath and regex cache.
+
+Compiles CSS selectors once with Soup Sieve, XPath expressions once
+with lxml and regex patterns once with re, and reuses the compiled
+matchers across calls, so repeated extraction with the same selector
+skips selector parsing.
+"""
+
+import re
+from functools import lru_cache
+from typing import Union
+
+import soupsieve
+from lxml import etree
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """
+    Get a compiled CSS selector.
+
+    Args:
+        selector: CSS selector string
+
+    Returns:
+        Compiled SoupSieve matcher with select/select_one/match methods
+    """
+    return soupsieve.compile(selector)
+
+
+@lru_cache(maxsize=256)
+def compile_xpath(expression: str) -> etree.XPath:
+    """
+    Get a compiled XPath expression.
+
+    Args:
+        expression: XPath expression string
+
+    Returns:
+        Compiled XPath, called with an element or tree to evaluate it
+
+    Raises:
+        etree.XPathSyntaxError: If the expression is invalid
+    """
+    return etree.XPath(expression)
+
+
+@lru_cache(maxsize=512)
+def compile_pattern(pattern: Union[str, bytes], flags: int = 0) -> re.Pattern:
+    """
+    Get a compiled regex pattern.
+
+    Args:
+        pattern: Regex pattern, as text or bytes
+        flags: re flags to compile with
+
+    Returns:
+        Compiled pattern
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern, flags)
@@ -0,0 +1,41 @@
+"""
+Read-only live statistics views.
+
+Lets components hand out their statistics without copying them on
+every call; each value is read from the component when it is looked up.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterator
+
+
+class StatsView(Mapping):
+    """
+    Read-only mapping whose values are computed on lookup.
+
+    Holds one getter per statistic, so reading a single counter never
+    builds the others and the view always reflects current values.
+    """
+
+    __slots__ = ("_getters",)
+
+    def __init__(self, getters: Dict[str, Callable[[], Any]]):
+        """
+        Initialize the view.
+
+        Args:
+            getters: Zero-argument callables returning each statistic, by name
+        """
+        self._getters = getters
+
+    def __getitem__(self, key: str) -> Any:
+        return self._getters[key]()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._getters)
+
+    def __len__(self) -> int:
+        return len(self._getters)
+
+    def __repr__(self) -> str:
+        return f"StatsView({dict(self)!r})"
@@ -5,8 +5,24 @@ Provides realistic user-agent strings and rotation to avoid detection.
 """
 
 import random
-from typing import List, Optional
-from fake_useragent import UserAgent
+import sys
+from array import array
+from typing import Any, Dict, List, Mapping, Optional
+
+from web_scraper.utils.stats_view import StatsView
+
+
+# Mobile user-agents by platform
+_IOS_AGENTS = tuple(sys.intern(ua) for ua in (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
+))
+_ANDROID_AGENTS = tuple(sys.intern(ua) for ua in (
+    "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
+    "Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
+))
+_MOBILE_AGENTS = {"ios": _IOS_AGENTS, "android": _ANDROID_AGENTS}
+_MOBILE_ALL = _IOS_AGENTS + _ANDROID_AGENTS
 
 
 class UserAgentRotator:
@@ -31,17 +47,11 @@ class UserAgentRotator:
             fallback_user_agent: Fallback user-agent if others fail
             use_fake_ua: Whether to use fake-useragent library
         """
-        self.custom_user_agents = custom_user_agents or []
+        self.custom_user_agents = list(custom_user_agents or [])
         self.use_fake_ua = use_fake_ua
 
-        # Initialize fake-useragent
-        self.ua = None
-        if use_fake_ua:
-            try:
-                self.ua = UserAgent()
-            except Exception:
-                # Fallback if fake-useragent fails
-                self.use_fake_ua = False
+        # fake-useragent is imported and loaded on first use (see the ua property)
+        self._ua = None
 
         # Default fallback user-agent (Chrome on Windows)
         self.fallback_user_agent = fallback_user_agent or (
@@ -50,8 +60,9 @@ class UserAgentRotator:
             "Chrome/120.0.0.0 Safari/537.36"
         )
 
-        # Common realistic user-agents as backup
-        self.default_user_agents = [
+        # Common realistic user-agents as backup, interned so stats keys
+        # compare by identity and keep their cached hash
+        self.default_user_agents = tuple(sys.intern(ua) for ua in (
             # Chrome on Windows
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             # Chrome on Mac
@@ -66,13 +77,51 @@ class UserAgentRotator:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0",
             # Chrome on Linux
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        ]
+        ))
+
+        # Default user-agents by browser, filtered once
+        self._by_browser = {
+            "chrome": tuple(ua for ua in self.default_user_agents if "Chrome" in ua and "Edg" not in ua),
+            "firefox": tuple(ua for ua in self.default_user_agents if "Firefox" in ua),
+            "safari": tuple(ua for ua in self.default_user_agents if "Safari" in ua and "Chrome" not in ua),
+            "edge": tuple(ua for ua in self.default_user_agents if "Edg" in ua)
+        }
 
-        # Usage statistics
+        # Usage statistics; list user-agents are counted by index, so the
+        # per-user-agent dict is only built in get_stats
         self.stats = {
-            "total_requests": 0,
-            "user_agents_used": {}
+            "total_requests": 0
         }
+        self._custom_counts = array('Q', [0]) * len(self.custom_user_agents)
+        self._default_counts = array('Q', [0]) * len(self.default_user_agents)
+        self._fake_counts: Dict[str, int] = {}
+        self._stats_view = StatsView({
+            "total_requests": lambda: self.stats["total_requests"],
+            "user_agents_used": self._user_agents_used,
+            "total_custom_user_agents": lambda: len(self.custom_user_agents),
+            "using_fake_ua": lambda: self.use_fake_ua
+        })
+
+    @property
+    def ua(self):
+        """
+        fake-useragent instance, created on first access.
+
+        Importing fake-useragent and loading its data is deferred so
+        rotators that never need it do not pay for it. If loading fails,
+        fake-useragent is disabled for this rotator.
+
+        Returns:
+            UserAgent instance, or None if fake-useragent is disabled
+        """
+        if self._ua is None and self.use_fake_ua:
+            try:
+                from fake_useragent import UserAgent
+                self._ua = UserAgent()
+            except Exception:
+                # Fallback if fake-useragent fails
+                self.use_fake_ua = False
+        return self._ua
 
     def get_random_user_agent(self) -> str:
         """
@@ -84,16 +133,20 @@ class UserAgentRotator:
         # Priority: custom > fake-useragent > defaults > fallback
         try:
             if self.custom_user_agents:
-                ua = random.choice(self.custom_user_agents)
+                i = random.randrange(len(self.custom_user_agents))
+                ua = self.custom_user_agents[i]
+                self._custom_counts[i] += 1
             elif self.use_fake_ua and self.ua:
                 # Get random user-agent from fake-useragent
                 ua = self.ua.random
+                self._fake_counts[ua] = self._fake_counts.get(ua, 0) + 1
             else:
-                ua = random.choice(self.default_user_agents)
+                i = random.randrange(len(self.default_user_agents))
+                ua = self.default_user_agents[i]
+                self._default_counts[i] += 1
 
             # Update statistics
             self.stats["total_requests"] += 1
-            self.stats["user_agents_used"][ua] = self.stats["user_agents_used"].get(ua, 0) + 1
 
             return ua
 
@@ -106,8 +159,7 @@ class UserAgentRotator:
             if self.use_fake_ua and self.ua:
                 return self.ua.chrome
             else:
-                chrome_uas = [ua for ua in self.default_user_agents if "Chrome" in ua and "Edg" not in ua]
-                return random.choice(chrome_uas)
+                return random.choice(self._by_browser["chrome"])
         except Exception:
             return self.fallback_user_agent
 
@@ -117,8 +169,7 @@ class UserAgentRotator:
             if self.use_fake_ua and self.ua:
                 return self.ua.firefox
             else:
-                firefox_uas = [ua for ua in self.default_user_agents if "Firefox" in ua]
-                return random.choice(firefox_uas)
+                return random.choice(self._by_browser["firefox"])
         except Exception:
             return self.fallback_user_agent
 
@@ -128,7 +179,7 @@ class UserAgentRotator:
             if self.use_fake_ua and self.ua:
                 return self.ua.safari
             else:
-                safari_uas = [ua for ua in self.default_user_agents if "Safari" in ua and "Chrome" not in ua]
+                safari_uas = self._by_browser["safari"]
                 return random.choice(safari_uas) if safari_uas else self.fallback_user_agent
         except Exception:
             return self.fallback_user_agent
@@ -136,7 +187,7 @@ class UserAgentRotator:
     def get_edge(self) -> str:
         """Get Edge user-agent."""
         try:
-            edge_uas = [ua for ua in self.default_user_agents if "Edg" in ua]
+            edge_uas = self._by_browser["edge"]
             return random.choice(edge_uas) if edge_uas else self.fallback_user_agent
         except Exception:
             return self.fallback_user_agent
@@ -151,22 +202,10 @@ class UserAgentRotator:
         Returns:
             Mobile user-agent string
         """
-        ios_agents = [
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (iPad; CPU OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1",
-        ]
-
-        android_agents = [
-            "Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
-            "Mozilla/5.0 (Linux; Android 14; SM-S918B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.6099.43 Mobile Safari/537.36",
-        ]
-
-        if platform == "ios":
-            return random.choice(ios_agents)
-        elif platform == "android":
-            return random.choice(android_agents)
+        if platform in ("ios", "android"):
+            return random.choice(_MOBILE_AGENTS[platform])
         else:
-            return random.choice(ios_agents + android_agents)
+            return random.choice(_MOBILE_ALL)
 
     def add_custom_user_agent(self, user_agent: str) -> None:
         """
@@ -177,23 +216,50 @@ class UserAgentRotator:
         """
         if user_agent not in self.custom_user_agents:
             self.custom_user_agents.append(user_agent)
+            self._custom_counts.append(0)
+
+    def _user_agents_used(self) -> Dict[str, int]:
+        """
+        Build the per-user-agent usage counts.
+
+        Returns:
+            Dictionary mapping each used user-agent to its count
+        """
+        user_agents_used = dict(self._fake_counts)
+        for pool, counts in (
+            (self.custom_user_agents, self._custom_counts),
+            (self.default_user_agents, self._default_counts)
+        ):
+            for ua, count in zip(pool, counts):
+                if count:
+                    user_agents_used[ua] = user_agents_used.get(ua, 0) + count
+        return user_agents_used
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> Mapping[str, Any]:
         """
         Get usage statistics.
 
+        The user_agents_used counts are only built when that key is read.
+
+        Returns:
+            Read-only live view of the statistics (see snapshot_stats for a copy)
+        """
+        return self._stats_view
+
+    def snapshot_stats(self) -> dict:
+        """
+        Get a copy of the usage statistics.
+
         Returns:
             Dictionary with statistics
         """
-        return {
-            **self.stats,
-            "total_custom_user_agents": len(self.custom_user_agents),
-            "using_fake_ua": self.use_fake_ua
-        }
+        return dict(self._stats_view)
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
         self.stats = {
-            "total_requests": 0,
-            "user_agents_used": {}
+            "total_requests": 0
         }
+        self._custom_counts = array('Q', [0]) * len(self.custom_user_agents)
+        self._default_counts = array('Q', [0]) * len(self.default_user_agents)
+        self._fake_counts = {}